@@ -0,0 +1,109 @@
+import threading
+import time
+from array import array
+
+class AlmacenCuentas:
+    """
+    Almacén compacto de cuentas con locks por franjas (lock striping)
+
+    - Los saldos viven en un array('q') de enteros de 64 bits (8 bytes por cuenta)
+      en lugar de un objeto Cuenta con su propio threading.Lock por cuenta
+    - Un número configurable de locks (franjas) protege todas las cuentas;
+      la cuenta i pertenece a la franja i % num_franjas
+
+    PREVENCIÓN DE DEADLOCK: Ordenamiento de recursos aplicado a las franjas
+    - Los recursos que se bloquean son las franjas, no las cuentas
+    - Siempre se adquieren en orden ascendente por índice de franja
+    - Si origen y destino comparten franja se adquiere un único lock
+      (threading.Lock no es reentrante, adquirirlo dos veces bloquearía el thread)
+    """
+    def __init__(self, saldos_iniciales, num_franjas=64):
+        self.saldos = array('q', saldos_iniciales)
+        self.num_franjas = num_franjas
+        self.locks = [threading.Lock() for _ in range(num_franjas)]
+
+    @classmethod
+    def con_saldos_especificacion(cls, num_cuentas, num_franjas=64):
+        """Crea el almacén con los saldos de la especificación: Cuenta[i] = 1000 * (i+1)"""
+        return cls(range(1000, 1000*(num_cuentas+1), 1000), num_franjas)
+
+    def __len__(self):
+        return len(self.saldos)
+
+    def franja(self, cuenta_id):
+        """Índice de la franja (lock) que protege a la cuenta"""
+        return cuenta_id % self.num_franjas
+
+    def franjas_ordenadas(self, cuentas_ids):
+        """Franjas distintas que cubren las cuentas dadas, en orden de adquisición"""
+        return sorted({cuenta_id % self.num_franjas for cuenta_id in cuentas_ids})
+
+    def saldo(self, cuenta_id):
+        with self.locks[self.franja(cuenta_id)]:
+            return self.saldos[cuenta_id]
+
+    def transferir(self, origen, destino, monto):
+        """Transfiere monto de origen a destino si hay saldo suficiente; retorna True si tuvo éxito"""
+        franja_origen = self.franja(origen)
+        franja_destino = self.franja(destino)
+
+        # Misma franja: un solo lock cubre ambas cuentas
+        if franja_origen == franja_destino:
+            with self.locks[franja_origen]:
+                return self._aplicar(origen, destino, monto)
+
+        # Franjas distintas: orden ascendente por índice de franja
+        primera, segunda = sorted((franja_origen, franja_destino))
+        with self.locks[primera]:
+            with self.locks[segunda]:
+                return self._aplicar(origen, destino, monto)
+
+    def transferir_lote(self, transferencias):
+        """
+        Aplica un lote de transferencias adquiriendo una sola vez las franjas necesarias
+        en orden ascendente. Mismo formato de resultado que transferir_lote_sin_deadlock.
+        """
+        franjas = self.franjas_ordenadas(c for origen, destino, _ in transferencias for c in (origen, destino))
+        tiempo_inicio = time.perf_counter()
+
+        adquiridas = []
+        try:
+            for f in franjas:
+                self.locks[f].acquire()
+                adquiridas.append(f)
+            resultados = [(origen, destino, monto, self._aplicar(origen, destino, monto))
+                          for origen, destino, monto in transferencias]
+        finally:
+            for f in reversed(adquiridas):
+                self.locks[f].release()
+
+        tiempo_total = time.perf_counter() - tiempo_inicio
+        exitosas = sum(1 for r in resultados if r[3])
+        return {
+            'transferencias': len(transferencias),
+            'exitosas': exitosas,
+            'fallidas': len(transferencias) - exitosas,
+            'resultados': resultados,
+            'locks_adquiridos': len(franjas),
+            'tiempo': tiempo_total,
+            'transferencias_por_segundo': len(transferencias) / tiempo_total if tiempo_total > 0 else float('inf')
+        }
+
+    def saldo_total(self):
+        """Suma consistente de todos los saldos: adquiere todas las franjas en orden ascendente"""
+        for lock in self.locks:
+            lock.acquire()
+        try:
+            return sum(self.saldos)
+        finally:
+            for lock in reversed(self.locks):
+                lock.release()
+
+    def _aplicar(self, origen, destino, monto):
+        """Sección crítica: requiere que las franjas de origen y destino estén adquiridas"""
+        saldos = self.saldos
+        if saldos[origen] >= monto:
+            saldos[origen] -= monto
+            saldos[destino] += monto
+            return True
+        return False
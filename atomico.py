@@ -0,0 +1,98 @@
+import threading
+import contextlib
+
+# Franjas de locks compartidas por todos los enteros atómicos: cada entero usa la
+# franja que le toca por su id, así no hace falta un Lock por entero
+NUM_FRANJAS = 64
+_FRANJAS = [threading.Lock() for _ in range(NUM_FRANJAS)]
+
+class EnteroAtomico:
+    """
+    Entero con operaciones atómicas: get, set, compare_and_swap y fetch_add
+
+    CPython no expone instrucciones CAS, así que cada operación toma por un instante
+    el lock de su franja (lock striping): el lock cubre solo la comparación y la
+    escritura, nunca el trabajo del llamador. Quien necesita una actualización
+    condicional (por ejemplo, vender solo si hay stock) lee el valor sin lock,
+    calcula y confirma con compare_and_swap, reintentando si otro thread escribió antes.
+    """
+    __slots__ = ('valor', 'lock')
+
+    def __init__(self, valor=0):
+        self.valor = valor
+        self.lock = _FRANJAS[(id(self) >> 4) % NUM_FRANJAS]  # id() es múltiplo de 16
+
+    def get(self):
+        # Leer una referencia es atómico en CPython
+        return self.valor
+
+    def set(self, valor):
+        with self.lock:
+            self.valor = valor
+
+    def compare_and_swap(self, esperado, nuevo):
+        """Escribe nuevo solo si el valor actual es esperado; retorna si lo escribió"""
+        with self.lock:
+            if self.valor != esperado:
+                return False
+            self.valor = nuevo
+            return True
+
+    def fetch_add(self, delta=1):
+        """Suma delta y retorna el valor anterior"""
+        with self.lock:
+            anterior = self.valor
+            self.valor = anterior + delta
+            return anterior
+
+    def __repr__(self):
+        return f"EnteroAtomico({self.valor})"
+
+@contextlib.contextmanager
+def bloquear_varios(enteros):
+    """
+    Toma a la vez los locks de franja de varios EnteroAtomico
+
+    Sirve para actualizar varios enteros juntos (todo o nada): dentro del bloque se
+    leen y escriben sus .valor directamente, y ninguna otra operación atómica sobre
+    ellos puede intercalarse. Las franjas se toman en orden ascendente y cada una una
+    sola vez (varios enteros pueden compartir franja), así que dos llamadas con
+    conjuntos solapados no pueden bloquearse mutuamente.
+    """
+    franjas = sorted({id(entero.lock): entero.lock for entero in enteros}.items())
+    adquiridos = []
+    try:
+        for _, lock in franjas:
+            lock.acquire()
+            adquiridos.append(lock)
+        yield
+    finally:
+        for lock in reversed(adquiridos):
+            lock.release()
+
+class ContadorFragmentado:
+    """
+    Contador con una celda por thread, sumadas solo al leer
+
+    Cada thread incrementa su propia celda (una lista de un elemento guardada en
+    threading.local), así que incrementar() no comparte ningún lock ni dato con otros
+    threads. El lock solo se toma la primera vez que un thread incrementa (para
+    registrar su celda) y en valor(), que suma todas las celdas. Las celdas de
+    threads terminados se conservan, así que el total no pierde cuentas.
+    """
+    def __init__(self):
+        self.celdas = []
+        self.local = threading.local()
+        self.lock = threading.Lock()
+
+    def incrementar(self, delta=1):
+        celda = getattr(self.local, 'celda', None)
+        if celda is None:
+            celda = self.local.celda = [0]
+            with self.lock:
+                self.celdas.append(celda)
+        celda[0] += delta
+
+    def valor(self):
+        with self.lock:
+            return sum(celda[0] for celda in self.celdas)
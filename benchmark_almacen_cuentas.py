@@ -0,0 +1,73 @@
+import gc
+import threading
+import time
+import tracemalloc
+
+from deadlock_solucion import Cuenta, transferir_lote_sin_deadlock, generar_transferencias
+from almacen_cuentas import AlmacenCuentas
+
+TAMANOS = [10000, 100000, 1000000]
+NUM_FRANJAS = [16, 256, 4096]
+NUM_TRANSFERENCIAS = 200000
+NUM_THREADS = 8
+
+def medir_memoria(constructor):
+    """Retorna (objeto, bytes asignados) medidos con tracemalloc al construir la estructura"""
+    gc.collect()
+    tracemalloc.start()
+    objeto = constructor()
+    memoria, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return objeto, memoria
+
+def medir_throughput(transferir, transferencias):
+    """Reparte las transferencias entre NUM_THREADS threads y retorna transferencias/seg"""
+    por_thread = len(transferencias) // NUM_THREADS
+
+    def trabajador(transferencias_thread):
+        for origen, destino, monto in transferencias_thread:
+            transferir(origen, destino, monto)
+
+    threads = [threading.Thread(target=trabajador, args=(transferencias[i*por_thread:(i+1)*por_thread],))
+               for i in range(NUM_THREADS)]
+    tiempo_inicio = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return por_thread * NUM_THREADS / (time.perf_counter() - tiempo_inicio)
+
+def main():
+    print("=== BENCHMARK: ALMACÉN DE CUENTAS CON LOCKS POR FRANJAS ===")
+    print(f"Transferencias por medición: {NUM_TRANSFERENCIAS} | Threads: {NUM_THREADS}")
+    print("Memoria: bytes asignados por Python al construir las cuentas (tracemalloc)")
+    print()
+    print("| Cuentas | Diseño                      | Memoria (MB) | Bytes/cuenta | Locks   | Transf/seg | Conservación |")
+    print("|---------|-----------------------------|--------------|--------------|---------|------------|--------------|")
+
+    for num_cuentas in TAMANOS:
+        transferencias = generar_transferencias(num_cuentas, NUM_TRANSFERENCIAS, semilla=42)
+        saldo_inicial = 1000 * num_cuentas * (num_cuentas + 1) // 2
+
+        # Diseño actual: un objeto Cuenta con su propio Lock por cuenta
+        cuentas, memoria = medir_memoria(lambda: [Cuenta(i, 1000*(i+1)) for i in range(num_cuentas)])
+        tps = medir_throughput(
+            lambda o, d, m: transferir_lote_sin_deadlock(cuentas, [(o, d, m)], tiempo_procesamiento=0),
+            transferencias)
+        conservacion = "✅" if sum(c.saldo for c in cuentas) == saldo_inicial else "❌"
+        print(f"| {num_cuentas:7} | {'Cuenta + Lock por cuenta':27} | {memoria/2**20:12.1f} | {memoria/num_cuentas:12.1f} | {num_cuentas:7} | {tps:10.0f} | {conservacion:12} |")
+        del cuentas
+        gc.collect()
+
+        # Diseño compacto: array('q') + locks por franjas
+        for num_franjas in NUM_FRANJAS:
+            almacen, memoria = medir_memoria(lambda: AlmacenCuentas.con_saldos_especificacion(num_cuentas, num_franjas))
+            tps = medir_throughput(almacen.transferir, transferencias)
+            conservacion = "✅" if almacen.saldo_total() == saldo_inicial else "❌"
+            diseno = f"array('q') + {num_franjas} franjas"
+            print(f"| {num_cuentas:7} | {diseno:27} | {memoria/2**20:12.1f} | {memoria/num_cuentas:12.1f} | {num_franjas:7} | {tps:10.0f} | {conservacion:12} |")
+            del almacen
+            gc.collect()
+
+if __name__ == "__main__":
+    main()
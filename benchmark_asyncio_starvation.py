@@ -0,0 +1,101 @@
+import asyncio
+import threading
+import time
+import random
+
+from starvation_solucion import Tarea, ColaPlanificada, PoliticaAging, PoliticaDRR
+from starvation_asyncio import simular
+
+CONSUMIDORES = [10, 100, 1000, 10000]
+NUM_PRODUCTORES = 10
+ESCALA = 0.1  # 20/25/30 ms de procesamiento por tarea
+TAREAS_MINIMAS = 1000
+
+def generar_secuencias(total, semilla=9):
+    """NUM_PRODUCTORES secuencias con la mezcla de main(): 60% B, 30% M, 10% A"""
+    rng = random.Random(semilla)
+    secuencias = [[] for _ in range(NUM_PRODUCTORES)]
+    for i in range(total):
+        r = rng.random()
+        secuencias[i % NUM_PRODUCTORES].append('B' if r < 0.6 else ('M' if r < 0.9 else 'A'))
+    return secuencias
+
+def simular_threads(secuencias, num_consumidores):
+    """Misma carga con un thread por productor y por consumidor sobre ColaPlanificada(PoliticaAging())"""
+    cola = ColaPlanificada(PoliticaAging(), capacidad_maxima=num_consumidores)
+    procesadas = [0] * num_consumidores
+
+    def productor(indice, secuencia):
+        for i, prioridad in enumerate(secuencia):
+            cola.put(Tarea(f"{indice}-{i+1}", prioridad, time.time()))
+
+    def consumidor(indice):
+        while True:
+            tarea = cola.get()
+            if tarea.id is None:
+                return
+            time.sleep(tarea.tiempo_procesamiento * ESCALA)
+            procesadas[indice] += 1
+
+    tiempo_inicio = time.perf_counter()
+    consumidores = []
+    try:
+        for i in range(num_consumidores):
+            t = threading.Thread(target=consumidor, args=(i,), daemon=True)
+            t.start()
+            consumidores.append(t)
+    except RuntimeError as e:
+        # Límite de threads del sistema: liberar los consumidores ya creados
+        for _ in consumidores:
+            cola.put(Tarea(None, 'A', time.time()))
+        return {'error': str(e), 'threads_creados': len(consumidores)}
+
+    productores = [threading.Thread(target=productor, args=(i+1, s)) for i, s in enumerate(secuencias)]
+    for t in productores:
+        t.start()
+    for t in productores:
+        t.join()
+    while cola.size() > 0:
+        time.sleep(0.001)
+    for _ in consumidores:
+        cola.put(Tarea(None, 'A', time.time()))
+    for t in consumidores:
+        t.join()
+    return {'tiempo': time.perf_counter() - tiempo_inicio, 'procesadas': sum(procesadas)}
+
+def main():
+    print("=== BENCHMARK: MOTOR ASYNCIO vs THREADS (COLA CON AGING) ===")
+    print(f"{NUM_PRODUCTORES} productores sin pausa, procesamiento simulado x{ESCALA}, "
+          f"max({TAREAS_MINIMAS}, 2 x consumidores) tareas, capacidad = consumidores")
+    print()
+    print("| Consumidores | Tareas | Motor         | Tiempo (s) | Tareas/seg | Ideal (tareas/seg) |")
+    print("|--------------|--------|---------------|------------|------------|--------------------|")
+    for num_consumidores in CONSUMIDORES:
+        total = max(TAREAS_MINIMAS, 2 * num_consumidores)
+        secuencias = generar_secuencias(total)
+        # Cada consumidor procesa en promedio 0.27 s x ESCALA por tarea
+        ideal = num_consumidores / (0.27 * ESCALA)
+
+        stats = asyncio.run(simular(secuencias, num_consumidores=num_consumidores, capacidad_maxima=num_consumidores,
+                                    escala=ESCALA, pausa_produccion=0))
+        procesadas = stats['A_procesadas'] + stats['M_procesadas'] + stats['B_procesadas']
+        print(f"| {num_consumidores:12} | {total:6} | {'asyncio':13} | {stats['tiempo']:10.3f} | "
+              f"{procesadas/stats['tiempo']:10.0f} | {ideal:18.0f} |")
+
+        # Con DRR (O(1) por get) se ve el costo del event loop sin el recorrido de aplicar_aging
+        stats = asyncio.run(simular(secuencias, num_consumidores=num_consumidores, capacidad_maxima=num_consumidores,
+                                    escala=ESCALA, pausa_produccion=0, politica=PoliticaDRR()))
+        procesadas = stats['A_procesadas'] + stats['M_procesadas'] + stats['B_procesadas']
+        print(f"| {num_consumidores:12} | {total:6} | {'asyncio + DRR':13} | {stats['tiempo']:10.3f} | "
+              f"{procesadas/stats['tiempo']:10.0f} | {ideal:18.0f} |")
+
+        r = simular_threads(secuencias, num_consumidores)
+        if 'error' in r:
+            print(f"| {num_consumidores:12} | {total:6} | {'threads':13} | {'-':>10} | {'-':>10} | "
+                  f"no se pudieron crear los threads ({r['threads_creados']} creados: {r['error']}) |")
+        else:
+            print(f"| {num_consumidores:12} | {total:6} | {'threads':13} | {r['tiempo']:10.3f} | "
+                  f"{r['procesadas']/r['tiempo']:10.0f} | {ideal:18.0f} |")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+import threading
+import time
+import random
+import os
+import contextlib
+import multiprocessing
+
+from atomico import EnteroAtomico
+from race_condition_solucion import GestorInventarioSeguro, GestorInventarioAtomico
+
+THREADS = [1, 2, 4, 8, 16, 32, 64]
+INCREMENTOS_TOTALES = 200000
+THREADS_INVENTARIO = [1, 4, 16, 64]
+OPERACIONES_POR_THREAD = 20
+
+@contextlib.contextmanager
+def silenciar_salida():
+    """Descarta los prints de vender/reabastecer"""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+class ContadorMutex:
+    """Referencia: entero protegido por un único mutex, como mutex_stats"""
+    def __init__(self):
+        self.valor = 0
+        self.lock = threading.Lock()
+
+    def fetch_add(self, delta=1):
+        with self.lock:
+            anterior = self.valor
+            self.valor += delta
+            return anterior
+
+class ContadorValue:
+    """multiprocessing.Value('q') con su lock interno"""
+    def __init__(self):
+        self.valor = multiprocessing.Value('q', 0)
+
+    def fetch_add(self, delta=1):
+        with self.valor.get_lock():
+            anterior = self.valor.value
+            self.valor.value = anterior + delta
+            return anterior
+
+def medir_contador(crear, num_threads):
+    contador = crear()
+    por_thread = INCREMENTOS_TOTALES // num_threads
+
+    def trabajador():
+        fetch_add = contador.fetch_add
+        for _ in range(por_thread):
+            fetch_add(1)
+
+    threads = [threading.Thread(target=trabajador) for _ in range(num_threads)]
+    tiempo_inicio = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    tiempo = time.perf_counter() - tiempo_inicio
+    return por_thread * num_threads / tiempo
+
+def medir_inventario(clase_gestor, num_threads):
+    """Cada thread ejecuta OPERACIONES_POR_THREAD ventas/reabastecimientos sobre los 10 productos"""
+    inventario = clase_gestor()
+    vendidas = [0] * num_threads
+    reabastecidas = [0] * num_threads
+
+    def trabajador(indice):
+        rng = random.Random(indice)
+        for _ in range(OPERACIONES_POR_THREAD):
+            producto_id = rng.randrange(10)
+            cantidad = rng.randint(1, 30)
+            if rng.random() < 0.5:
+                if inventario.vender(producto_id, cantidad, f"Thread-{indice}"):
+                    vendidas[indice] += cantidad
+            else:
+                inventario.reabastecer(producto_id, cantidad, f"Thread-{indice}")
+                reabastecidas[indice] += cantidad
+
+    threads = [threading.Thread(target=trabajador, args=(i,)) for i in range(num_threads)]
+    tiempo_inicio = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    tiempo = time.perf_counter() - tiempo_inicio
+    stock_total = sum(inventario.obtener_stock(i) for i in range(10))
+    esperado = 1000 + sum(reabastecidas) - sum(vendidas)
+    return {
+        'throughput': num_threads * OPERACIONES_POR_THREAD / tiempo,
+        'reintentos': inventario.reintentos.get() if clase_gestor is GestorInventarioAtomico else 0,
+        'no_negativo': all(inventario.obtener_stock(i) >= 0 for i in range(10)),
+        'conservacion': stock_total == esperado
+    }
+
+def main():
+    print("=== BENCHMARK: ENTEROS ATÓMICOS vs MUTEX ===")
+    print(f"\n=== CONTADOR COMPARTIDO: {INCREMENTOS_TOTALES} fetch_add(1) REPARTIDOS ENTRE LOS THREADS ===")
+    print("| Threads | Mutex único (ops/seg) | EnteroAtomico (ops/seg) | multiprocessing.Value (ops/seg) |")
+    print("|---------|-----------------------|-------------------------|---------------------------------|")
+    for n in THREADS:
+        print(f"| {n:7} | {medir_contador(ContadorMutex, n):21.0f} | {medir_contador(EnteroAtomico, n):23.0f} | "
+              f"{medir_contador(ContadorValue, n):31.0f} |")
+
+    print(f"\n=== INVENTARIO: {OPERACIONES_POR_THREAD} OPERACIONES POR THREAD SOBRE 10 PRODUCTOS (2 ms DE PROCESAMIENTO) ===")
+    print("| Threads | Gestor                  | Ops/seg | Reintentos CAS | Stock >= 0 | Conservación |")
+    print("|---------|-------------------------|---------|----------------|------------|--------------|")
+    for n in THREADS_INVENTARIO:
+        for clase in (GestorInventarioSeguro, GestorInventarioAtomico):
+            with silenciar_salida():
+                r = medir_inventario(clase, n)
+            print(f"| {n:7} | {clase.__name__:23} | {r['throughput']:7.0f} | {r['reintentos']:14} | "
+                  f"{'✅' if r['no_negativo'] else '❌':10} | {'✅' if r['conservacion'] else '❌':12} |")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+import argparse
+
+from race_condition_solucion import GestorInventarioSeguro, generar_carga, ejecutar_carga
+
+# Barrido por defecto: (número de productos, sesgo de Zipf)
+CONFIGURACIONES = [
+    (10**3, 0.0), (10**3, 0.8), (10**3, 1.2), (10**3, 1.5),
+    (10**6, 0.0), (10**6, 1.2),
+]
+PRODUCTOS_CALIENTES_MOSTRADOS = 5
+
+def medir(num_productos, zipf_s, num_threads, operaciones_por_thread, mezcla, tiempo_procesamiento, semilla=1):
+    """Ejecuta la carga con espera por producto medida; retorna un diccionario de resultados"""
+    carga = generar_carga(num_productos, num_threads, operaciones_por_thread, mezcla, zipf_s, semilla=semilla)
+    inventario = GestorInventarioSeguro(num_productos, tiempo_procesamiento=tiempo_procesamiento,
+                                        verbose=False, medir_espera_locks=True)
+    tiempo = ejecutar_carga(inventario, carga)
+
+    espera = inventario.espera_locks
+    espera_total = sum(espera)
+    calientes = sorted(range(num_productos), key=espera.__getitem__, reverse=True)[:PRODUCTOS_CALIENTES_MOSTRADOS]
+    return {
+        'ops_seg': num_threads * operaciones_por_thread / tiempo,
+        'espera_total': espera_total,
+        'contenciones': sum(inventario.contenciones_locks),
+        'calientes': [(i, espera[i], inventario.contenciones_locks[i]) for i in calientes]
+    }
+
+def imprimir_calientes(resultado):
+    if not resultado['espera_total']:
+        print("    Ningún lock tuvo espera")
+        return
+    for producto_id, espera, contenciones in resultado['calientes']:
+        if not espera:
+            break
+        porcentaje = espera / resultado['espera_total'] * 100
+        print(f"    Producto {producto_id}: {espera*1000:.1f} ms de espera ({porcentaje:.1f}%), {contenciones} adquisiciones con espera")
+
+def leer_mezcla(texto):
+    """'vender=0.45,reabastecer=0.45,obtener_stock=0.1' -> diccionario"""
+    mezcla = {}
+    for parte in texto.split(','):
+        operacion, proporcion = parte.split('=')
+        mezcla[operacion.strip()] = float(proporcion)
+    return mezcla
+
+def main():
+    parser = argparse.ArgumentParser(description="Carga configurable sobre GestorInventarioSeguro con espera por producto")
+    parser.add_argument('--productos', type=int, help="número de productos (sin este argumento se ejecuta el barrido)")
+    parser.add_argument('--zipf', type=float, default=1.2, help="sesgo de Zipf de los productos (0 = uniforme)")
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--operaciones', type=int, default=20000, help="operaciones por thread")
+    parser.add_argument('--mezcla', type=leer_mezcla, default=None,
+                        help="proporciones, ej. vender=0.45,reabastecer=0.45,obtener_stock=0.1")
+    parser.add_argument('--procesamiento', type=float, default=0.0001,
+                        help="segundos de cada pausa de procesamiento dentro de la sección crítica")
+    args = parser.parse_args()
+
+    configuraciones = [(args.productos, args.zipf)] if args.productos else CONFIGURACIONES
+    print("=== BENCHMARK: CARGA DEL INVENTARIO CON PRODUCTOS CALIENTES (ZIPF) ===")
+    print(f"{args.threads} threads x {args.operaciones} operaciones, "
+          f"procesamiento {args.procesamiento*1000:.2f} ms x 2 bajo el lock")
+    print()
+    print("| Productos | Zipf s | Ops/seg | Espera total en locks (s) | Adquisiciones con espera | % espera en top 5 |")
+    print("|-----------|--------|---------|---------------------------|--------------------------|-------------------|")
+    resultados = []
+    for num_productos, zipf_s in configuraciones:
+        resultado = medir(num_productos, zipf_s, args.threads, args.operaciones, args.mezcla, args.procesamiento)
+        resultados.append((num_productos, zipf_s, resultado))
+        top = sum(espera for _, espera, _ in resultado['calientes'])
+        porcentaje_top = top / resultado['espera_total'] * 100 if resultado['espera_total'] else 0.0
+        print(f"| {num_productos:9} | {zipf_s:6.1f} | {resultado['ops_seg']:7.0f} | {resultado['espera_total']:25.3f} | "
+              f"{resultado['contenciones']:24} | {porcentaje_top:17.1f} |")
+
+    print("\n=== PRODUCTOS CON MÁS ESPERA POR CONFIGURACIÓN ===")
+    for num_productos, zipf_s, resultado in resultados:
+        print(f"{num_productos} productos, zipf {zipf_s}:")
+        imprimir_calientes(resultado)
+
+if __name__ == "__main__":
+    main()
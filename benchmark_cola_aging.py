@@ -0,0 +1,87 @@
+import time
+import random
+import os
+import contextlib
+
+from starvation_solucion import Tarea, ColaConAging, ColaAgingHeap
+
+TAMANOS = [10**2, 10**3, 10**4, 10**5, 10**6]
+GETS_MEDIDOS = 2000
+# ColaConAging recorre la cola completa cada 2 get(): se limita el trabajo total medido
+OPERACIONES_MAXIMAS_LINEAL = 2 * 10**7
+
+@contextlib.contextmanager
+def silenciar_salida():
+    """Descarta los prints de aplicar_aging (uno por tarea promovida)"""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+def generar_tareas(n, semilla=5):
+    """Tareas con la mezcla de los productores aleatorios de main(): 60% B, 30% M, 10% A"""
+    rng = random.Random(semilla)
+    tareas = []
+    for i in range(n):
+        r = rng.random()
+        prioridad = 'B' if r < 0.6 else ('M' if r < 0.9 else 'A')
+        tareas.append(Tarea(f"T-{i}", prioridad, time.time()))
+    return tareas
+
+def medir_cola(cola, tareas, gets):
+    """Retorna (µs por put al llenar, µs por get+put en régimen con la cola llena)"""
+    inicio = time.perf_counter()
+    for tarea in tareas:
+        cola.put(tarea)
+    put_us = (time.perf_counter() - inicio) / len(tareas) * 1e6
+
+    inicio = time.perf_counter()
+    for _ in range(gets):
+        cola.put(cola.get())
+    get_put_us = (time.perf_counter() - inicio) / gets * 1e6
+    return put_us, get_put_us
+
+def operaciones_hasta_atender_b(cola, avanzar_reloj=None, limite=100000):
+    """Encola una tarea B y luego un flujo continuo de tareas A; cuenta los get() hasta atender la B"""
+    cola.put(Tarea("B-0", 'B', time.time()))
+    for i in range(limite):
+        if avanzar_reloj:
+            avanzar_reloj()
+        cola.put(Tarea(f"A-{i}", 'A', time.time()))
+        if cola.get().id == "B-0":
+            return i + 1
+    return None
+
+def main():
+    print("=== BENCHMARK: COLA CON AGING SOBRE HEAP vs ColaConAging ===")
+    print(f"Mezcla de tareas: 60% B, 30% M, 10% A | get()+put() medidos en régimen: hasta {GETS_MEDIDOS}")
+    print()
+    print("| Tareas en cola | Cola            | µs por put | µs por get+put | get+put medidos |")
+    print("|----------------|-----------------|------------|----------------|-----------------|")
+
+    for n in TAMANOS:
+        tareas = generar_tareas(n)
+
+        heap = ColaAgingHeap(capacidad_maxima=n + 1)
+        put_us, get_us = medir_cola(heap, tareas, GETS_MEDIDOS)
+        print(f"| {n:14} | {'ColaAgingHeap':15} | {put_us:10.2f} | {get_us:14.2f} | {GETS_MEDIDOS:15} |")
+
+        tareas = generar_tareas(n)
+        gets = max(10, min(GETS_MEDIDOS, OPERACIONES_MAXIMAS_LINEAL // n))
+        with silenciar_salida():
+            put_us, get_us = medir_cola(ColaConAging(capacidad_maxima=n + 1), tareas, gets)
+        print(f"| {n:14} | {'ColaConAging':15} | {put_us:10.2f} | {get_us:14.2f} | {gets:15} |")
+
+    print("\n=== GARANTÍA ANTI-STARVATION: FLUJO CONTINUO DE TAREAS A ===")
+    # Reloj simulado: cada operación avanza 10 ms
+    reloj = [0.0]
+    def avanzar():
+        reloj[0] += 0.01
+    heap = ColaAgingHeap(capacidad_maxima=10, tasa_aging=1.0, reloj=lambda: reloj[0])
+    ops_heap = operaciones_hasta_atender_b(heap, avanzar)
+    print(f"ColaAgingHeap (tasa_aging=1/s, 10 ms por operación): B atendida tras {ops_heap} get() "
+          f"(cota: {heap.espera_maxima_b():.1f} s = {heap.espera_maxima_b()/0.01:.0f} operaciones)")
+    with silenciar_salida():
+        ops_lineal = operaciones_hasta_atender_b(ColaConAging(capacidad_maxima=10))
+    print(f"ColaConAging (forzado de B cada 5 operaciones): B atendida tras {ops_lineal} get()")
+
+if __name__ == "__main__":
+    main()
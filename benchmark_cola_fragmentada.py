@@ -0,0 +1,108 @@
+import threading
+import time
+import random
+import os
+import contextlib
+import statistics
+
+from starvation_solucion import Tarea, ColaConAging, ColaAgingHeap, ColaFragmentada
+
+CONSUMIDORES = [1, 2, 4, 8, 16, 32, 64]
+NUM_PRODUCTORES = 4
+TAREAS_TOTALES = 20000
+CAPACIDAD = 1000
+
+@contextlib.contextmanager
+def silenciar_salida():
+    """Descarta los prints de aging de ColaConAging"""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+def crear_cola(tipo, num_consumidores):
+    if tipo == 'ColaConAging':
+        return ColaConAging(capacidad_maxima=CAPACIDAD)
+    if tipo == 'ColaAgingHeap':
+        return ColaAgingHeap(capacidad_maxima=CAPACIDAD)
+    return ColaFragmentada(num_fragmentos=num_consumidores, capacidad_maxima=CAPACIDAD)
+
+def ejecutar(tipo, num_consumidores):
+    """Productores y consumidores con tareas de costo cero: mide solo el overhead de la cola"""
+    cola = crear_cola(tipo, num_consumidores)
+    fragmentada = isinstance(cola, ColaFragmentada)
+    esperas = {'A': [], 'M': [], 'B': []}
+    consumidas = [0] * num_consumidores
+    todas_consumidas = threading.Event()
+    lock_conteo = threading.Lock()
+    total = [0]
+
+    def productor(indice, cantidad):
+        rng = random.Random(indice)
+        for i in range(cantidad):
+            r = rng.random()
+            prioridad = 'B' if r < 0.6 else ('M' if r < 0.9 else 'A')
+            tarea = Tarea(f"{indice}-{i}", prioridad, time.time())
+            tarea.clase = prioridad  # ColaConAging sobrescribe prioridad al promover
+            cola.put(tarea)
+
+    def consumidor(indice):
+        locales = {'A': [], 'M': [], 'B': []}
+        while True:
+            tarea = cola.get(indice) if fragmentada else cola.get()
+            if tarea.id is None:
+                break
+            locales[tarea.clase].append(time.time() - tarea.tiempo_creacion)
+            consumidas[indice] += 1
+        with lock_conteo:
+            for clase in esperas:
+                esperas[clase].extend(locales[clase])
+            total[0] += consumidas[indice]
+
+    por_productor = TAREAS_TOTALES // NUM_PRODUCTORES
+    productores = [threading.Thread(target=productor, args=(i, por_productor)) for i in range(NUM_PRODUCTORES)]
+    consumidores = [threading.Thread(target=consumidor, args=(i,)) for i in range(num_consumidores)]
+
+    tiempo_inicio = time.perf_counter()
+    for t in consumidores + productores:
+        t.start()
+    for t in productores:
+        t.join()
+    # Esperar a que se vacíe la cola y enviar una tarea de fin por consumidor
+    while cola.size() > 0:
+        time.sleep(0.0005)
+    tiempo_total = time.perf_counter() - tiempo_inicio
+    for i in range(num_consumidores):
+        fin = Tarea(None, 'A', time.time())
+        cola.put(fin)
+    for t in consumidores:
+        t.join()
+
+    resultado = {'throughput': por_productor * NUM_PRODUCTORES / tiempo_total, 'consumidas': total[0]}
+    for clase, valores in esperas.items():
+        if len(valores) > 1:
+            cuantiles = statistics.quantiles(valores, n=100, method='inclusive')
+            resultado[f'p50_{clase}'] = cuantiles[49] * 1000
+            resultado[f'p99_{clase}'] = cuantiles[98] * 1000
+        else:
+            resultado[f'p50_{clase}'] = resultado[f'p99_{clase}'] = float('nan')
+    if fragmentada:
+        resultado['robos'] = cola.robos
+    return resultado
+
+def main():
+    print("=== BENCHMARK: COLA FRAGMENTADA CON ROBO DE TRABAJO vs COLA CON UN SOLO LOCK ===")
+    print(f"{TAREAS_TOTALES} tareas de costo cero, {NUM_PRODUCTORES} productores, capacidad {CAPACIDAD}")
+    print("Espera = tiempo desde la creación de la tarea hasta que un consumidor la obtiene")
+    print()
+    print("| Consumidores | Cola             | Tareas/seg | p50 A (ms) | p99 A (ms) | p50 M (ms) | p99 M (ms) | p50 B (ms) | p99 B (ms) | Robos  |")
+    print("|--------------|------------------|------------|------------|------------|------------|------------|------------|------------|--------|")
+    for num_consumidores in CONSUMIDORES:
+        for tipo in ('ColaConAging', 'ColaAgingHeap', 'ColaFragmentada'):
+            with silenciar_salida():
+                r = ejecutar(tipo, num_consumidores)
+            robos = r.get('robos', '-')
+            print(f"| {num_consumidores:12} | {tipo:16} | {r['throughput']:10.0f} | "
+                  f"{r['p50_A']:10.2f} | {r['p99_A']:10.2f} | {r['p50_M']:10.2f} | {r['p99_M']:10.2f} | "
+                  f"{r['p50_B']:10.2f} | {r['p99_B']:10.2f} | {robos:>6} |")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+import threading
+import time
+import random
+import os
+import contextlib
+import statistics
+
+from starvation_solucion import Tarea, ColaConAging, ControladorCapacidad
+
+TAREAS_TOTALES = 20000
+PROPORCIONES = [(1, 4), (2, 2), (4, 1), (8, 8)]  # (productores, consumidores)
+TAMANO_LOTE = 16
+CAPACIDAD_FIJA = 20
+TRABAJO_CONSUMIDOR = 50  # Iteraciones de trabajo simulado por tarea
+LATENCIA_OBJETIVO = 0.001
+
+@contextlib.contextmanager
+def silenciar_salida():
+    """Descarta los prints de aging y forzado de ColaConAging"""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+def generar_tareas(cantidad, semilla):
+    """Mezcla de main(): 60% B, 30% M, 10% A"""
+    rng = random.Random(semilla)
+    tareas = []
+    for i in range(cantidad):
+        r = rng.random()
+        tareas.append(Tarea(f"{semilla}-{i}", 'B' if r < 0.6 else ('M' if r < 0.9 else 'A'), 0.0))
+    return tareas
+
+def ejecutar(modo, num_productores, num_consumidores):
+    cola = ColaConAging(capacidad_maxima=CAPACIDAD_FIJA)
+    controlador = None
+    if modo == 'adaptativa':
+        controlador = ControladorCapacidad(cola, latencia_objetivo=LATENCIA_OBJETIVO, intervalo=0.01)
+        controlador.start()
+    lotes = modo != 'simple'
+    por_productor = TAREAS_TOTALES // num_productores
+    tareas_productores = [generar_tareas(por_productor, i) for i in range(num_productores)]
+    esperas = []
+    productores_terminados = threading.Event()
+    capacidades = []
+
+    def productor(tareas):
+        if lotes:
+            for i in range(0, len(tareas), TAMANO_LOTE):
+                lote = tareas[i:i + TAMANO_LOTE]
+                ahora = time.perf_counter()
+                for tarea in lote:
+                    tarea.tiempo_creacion = ahora
+                cola.put_many(lote, TAMANO_LOTE)
+        else:
+            for tarea in tareas:
+                tarea.tiempo_creacion = time.perf_counter()
+                cola.put(tarea)
+
+    def procesar(tarea, locales):
+        locales.append(time.perf_counter() - tarea.tiempo_creacion)
+        sum(range(TRABAJO_CONSUMIDOR))
+
+    def consumidor():
+        locales = []
+        while True:
+            if lotes:
+                recibidas = cola.get_many(TAMANO_LOTE, timeout=0.01)
+            else:
+                tarea = cola.get(timeout=0.01)
+                recibidas = [tarea] if tarea is not None else []
+            if not recibidas:
+                if productores_terminados.is_set():
+                    break
+                continue
+            for tarea in recibidas:
+                procesar(tarea, locales)
+        esperas.extend(locales)
+
+    def muestrear_capacidad():
+        while not productores_terminados.is_set():
+            capacidades.append(cola.capacidad_maxima)
+            time.sleep(0.005)
+
+    productores = [threading.Thread(target=productor, args=(t,)) for t in tareas_productores]
+    consumidores = [threading.Thread(target=consumidor) for _ in range(num_consumidores)]
+    muestreo = threading.Thread(target=muestrear_capacidad)
+    tiempo_inicio = time.perf_counter()
+    for t in consumidores + productores + [muestreo]:
+        t.start()
+    for t in productores:
+        t.join()
+    productores_terminados.set()
+    for t in consumidores + [muestreo]:
+        t.join()
+    tiempo_total = time.perf_counter() - tiempo_inicio
+    if controlador is not None:
+        controlador.detener()
+
+    cuantiles = statistics.quantiles(esperas, n=100, method='inclusive')
+    return {
+        'consumidas': len(esperas),
+        'throughput': len(esperas) / tiempo_total,
+        'p50_ms': cuantiles[49] * 1000,
+        'p99_ms': cuantiles[98] * 1000,
+        'capacidad_media': statistics.mean(capacidades) if capacidades else cola.capacidad_maxima,
+        'ajustes': controlador.ajustes if controlador else 0
+    }
+
+def main():
+    print("=== BENCHMARK: put_many/get_many Y CAPACIDAD ADAPTATIVA vs OPERACIONES DE A UNA TAREA ===")
+    print(f"{TAREAS_TOTALES} tareas, lotes de {TAMANO_LOTE}, capacidad fija {CAPACIDAD_FIJA}, "
+          f"latencia objetivo del controlador {LATENCIA_OBJETIVO*1000:.0f} ms")
+    print("Espera = desde que el productor encola hasta que un consumidor toma la tarea")
+    print()
+    print("| Productores | Consumidores | Modo                  | Tareas/seg | p50 espera (ms) | p99 espera (ms) | Capacidad media | Ajustes |")
+    print("|-------------|--------------|-----------------------|------------|-----------------|-----------------|-----------------|---------|")
+    modos = [('simple', 'put/get'), ('lotes', f'lotes de {TAMANO_LOTE}'), ('adaptativa', 'lotes + adaptativa')]
+    for num_productores, num_consumidores in PROPORCIONES:
+        for modo, nombre in modos:
+            with silenciar_salida():
+                r = ejecutar(modo, num_productores, num_consumidores)
+            print(f"| {num_productores:11} | {num_consumidores:12} | {nombre:21} | {r['throughput']:10.0f} | "
+                  f"{r['p50_ms']:15.2f} | {r['p99_ms']:15.2f} | {r['capacidad_media']:15.1f} | {r['ajustes']:7} |")
+
+if __name__ == "__main__":
+    main()
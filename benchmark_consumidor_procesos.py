@@ -0,0 +1,97 @@
+import threading
+import time
+import os
+import sys
+import contextlib
+import statistics
+
+from starvation_solucion import Tarea, ColaConAging
+from consumidor_procesos import DespachadorProcesos, trabajo_cpu
+
+NUM_TAREAS = 60
+ITERACIONES = 300000
+
+@contextlib.contextmanager
+def silenciar_salida():
+    """Descarta los prints de aging de ColaConAging"""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+def crear_tareas():
+    """Mezcla de main(): 60% B, 30% M, 10% A, todas con la misma carga CPU-bound"""
+    tareas = []
+    for i in range(NUM_TAREAS):
+        prioridad = 'A' if i % 10 == 0 else ('M' if i % 10 in (1, 4, 7) else 'B')
+        tarea = Tarea(f"C-{i+1}", prioridad, time.time())
+        tarea.iteraciones = ITERACIONES
+        tareas.append(tarea)
+    return tareas
+
+def ejecutar_threads(num_consumidores):
+    """Consumidores en threads ejecutando la carga en el proceso padre (limitados por el GIL)"""
+    cola = ColaConAging(capacidad_maxima=20)
+
+    def consumidor():
+        while True:
+            tarea = cola.get()
+            if tarea.id is None:
+                return
+            trabajo_cpu(tarea)
+
+    consumidores = [threading.Thread(target=consumidor) for _ in range(num_consumidores)]
+    tiempo_inicio = time.perf_counter()
+    for t in consumidores:
+        t.start()
+    for tarea in crear_tareas():
+        cola.put(tarea)
+    while cola.size() > 0:
+        time.sleep(0.001)
+    for _ in consumidores:
+        cola.put(Tarea(None, 'A', time.time()))
+    for t in consumidores:
+        t.join()
+    return time.perf_counter() - tiempo_inicio
+
+def ejecutar_procesos(num_procesos):
+    cola = ColaConAging(capacidad_maxima=20)
+    despachador = DespachadorProcesos(cola, num_procesos=num_procesos)
+    despachador.start()
+    tiempo_inicio = time.perf_counter()
+    for tarea in crear_tareas():
+        cola.put(tarea)
+    despachador.detener()
+    tiempo_total = time.perf_counter() - tiempo_inicio
+    latencias = despachador.stats['latencia_despacho']
+    cuantiles = statistics.quantiles(latencias, n=100, method='inclusive')
+    return tiempo_total, statistics.mean(latencias), cuantiles[98]
+
+def main():
+    # El despachador necesita al menos un proceso por clase (A, M, B)
+    max_procesos = max(3, int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count())
+    niveles = sorted({3, *[2**i for i in range(2, 8) if 2**i < max_procesos], max_procesos})
+
+    # Costo de referencia: todas las tareas en serie en el proceso padre
+    tareas = crear_tareas()
+    tiempo_inicio = time.perf_counter()
+    for tarea in tareas:
+        trabajo_cpu(tarea)
+    tiempo_serie = time.perf_counter() - tiempo_inicio
+
+    print("=== BENCHMARK: CONSUMIDOR CON PROCESOS vs THREADS PARA TAREAS CPU-BOUND ===")
+    print(f"{NUM_TAREAS} tareas de {ITERACIONES} iteraciones ({tiempo_serie/NUM_TAREAS*1000:.1f} ms cada una en serie), "
+          f"{os.cpu_count()} CPU disponibles")
+    print(f"Tiempo en serie: {tiempo_serie:.3f} s")
+    print()
+    print("| Consumidores | Threads (s) | Speedup threads | Procesos (s) | Speedup procesos | Latencia despacho media (ms) | p99 (ms) |")
+    print("|--------------|-------------|-----------------|--------------|------------------|------------------------------|----------|")
+    for n in niveles:
+        with silenciar_salida():
+            tiempo_threads = ejecutar_threads(n)
+            tiempo_procesos, latencia_media, latencia_p99 = ejecutar_procesos(n)
+        print(f"| {n:12} | {tiempo_threads:11.3f} | {tiempo_serie/tiempo_threads:15.2f} | {tiempo_procesos:12.3f} | "
+              f"{tiempo_serie/tiempo_procesos:16.2f} | {latencia_media*1000:28.2f} | {latencia_p99*1000:8.2f} |")
+    print("\nLatencia de despacho: envío de la tarea al proceso trabajador + retorno del resultado al padre")
+    print("(las ventanas por clase suman los procesos, así que no incluye espera por un proceso libre).")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import threading
+import time
+import random
+
+from race_condition_solucion import GestorInventarioSeguro
+
+THREADS = [1, 2, 4, 8, 16, 32, 64]
+OPERACIONES_TOTALES = 200000
+NUM_PRODUCTOS = 1000  # Muchos productos: los locks por producto casi no compiten
+
+def medir(contadores_fragmentados, num_threads):
+    """Ventas y reabastecimientos sin procesamiento simulado ni prints: solo locks y contadores"""
+    inventario = GestorInventarioSeguro(NUM_PRODUCTOS, contadores_fragmentados=contadores_fragmentados,
+                                        tiempo_procesamiento=0, verbose=False)
+    por_thread = OPERACIONES_TOTALES // num_threads
+    operaciones = []
+    for indice in range(num_threads):
+        rng = random.Random(indice)
+        operaciones.append([(rng.random() < 0.5, rng.randrange(NUM_PRODUCTOS), rng.randint(1, 5))
+                            for _ in range(por_thread)])
+
+    def trabajador(indice, lista):
+        nombre = f"Thread-{indice}"
+        vender, reabastecer = inventario.vender, inventario.reabastecer
+        for es_venta, producto_id, cantidad in lista:
+            if es_venta:
+                vender(producto_id, cantidad, nombre)
+            else:
+                reabastecer(producto_id, cantidad, nombre)
+
+    threads = [threading.Thread(target=trabajador, args=(i, ops)) for i, ops in enumerate(operaciones)]
+    tiempo_inicio = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    tiempo = time.perf_counter() - tiempo_inicio
+
+    completadas, fallidas = inventario.obtener_estadisticas()
+    return por_thread * num_threads / tiempo, completadas + fallidas == por_thread * num_threads
+
+def main():
+    print("=== BENCHMARK: CONTADORES DE ESTADÍSTICAS POR THREAD vs mutex_stats GLOBAL ===")
+    print(f"{OPERACIONES_TOTALES} operaciones repartidas entre los threads, {NUM_PRODUCTOS} productos, "
+          "sin procesamiento simulado ni prints")
+    print()
+    print("| Threads | Con mutex_stats (ops/seg) | Contadores fragmentados (ops/seg) | Mejora (%) | Conteo exacto |")
+    print("|---------|---------------------------|-----------------------------------|------------|---------------|")
+    for n in THREADS:
+        con_mutex, exacto_mutex = medir(False, n)
+        fragmentados, exacto_fragmentados = medir(True, n)
+        mejora = (fragmentados / con_mutex - 1) * 100
+        exacto = '✅' if exacto_mutex and exacto_fragmentados else '❌'
+        print(f"| {n:7} | {con_mutex:25.0f} | {fragmentados:33.0f} | {mejora:10.1f} | {exacto:13} |")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import threading
+import time
+import random
+import statistics
+
+from deadlock_solucion import Cuenta, CuentaVersionada, transferir_sin_deadlock, transferir_optimista
+
+NUM_CUENTAS = 16
+NUM_THREADS = 8
+OPERACIONES_POR_THREAD = 2000
+TIEMPO_PROCESAMIENTO = 0.001
+MEZCLAS_LECTURA = [0.95, 0.50]
+
+def leer_con_lock(cuenta):
+    with cuenta.lock:
+        return cuenta.saldo
+
+def ejecutar_mezcla(modo, proporcion_lectura, semilla=3):
+    """Cada thread alterna lecturas de saldo y transferencias según la proporción dada"""
+    if modo == 'lock':
+        cuentas = [Cuenta(i, 1000*(i+1)) for i in range(NUM_CUENTAS)]
+        leer = leer_con_lock
+        transferir = transferir_sin_deadlock
+    else:
+        cuentas = [CuentaVersionada(i, 1000*(i+1)) for i in range(NUM_CUENTAS)]
+        leer = CuentaVersionada.leer_saldo
+        transferir = transferir_optimista
+    saldo_inicial = sum(c.saldo for c in cuentas)
+
+    latencias_lectura = []
+    transferencias = []
+    reintentos = []
+
+    def trabajador(indice):
+        rng = random.Random(semilla * 1000 + indice)
+        lat, num_transf, rein = [], 0, 0
+        for _ in range(OPERACIONES_POR_THREAD):
+            if rng.random() < proporcion_lectura:
+                cuenta = cuentas[rng.randrange(NUM_CUENTAS)]
+                inicio = time.perf_counter()
+                leer(cuenta)
+                lat.append(time.perf_counter() - inicio)
+            else:
+                origen = rng.randrange(NUM_CUENTAS)
+                destino = (origen + rng.randrange(1, NUM_CUENTAS)) % NUM_CUENTAS
+                _, r = transferir(cuentas, origen, destino, rng.randint(1, 500),
+                                  tiempo_procesamiento=TIEMPO_PROCESAMIENTO, verbose=False)
+                num_transf += 1
+                rein += r
+        latencias_lectura.extend(lat)
+        transferencias.append(num_transf)
+        reintentos.append(rein)
+
+    threads = [threading.Thread(target=trabajador, args=(i,), name=f"Thread-{i+1}") for i in range(NUM_THREADS)]
+    tiempo_inicio = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    tiempo_total = time.perf_counter() - tiempo_inicio
+
+    cuantiles = statistics.quantiles(latencias_lectura, n=100, method='inclusive')
+    return {
+        'lecturas': len(latencias_lectura),
+        'lectura_p50_us': cuantiles[49] * 1e6,
+        'lectura_p99_us': cuantiles[98] * 1e6,
+        'lectura_max_us': max(latencias_lectura) * 1e6,
+        'transferencias': sum(transferencias),
+        'transferencias_por_segundo': sum(transferencias) / tiempo_total,
+        'reintentos': sum(reintentos),
+        'tiempo': tiempo_total,
+        'conservacion': sum(c.saldo for c in cuentas) == saldo_inicial
+    }
+
+def main():
+    print("=== BENCHMARK: CUENTA VERSIONADA (SEQLOCK + OCC) vs LOCK POR CUENTA ===")
+    print(f"{NUM_THREADS} threads x {OPERACIONES_POR_THREAD} operaciones sobre {NUM_CUENTAS} cuentas, "
+          f"procesamiento simulado por transferencia: {TIEMPO_PROCESAMIENTO*1000:.0f} ms")
+    print()
+    print("| Lect/Escr | Modo               | Lecturas | p50 lect (µs) | p99 lect (µs) | Máx lect (µs) | Transf | Transf/seg | Conflictos | Conservación |")
+    print("|-----------|--------------------|----------|---------------|---------------|---------------|--------|------------|------------|--------------|")
+    for proporcion in MEZCLAS_LECTURA:
+        mezcla = f"{proporcion*100:.0f}/{(1-proporcion)*100:.0f}"
+        for modo, nombre in [('lock', 'Lock por cuenta'), ('versionada', 'Versionada (OCC)')]:
+            r = ejecutar_mezcla(modo, proporcion)
+            print(f"| {mezcla:9} | {nombre:18} | {r['lecturas']:8} | {r['lectura_p50_us']:13.2f} | {r['lectura_p99_us']:13.2f} | "
+                  f"{r['lectura_max_us']:13.1f} | {r['transferencias']:6} | {r['transferencias_por_segundo']:10.1f} | "
+                  f"{r['reintentos']:10} | {'✅' if r['conservacion'] else '❌':12} |")
+
+if __name__ == "__main__":
+    main()
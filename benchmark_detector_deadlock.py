@@ -0,0 +1,121 @@
+import threading
+import time
+import os
+import contextlib
+import statistics
+
+from detector_deadlock import GrafoEspera, LockInstrumentado, DetectorDeadlock
+from deadlock_con_problema import (
+    OPERACIONES,
+    crear_cuentas_instrumentadas,
+    ejecutar_transferencias,
+    ejecutar_transferencias_con_reintentos,
+)
+
+ITERACIONES_OVERHEAD = 500000
+TIEMPO_MAXIMO_DEADLOCK = 3.0
+
+@contextlib.contextmanager
+def silenciar_salida():
+    """Descarta los prints de las transferencias para no medir la terminal"""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+def medir_acquire_release(lock, iteraciones=ITERACIONES_OVERHEAD):
+    """Tiempo medio en ns de un par acquire()/release() sin contención"""
+    acquire = lock.acquire
+    release = lock.release
+    tiempo_inicio = time.perf_counter_ns()
+    for _ in range(iteraciones):
+        acquire()
+        release()
+    return (time.perf_counter_ns() - tiempo_inicio) / iteraciones
+
+def benchmark_overhead():
+    print("=== OVERHEAD POR ACQUIRE/RELEASE (SIN CONTENCIÓN) ===")
+    print("| Lock                                  | ns por acquire+release | Factor |")
+    print("|---------------------------------------|------------------------|--------|")
+
+    base = medir_acquire_release(threading.Lock())
+    print(f"| {'threading.Lock':37} | {base:22.1f} | {1.0:6.2f} |")
+
+    grafo = GrafoEspera()
+    instrumentado = medir_acquire_release(LockInstrumentado("cuenta0", grafo))
+    print(f"| {'LockInstrumentado (sin detector)':37} | {instrumentado:22.1f} | {instrumentado/base:6.2f} |")
+
+    grafo = GrafoEspera()
+    detector = DetectorDeadlock(grafo, verbose=False)
+    detector.start()
+    con_detector = medir_acquire_release(LockInstrumentado("cuenta0", grafo))
+    detector.detener()
+    print(f"| {'LockInstrumentado (detector a 1 ms)':37} | {con_detector:22.1f} | {con_detector/base:6.2f} |")
+
+def benchmark_deteccion():
+    print("\n=== LATENCIA DE DETECCIÓN (TABLA DEL DOCUMENTO, SIN ROMPER CICLOS) ===")
+    grafo = GrafoEspera()
+    cuentas = crear_cuentas_instrumentadas(grafo)
+    detector = DetectorDeadlock(grafo, verbose=False)
+    detector.start()
+
+    # Threads daemon: si quedan en deadlock no impiden terminar el benchmark
+    threads = [threading.Thread(target=ejecutar_transferencias, args=(cuentas, ops), name=f"Thread-{i+1}", daemon=True)
+               for i, ops in enumerate(OPERACIONES)]
+    with silenciar_salida():
+        for t in threads:
+            t.start()
+        limite = time.perf_counter() + TIEMPO_MAXIMO_DEADLOCK
+        for t in threads:
+            t.join(timeout=max(limite - time.perf_counter(), 0))
+    detector.detener()
+
+    bloqueados = [t.name for t in threads if t.is_alive()]
+    print(f"Threads bloqueados tras {TIEMPO_MAXIMO_DEADLOCK:.0f} s: {len(bloqueados)}/10 {bloqueados}")
+    print(f"Ciclos detectados: {len(detector.detecciones)}")
+    for deteccion in detector.detecciones:
+        print(f"  [{deteccion['timestamp']}] latencia {deteccion['latencia']*1000:.2f} ms")
+        for thread_name, tenido, esperado in deteccion['ciclo']:
+            print(f"      {thread_name} tiene {tenido} y espera {esperado}")
+    if detector.detecciones:
+        latencias = [d['latencia'] * 1000 for d in detector.detecciones]
+        print(f"Latencia de detección (ms): mediana {statistics.median(latencias):.2f}, máxima {max(latencias):.2f}")
+
+def benchmark_ruptura():
+    print("\n=== RUPTURA DE CICLOS (VÍCTIMA = ESPERA MÁS RECIENTE, REINTENTO CON BACKOFF) ===")
+    grafo = GrafoEspera()
+    cuentas = crear_cuentas_instrumentadas(grafo)
+    detector = DetectorDeadlock(grafo, romper=True, verbose=False)
+    detector.start()
+
+    reintentos = {}
+    threads = [threading.Thread(target=ejecutar_transferencias_con_reintentos, args=(cuentas, ops, reintentos),
+                                name=f"Thread-{i+1}", daemon=True)
+               for i, ops in enumerate(OPERACIONES)]
+    tiempo_inicio = time.perf_counter()
+    with silenciar_salida():
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=30)
+    tiempo_total = time.perf_counter() - tiempo_inicio
+    detector.detener()
+
+    completados = sum(1 for t in threads if not t.is_alive())
+    saldo_total = sum(c.saldo for c in cuentas)
+    print(f"Threads completados: {completados}/10")
+    print(f"Tiempo total: {tiempo_total*1000:.2f} ms")
+    print(f"Ciclos detectados y rotos: {len(detector.detecciones)}")
+    print(f"Reintentos totales: {sum(reintentos.values())}")
+    if detector.detecciones:
+        latencias = [d['latencia'] * 1000 for d in detector.detecciones]
+        print(f"Latencia de detección (ms): mediana {statistics.median(latencias):.2f}, máxima {max(latencias):.2f}")
+    print(f"Conservación de dinero: {'✅ CORRECTO' if saldo_total == 15000 else '❌ ERROR'} (${saldo_total})")
+
+def main():
+    print("=== BENCHMARK: DETECTOR DE DEADLOCK CON GRAFO DE ESPERA ===")
+    print()
+    benchmark_overhead()
+    benchmark_deteccion()
+    benchmark_ruptura()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+import threading
+import time
+import random
+import os
+import contextlib
+
+from starvation_solucion import Tarea, TareaRechazada, ColaConAging, ColaPlanificada, PoliticaEDF
+
+NUM_CONSUMIDORES = 3
+NUM_PRODUCTORES = 4
+ESCALA = 0.05  # 10/12.5/15 ms de procesamiento por tarea
+DURACION_PRODUCCION = 3.0
+# Holgura del deadline por clase, en múltiplos del propio tiempo de procesamiento
+HOLGURA = {'A': 4, 'M': 8, 'B': 16}
+CARGAS = [0.8, 1.2, 1.5, 2.0]  # Llegadas / capacidad de los consumidores
+
+@contextlib.contextmanager
+def silenciar_salida():
+    """Descarta los prints de aging y forzado de ColaConAging"""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+def costo(tarea):
+    return tarea.tiempo_procesamiento * ESCALA
+
+def crear_colas():
+    return [
+        ("A>M>B + aging", lambda: ColaConAging(capacidad_maxima=10**6)),
+        ("EDF", lambda: ColaPlanificada(PoliticaEDF(NUM_CONSUMIDORES, costo=costo), 10**6)),
+        ("EDF + rechazo", lambda: ColaPlanificada(PoliticaEDF(NUM_CONSUMIDORES, 'rechazar', costo), 10**6)),
+        ("EDF + degradación", lambda: ColaPlanificada(PoliticaEDF(NUM_CONSUMIDORES, 'degradar', costo), 10**6)),
+    ]
+
+def ejecutar(cola, carga):
+    """Productores a tasa fija (carga x capacidad de servicio) y consumidores que registran si cumplen el deadline"""
+    costo_medio = (0.1 * 0.2 + 0.3 * 0.25 + 0.6 * 0.3) * ESCALA
+    tasa_llegadas = carga * NUM_CONSUMIDORES / costo_medio
+    pausa = NUM_PRODUCTORES / tasa_llegadas
+    resultados = {'generadas': 0, 'rechazadas': 0, 'a_tiempo': 0, 'tarde': 0, 'a_tiempo_A': 0, 'total_A': 0}
+    lock = threading.Lock()
+
+    def productor(indice):
+        rng = random.Random(indice)
+        proximo = time.time()
+        fin = proximo + DURACION_PRODUCCION
+        i = 0
+        while proximo < fin:
+            time.sleep(max(0.0, proximo - time.time()))
+            r = rng.random()
+            prioridad = 'B' if r < 0.6 else ('M' if r < 0.9 else 'A')
+            ahora = time.time()
+            tarea = Tarea(f"{indice}-{i}", prioridad, ahora)
+            tarea.deadline = ahora + HOLGURA[prioridad] * costo(tarea)
+            tarea.clase = prioridad  # ColaConAging sobrescribe prioridad al promover
+            i += 1
+            try:
+                cola.put(tarea)
+            except TareaRechazada:
+                with lock:
+                    resultados['rechazadas'] += 1
+            with lock:
+                resultados['generadas'] += 1
+            proximo += pausa
+
+    def consumidor():
+        while True:
+            tarea = cola.get()
+            if tarea is None:
+                continue
+            if tarea.id is None:
+                return
+            time.sleep(costo(tarea))
+            a_tiempo = time.time() <= tarea.deadline
+            with lock:
+                resultados['a_tiempo' if a_tiempo else 'tarde'] += 1
+                if tarea.clase == 'A':
+                    resultados['total_A'] += 1
+                    resultados['a_tiempo_A'] += a_tiempo
+
+    productores = [threading.Thread(target=productor, args=(i,)) for i in range(NUM_PRODUCTORES)]
+    consumidores = [threading.Thread(target=consumidor) for _ in range(NUM_CONSUMIDORES)]
+    tiempo_inicio = time.perf_counter()
+    for t in consumidores + productores:
+        t.start()
+    for t in productores:
+        t.join()
+    while cola.size() > 0:
+        time.sleep(0.005)
+    for _ in consumidores:
+        cola.put(Tarea(None, 'B', time.time()))
+    for t in consumidores:
+        t.join()
+    resultados['tiempo'] = time.perf_counter() - tiempo_inicio
+    return resultados
+
+def main():
+    print("=== BENCHMARK: EDF CON CONTROL DE ADMISIÓN vs A>M>B + AGING BAJO SOBRECARGA ===")
+    print(f"{NUM_CONSUMIDORES} consumidores, {NUM_PRODUCTORES} productores durante {DURACION_PRODUCCION:.0f} s, "
+          f"procesamiento x{ESCALA}, deadline = creación + {HOLGURA} x procesamiento")
+    print("Incumplimiento = tareas terminadas después de su deadline + rechazadas, sobre las generadas")
+    print()
+    print("| Carga | Política            | Generadas | Rechazadas | A tiempo | Tarde | Incumplimiento (%) | A a tiempo (%) | Tareas/seg | A tiempo/seg |")
+    print("|-------|---------------------|-----------|------------|----------|-------|--------------------|----------------|------------|--------------|")
+    for carga in CARGAS:
+        for nombre, crear in crear_colas():
+            with silenciar_salida():
+                r = ejecutar(crear(), carga)
+            terminadas = r['a_tiempo'] + r['tarde']
+            incumplimiento = (r['tarde'] + r['rechazadas']) / r['generadas'] * 100
+            a_tiempo_a = r['a_tiempo_A'] / r['total_A'] * 100 if r['total_A'] else float('nan')
+            print(f"| {carga:5.1f} | {nombre:19} | {r['generadas']:9} | {r['rechazadas']:10} | {r['a_tiempo']:8} | {r['tarde']:5} | "
+                  f"{incumplimiento:18.1f} | {a_tiempo_a:14.1f} | {terminadas/r['tiempo']:10.1f} | {r['a_tiempo']/r['tiempo']:12.1f} |")
+
+if __name__ == "__main__":
+    main()
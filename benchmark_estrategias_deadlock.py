@@ -0,0 +1,98 @@
+import threading
+import time
+
+from deadlock_solucion import Cuenta, CuentaVersionada, OPERACIONES, ESTRATEGIAS, generar_transferencias
+
+# Parámetros de las cargas aleatorias
+NUM_THREADS = 16
+TRANSFERENCIAS_POR_THREAD = 200
+NUM_CUENTAS = 1000
+TIEMPO_PROCESAMIENTO = 0.001
+
+def percentil(valores, p):
+    """Percentil p (0-100) con interpolación lineal"""
+    ordenados = sorted(valores)
+    if len(ordenados) == 1:
+        return ordenados[0]
+    posicion = (len(ordenados) - 1) * p / 100
+    inferior = int(posicion)
+    superior = min(inferior + 1, len(ordenados) - 1)
+    return ordenados[inferior] + (ordenados[superior] - ordenados[inferior]) * (posicion - inferior)
+
+def ejecutar_carga(estrategia, num_cuentas, transferencias_por_thread, tiempo_procesamiento):
+    """Ejecuta un thread por lista de transferencias y mide latencia y reintentos por transferencia"""
+    transferir = ESTRATEGIAS[estrategia]
+    # La estrategia optimista necesita el contador de versión de CuentaVersionada
+    clase_cuenta = CuentaVersionada if estrategia == 'optimista' else Cuenta
+    cuentas = [clase_cuenta(i, 1000*(i+1)) for i in range(num_cuentas)]
+    saldo_inicial = sum(c.saldo for c in cuentas)
+    latencias = []
+    reintentos = []
+    exitosas = []
+
+    def trabajador(transferencias):
+        lat, rein, ok = [], 0, 0
+        for origen, destino, monto in transferencias:
+            inicio = time.perf_counter()
+            exito, r = transferir(cuentas, origen, destino, monto,
+                                  tiempo_procesamiento=tiempo_procesamiento, verbose=False)
+            lat.append(time.perf_counter() - inicio)
+            rein += r
+            ok += exito
+        latencias.extend(lat)
+        reintentos.append(rein)
+        exitosas.append(ok)
+
+    threads = [threading.Thread(target=trabajador, args=(t,), name=f"Thread-{i+1}")
+               for i, t in enumerate(transferencias_por_thread)]
+    tiempo_inicio = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    tiempo_total = time.perf_counter() - tiempo_inicio
+
+    return {
+        'estrategia': estrategia,
+        'transferencias': len(latencias),
+        'exitosas': sum(exitosas),
+        'tiempo': tiempo_total,
+        'throughput': len(latencias) / tiempo_total,
+        'p50_ms': percentil(latencias, 50) * 1000,
+        'p99_ms': percentil(latencias, 99) * 1000,
+        'reintentos': sum(reintentos),
+        'conservacion': sum(c.saldo for c in cuentas) == saldo_inicial
+    }
+
+def imprimir_tabla(titulo, resultados):
+    print(f"\n=== {titulo} ===")
+    print("| Estrategia   | Transf | Exitosas | Tiempo (s) | Transf/seg | p50 (ms) | p99 (ms) | Reintentos | Conservación |")
+    print("|--------------|--------|----------|------------|------------|----------|----------|------------|--------------|")
+    for r in resultados:
+        print(f"| {r['estrategia']:12} | {r['transferencias']:6} | {r['exitosas']:8} | {r['tiempo']:10.3f} | {r['throughput']:10.1f} | "
+              f"{r['p50_ms']:8.2f} | {r['p99_ms']:8.2f} | {r['reintentos']:10} | {'✅' if r['conservacion'] else '❌':12} |")
+
+def main():
+    print("=== BENCHMARK: ESTRATEGIAS SIN DEADLOCK (ORDENAMIENTO, TIMEOUT + BACKOFF, OPTIMISTA) ===")
+    print(f"Cargas aleatorias: {NUM_THREADS} threads x {TRANSFERENCIAS_POR_THREAD} transferencias, "
+          f"procesamiento simulado {TIEMPO_PROCESAMIENTO*1000:.0f} ms con el primer lock tomado")
+
+    # 1. Tabla del documento (5 cuentas, 10 threads, 50 ms de procesamiento como en main())
+    imprimir_tabla("TABLA DEL DOCUMENTO (30 TRANSFERENCIAS)",
+                   [ejecutar_carga(e, 5, OPERACIONES, 0.05) for e in ESTRATEGIAS])
+
+    # 2. Carga uniforme y cargas con cuentas calientes
+    cargas = [
+        ("CARGA UNIFORME", 0, 0.0),
+        ("CUENTAS CALIENTES (80% DEL TRÁFICO EN 8 CUENTAS)", 8, 0.8),
+        ("CUENTAS CALIENTES (95% DEL TRÁFICO EN 4 CUENTAS)", 4, 0.95),
+    ]
+    for titulo, calientes, prob in cargas:
+        transferencias = generar_transferencias(NUM_CUENTAS, NUM_THREADS * TRANSFERENCIAS_POR_THREAD, semilla=7,
+                                                cuentas_calientes=calientes, prob_caliente=prob)
+        por_thread = [transferencias[i::NUM_THREADS] for i in range(NUM_THREADS)]
+        imprimir_tabla(f"{titulo} - {NUM_CUENTAS} CUENTAS",
+                       [ejecutar_carga(e, NUM_CUENTAS, por_thread, TIEMPO_PROCESAMIENTO) for e in ESTRATEGIAS])
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+import sys
+import threading
+import time
+import random
+
+from race_condition_solucion import GestorInventarioSeguro, MODOS_LECTURA
+
+MEZCLAS_LECTURA = [0.5, 0.9, 0.99]  # Proporción de lecturas entre todas las operaciones
+NUM_THREADS = 8
+NUM_PRODUCTOS = 10
+DURACION = 1.0  # Segundos por combinación
+TIEMPO_PROCESAMIENTO = 0.0002  # Pausas de vender()/reabastecer() dentro de la sección crítica
+SNAPSHOTS_CONSISTENCIA = 200000
+
+def medir(modo_lectura, proporcion_lectura):
+    """
+    Cada thread elige en cada operación: lectura (snapshot_inventario(), el tablero que
+    muestra todo el inventario, o obtener_stock() de un producto) o escritura (vender()
+    o reabastecer()). Retorna lecturas/seg, escrituras/seg y la escritura más lenta.
+    """
+    inventario = GestorInventarioSeguro(NUM_PRODUCTOS, tiempo_procesamiento=TIEMPO_PROCESAMIENTO,
+                                        verbose=False, modo_lectura=modo_lectura)
+    detener = threading.Event()
+    resultados = [{'lecturas': 0, 'escrituras': 0, 'escritura_max': 0.0} for _ in range(NUM_THREADS)]
+
+    def trabajador(indice):
+        rng = random.Random(indice)
+        resultado = resultados[indice]
+        nombre = f"Thread-{indice+1}"
+        while not detener.is_set():
+            if rng.random() < proporcion_lectura:
+                if rng.random() < 0.5:
+                    inventario.snapshot_inventario()
+                else:
+                    inventario.obtener_stock(rng.randrange(NUM_PRODUCTOS))
+                resultado['lecturas'] += 1
+            else:
+                inicio = time.perf_counter()
+                if rng.random() < 0.5:
+                    inventario.vender(rng.randrange(NUM_PRODUCTOS), rng.randint(1, 5), nombre)
+                else:
+                    inventario.reabastecer(rng.randrange(NUM_PRODUCTOS), rng.randint(1, 5), nombre)
+                resultado['escritura_max'] = max(resultado['escritura_max'], time.perf_counter() - inicio)
+                resultado['escrituras'] += 1
+
+    threads = [threading.Thread(target=trabajador, args=(i,)) for i in range(NUM_THREADS)]
+    tiempo_inicio = time.perf_counter()
+    for t in threads:
+        t.start()
+    time.sleep(DURACION)
+    detener.set()
+    for t in threads:
+        t.join()
+    tiempo = time.perf_counter() - tiempo_inicio
+
+    lecturas = sum(r['lecturas'] for r in resultados)
+    escrituras = sum(r['escrituras'] for r in resultados)
+    escritura_max = max(r['escritura_max'] for r in resultados)
+    return lecturas / tiempo, escrituras / tiempo, escritura_max
+
+def contar_snapshots_inconsistentes(modo_lectura, snapshots=SNAPSHOTS_CONSISTENCIA):
+    """
+    Un thread confirma en bucle pedidos de una unidad de P0 y P1 (y repone ambos por lote),
+    así P0 y P1 siempre tienen el mismo stock fuera de una escritura. Con cambios de thread
+    cada microsegundo se cuentan los snapshot_inventario() con P0 != P1 (pedido a medias).
+    """
+    inventario = GestorInventarioSeguro(NUM_PRODUCTOS, tiempo_procesamiento=0, verbose=False,
+                                        modo_lectura=modo_lectura)
+    detener = threading.Event()
+
+    def escritor():
+        while not detener.is_set():
+            if not inventario.procesar_pedido([(0, 1), (1, 1)]):
+                inventario.reabastecer_lote([(0, 100), (1, 100)])
+
+    intervalo = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    hilo = threading.Thread(target=escritor)
+    hilo.start()
+    try:
+        inconsistentes = 0
+        for _ in range(snapshots):
+            stocks = inventario.snapshot_inventario()
+            if stocks[0] != stocks[1]:
+                inconsistentes += 1
+    finally:
+        detener.set()
+        hilo.join()
+        sys.setswitchinterval(intervalo)
+    return inconsistentes
+
+def main():
+    print("=== BENCHMARK: LECTURAS DEL INVENTARIO (MUTEX vs LECTORES/ESCRITOR vs SNAPSHOT) ===")
+    print(f"{NUM_THREADS} threads, {NUM_PRODUCTOS} productos, {DURACION:.1f} s por combinación, "
+          f"escrituras con 2 x {TIEMPO_PROCESAMIENTO*1000:.1f} ms de procesamiento bajo el lock")
+    print("Lecturas: mitad snapshot_inventario() (todo el inventario), mitad obtener_stock()")
+    print()
+    print("| Lecturas (%) | Modo de lectura   | Lecturas/seg | Escrituras/seg | Escritura más lenta (ms) |")
+    print("|--------------|-------------------|--------------|----------------|--------------------------|")
+    for proporcion in MEZCLAS_LECTURA:
+        for modo in MODOS_LECTURA:
+            lecturas, escrituras, escritura_max = medir(modo, proporcion)
+            print(f"| {proporcion*100:12.0f} | {modo:17} | {lecturas:12.0f} | {escrituras:14.0f} | {escritura_max*1000:24.2f} |")
+
+    print("\n=== CONSISTENCIA DE snapshot_inventario() CON PEDIDOS MULTI-PRODUCTO ===")
+    print(f"{SNAPSHOTS_CONSISTENCIA} snapshots mientras un thread procesa pedidos [(P0, 1), (P1, 1)]; se espera 0")
+    print("| Modo de lectura   | Snapshots con P0 != P1 |")
+    print("|-------------------|------------------------|")
+    for modo in MODOS_LECTURA:
+        print(f"| {modo:17} | {contar_snapshots_inconsistentes(modo):22} |")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+import threading
+import time
+import os
+import contextlib
+
+from deadlock_solucion import Cuenta, OPERACIONES, transferir_sin_deadlock, ejecutar_transferencias_sin_deadlock, generar_transferencias
+from ledger_cuentas import LedgerParticionado
+
+CLIENTES = [10, 100, 1000]
+TRANSFERENCIAS_TOTALES = 10000
+NUM_CUENTAS = 100
+NUM_PARTICIONES = 4
+TIEMPOS_PROCESAMIENTO = [0.0, 0.001]
+
+@contextlib.contextmanager
+def silenciar_salida():
+    """Descarta los prints de ejecutar_transferencias_sin_deadlock"""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+def crear_cuentas(num_cuentas):
+    return [Cuenta(i, 1000*(i+1)) for i in range(num_cuentas)]
+
+def ejecutar_clientes(transferir, num_clientes, transferencias):
+    """Cada cliente ejecuta su parte de las transferencias esperando el resultado de cada una"""
+    por_cliente = [transferencias[i::num_clientes] for i in range(num_clientes)]
+    exitosas = []
+
+    def cliente(transferencias_cliente):
+        exitosas.append(sum(1 for origen, destino, monto in transferencias_cliente if transferir(origen, destino, monto)))
+
+    threads = [threading.Thread(target=cliente, args=(t,), name=f"Cliente-{i+1}") for i, t in enumerate(por_cliente)]
+    tiempo_inicio = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - tiempo_inicio, sum(exitosas)
+
+def benchmark_drop_in():
+    """Tabla del documento ejecutada con ejecutar_transferencias_sin_deadlock(..., ledger=...)"""
+    print("=== TABLA DEL DOCUMENTO CON LEDGER (DROP-IN) ===")
+    cuentas = crear_cuentas(5)
+    ledger = LedgerParticionado(cuentas, num_particiones=2, tiempo_procesamiento=0.05)
+    threads = [threading.Thread(target=ejecutar_transferencias_sin_deadlock, args=(cuentas, ops),
+                                kwargs={'ledger': ledger}, name=f"Thread-{i+1}")
+               for i, ops in enumerate(OPERACIONES)]
+    tiempo_inicio = time.perf_counter()
+    with silenciar_salida():
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    ledger.detener()
+    tiempo_total = time.perf_counter() - tiempo_inicio
+    saldo_final = sum(c.saldo for c in cuentas)
+    print(f"Tiempo: {tiempo_total*1000:.2f} ms | Mensajes por lote: {ledger.estadisticas()['mensajes_por_lote']:.1f}")
+    print(f"Conservación de dinero: {'✅ CORRECTO' if saldo_final == 15000 else '❌ ERROR'} (${saldo_final})")
+
+def benchmark_clientes():
+    print(f"\n=== TRANSFERENCIAS/SEG vs CLIENTES ({TRANSFERENCIAS_TOTALES} transferencias, {NUM_CUENTAS} cuentas) ===")
+    print("Procesamiento simulado: por transferencia en ordenamiento, por lote en el ledger")
+    print("| Procesamiento | Clientes | Modo                    | Tiempo (s) | Transf/seg | Exitosas | Msgs/lote | Conservación |")
+    print("|---------------|----------|-------------------------|------------|------------|----------|-----------|--------------|")
+
+    transferencias = generar_transferencias(NUM_CUENTAS, TRANSFERENCIAS_TOTALES, semilla=11)
+    saldo_inicial = sum(1000*(i+1) for i in range(NUM_CUENTAS))
+
+    for tiempo_procesamiento in TIEMPOS_PROCESAMIENTO:
+        for num_clientes in CLIENTES:
+            # Ordenamiento de locks (transferir_sin_deadlock)
+            cuentas = crear_cuentas(NUM_CUENTAS)
+            tiempo, exitosas = ejecutar_clientes(
+                lambda o, d, m: transferir_sin_deadlock(cuentas, o, d, m, tiempo_procesamiento=tiempo_procesamiento, verbose=False)[0],
+                num_clientes, transferencias)
+            conservacion = "✅" if sum(c.saldo for c in cuentas) == saldo_inicial else "❌"
+            print(f"| {tiempo_procesamiento*1000:10.1f} ms | {num_clientes:8} | {'Ordenamiento de locks':23} | {tiempo:10.3f} | "
+                  f"{TRANSFERENCIAS_TOTALES/tiempo:10.0f} | {exitosas:8} | {'-':>9} | {conservacion:12} |")
+
+            # Ledger con escritor único por partición
+            cuentas = crear_cuentas(NUM_CUENTAS)
+            ledger = LedgerParticionado(cuentas, NUM_PARTICIONES, tiempo_procesamiento=tiempo_procesamiento)
+            tiempo, exitosas = ejecutar_clientes(lambda o, d, m: ledger.transferir(o, d, m).result(),
+                                                 num_clientes, transferencias)
+            ledger.detener()
+            conservacion = "✅" if sum(c.saldo for c in cuentas) == saldo_inicial else "❌"
+            modo = f"Ledger ({NUM_PARTICIONES} particiones)"
+            print(f"| {tiempo_procesamiento*1000:10.1f} ms | {num_clientes:8} | {modo:23} | {tiempo:10.3f} | "
+                  f"{TRANSFERENCIAS_TOTALES/tiempo:10.0f} | {exitosas:8} | {ledger.estadisticas()['mensajes_por_lote']:9.1f} | {conservacion:12} |")
+
+def main():
+    print("=== BENCHMARK: LEDGER CON ESCRITOR ÚNICO POR PARTICIÓN vs ORDENAMIENTO DE LOCKS ===")
+    print()
+    benchmark_drop_in()
+    benchmark_clientes()
+
+if __name__ == "__main__":
+    main()
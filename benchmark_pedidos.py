@@ -0,0 +1,92 @@
+import threading
+import time
+import random
+
+from race_condition_solucion import GestorInventarioSeguro, GestorInventarioAtomico
+
+TAMANOS_CANASTA = [1, 10, 100]
+ITEMS_POR_THREAD = 20000
+NUM_THREADS = 8
+NUM_PRODUCTOS = 1000
+PROPORCION_REABASTECIMIENTO = 0.3  # Pedidos de reabastecimiento entre todos los pedidos
+
+def generar_pedidos(tamano_canasta, semilla):
+    """Pedidos de venta o reabastecimiento con tamano_canasta líneas (producto, cantidad)"""
+    rng = random.Random(semilla)
+    pedidos = []
+    for _ in range(ITEMS_POR_THREAD // tamano_canasta):
+        es_reabastecimiento = rng.random() < PROPORCION_REABASTECIMIENTO
+        lineas = [(rng.randrange(NUM_PRODUCTOS), rng.randint(1, 5)) for _ in range(tamano_canasta)]
+        pedidos.append((es_reabastecimiento, lineas))
+    return pedidos
+
+def por_item(inventario, pedidos, resultado):
+    """Loop de vender()/reabastecer() por línea: cada línea es independiente"""
+    nombre = threading.current_thread().name
+    for es_reabastecimiento, lineas in pedidos:
+        if es_reabastecimiento:
+            for producto_id, cantidad in lineas:
+                inventario.reabastecer(producto_id, cantidad, nombre)
+                resultado['reabastecido'] += cantidad
+            continue
+        vendidas = 0
+        for producto_id, cantidad in lineas:
+            if inventario.vender(producto_id, cantidad, nombre):
+                resultado['vendido'] += cantidad
+                vendidas += 1
+        resultado['completos'] += vendidas == len(lineas)
+        resultado['parciales'] += 0 < vendidas < len(lineas)
+
+def por_pedido(inventario, pedidos, resultado):
+    """procesar_pedido()/reabastecer_lote(): un pedido completo o nada"""
+    nombre = threading.current_thread().name
+    for es_reabastecimiento, lineas in pedidos:
+        if es_reabastecimiento:
+            inventario.reabastecer_lote(lineas, nombre)
+            resultado['reabastecido'] += sum(cantidad for _, cantidad in lineas)
+        elif inventario.procesar_pedido(lineas, nombre):
+            resultado['vendido'] += sum(cantidad for _, cantidad in lineas)
+            resultado['completos'] += 1
+
+def medir(clase_gestor, ejecutor, tamano_canasta):
+    inventario = clase_gestor(NUM_PRODUCTOS, tiempo_procesamiento=0, verbose=False)
+    stock_inicial = sum(inventario.obtener_stock(i) for i in range(NUM_PRODUCTOS))
+    cargas = [generar_pedidos(tamano_canasta, semilla) for semilla in range(NUM_THREADS)]
+    resultados = [{'vendido': 0, 'reabastecido': 0, 'completos': 0, 'parciales': 0} for _ in range(NUM_THREADS)]
+
+    threads = [threading.Thread(target=ejecutor, args=(inventario, carga, resultado), name=f"Thread-{i+1}")
+               for i, (carga, resultado) in enumerate(zip(cargas, resultados))]
+    tiempo_inicio = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    tiempo = time.perf_counter() - tiempo_inicio
+
+    total = {clave: sum(r[clave] for r in resultados) for clave in resultados[0]}
+    stock_final = sum(inventario.obtener_stock(i) for i in range(NUM_PRODUCTOS))
+    conservacion = stock_final == stock_inicial + total['reabastecido'] - total['vendido']
+    items = sum(len(lineas) for carga in cargas for _, lineas in carga)
+    return items / tiempo, total['completos'], total['parciales'], conservacion
+
+def main():
+    print("=== BENCHMARK: PEDIDOS DE VARIOS PRODUCTOS vs LOOP POR ÍTEM ===")
+    print(f"{NUM_THREADS} threads x {ITEMS_POR_THREAD} líneas, {NUM_PRODUCTOS} productos (stock 100), "
+          f"{PROPORCION_REABASTECIMIENTO:.0%} de pedidos de reabastecimiento, sin procesamiento simulado ni prints")
+    print()
+    print("| Canasta | Modo                               | Ítems/seg | Pedidos completos | Pedidos parciales | Conservación |")
+    print("|---------|------------------------------------|-----------|-------------------|-------------------|--------------|")
+    modos = [
+        ("vender() por ítem (mutex)", GestorInventarioSeguro, por_item),
+        ("procesar_pedido() (mutex)", GestorInventarioSeguro, por_pedido),
+        ("vender() por ítem (atómico)", GestorInventarioAtomico, por_item),
+        ("procesar_pedido() (atómico)", GestorInventarioAtomico, por_pedido),
+    ]
+    for tamano in TAMANOS_CANASTA:
+        for nombre, clase_gestor, ejecutor in modos:
+            items_seg, completos, parciales, conservacion = medir(clase_gestor, ejecutor, tamano)
+            print(f"| {tamano:7} | {nombre:34} | {items_seg:9.0f} | {completos:17} | {parciales:17} | "
+                  f"{'✅' if conservacion else '❌':12} |")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+import threading
+import time
+import random
+import os
+import contextlib
+import statistics
+
+from starvation_solucion import (Tarea, ColaConAging, ColaPlanificada, PoliticaDRR,
+                                 PoliticaPrioridadEstricta, generar_secuencias)
+
+# Pesos A/M/B de Deficit Round Robin
+PESOS = {'A': 4, 'M': 2, 'B': 1}
+NUM_CONSUMIDORES = 3
+# Escala del tiempo de procesamiento de cada tarea (0.2/0.25/0.3 s en main())
+ESCALA_DOCUMENTO = 1.0
+# Sobrecarga sintética: productores sin pausa contra consumidores más lentos
+PRODUCTORES_SOBRECARGA = 4
+TAREAS_POR_PRODUCTOR_SOBRECARGA = 150
+MEZCLA_SOBRECARGA = (0.5, 0.3)  # 50% A, 30% M, 20% B
+ESCALA_SOBRECARGA = 0.02
+
+@contextlib.contextmanager
+def silenciar_salida():
+    """Descarta los prints de aging y forzado de ColaConAging"""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+def crear_colas():
+    return [
+        ("Prioridad estricta", lambda: ColaPlanificada(PoliticaPrioridadEstricta())),
+        ("Aging (ColaConAging)", lambda: ColaConAging(capacidad_maxima=20)),
+        (f"DRR {PESOS['A']}:{PESOS['M']}:{PESOS['B']}", lambda: ColaPlanificada(PoliticaDRR(PESOS))),
+    ]
+
+def secuencias_sobrecarga(semilla=3):
+    rng = random.Random(semilla)
+    prob_a, prob_m = MEZCLA_SOBRECARGA
+    secuencias = []
+    for _ in range(PRODUCTORES_SOBRECARGA):
+        secuencia = []
+        for _ in range(TAREAS_POR_PRODUCTOR_SOBRECARGA):
+            r = rng.random()
+            secuencia.append('A' if r < prob_a else ('M' if r < prob_a + prob_m else 'B'))
+        secuencias.append(secuencia)
+    return secuencias
+
+def ejecutar(cola, secuencias, pausa_produccion, escala):
+    """Productores con las secuencias dadas y consumidores que registran la espera por clase"""
+    esperas = {'A': [], 'M': [], 'B': []}
+    lock_esperas = threading.Lock()
+
+    def productor(indice, secuencia):
+        for i, prioridad in enumerate(secuencia):
+            tarea = Tarea(f"{indice}-{i+1}", prioridad, time.time())
+            tarea.clase = prioridad  # ColaConAging sobrescribe prioridad al promover
+            cola.put(tarea)
+            if pausa_produccion:
+                time.sleep(pausa_produccion)
+
+    def consumidor():
+        while True:
+            tarea = cola.get()
+            if tarea.id is None:
+                return
+            espera = time.time() - tarea.tiempo_creacion
+            time.sleep(tarea.tiempo_procesamiento * escala)
+            with lock_esperas:
+                esperas[tarea.clase].append(espera)
+
+    productores = [threading.Thread(target=productor, args=(i+1, s)) for i, s in enumerate(secuencias)]
+    consumidores = [threading.Thread(target=consumidor) for _ in range(NUM_CONSUMIDORES)]
+    tiempo_inicio = time.perf_counter()
+    for t in consumidores + productores:
+        t.start()
+    for t in productores:
+        t.join()
+    while cola.size() > 0:
+        time.sleep(0.001)
+    for _ in consumidores:
+        cola.put(Tarea(None, 'A', time.time()))
+    for t in consumidores:
+        t.join()
+    tiempo_total = time.perf_counter() - tiempo_inicio
+
+    total = sum(len(v) for v in esperas.values())
+    resultado = {'tareas': total, 'throughput': total / tiempo_total}
+    for clase, valores in esperas.items():
+        if len(valores) > 1:
+            cuantiles = statistics.quantiles(valores, n=100, method='inclusive')
+            resultado[clase] = (cuantiles[49] * 1000, cuantiles[94] * 1000, cuantiles[98] * 1000)
+        else:
+            resultado[clase] = tuple([valores[0] * 1000] * 3) if valores else (float('nan'),) * 3
+    resultado['max_b'] = max(esperas['B']) * 1000 if esperas['B'] else float('nan')
+    return resultado
+
+def imprimir_tabla(titulo, secuencias, pausa_produccion, escala):
+    print(f"\n=== {titulo} ===")
+    print("| Política             | Tareas | Tareas/seg | A p50/p95/p99 (ms)   | M p50/p95/p99 (ms)   | B p50/p95/p99 (ms)   | Máx B (ms) |")
+    print("|----------------------|--------|------------|----------------------|----------------------|----------------------|------------|")
+    for nombre, crear in crear_colas():
+        with silenciar_salida():
+            r = ejecutar(crear(), secuencias, pausa_produccion, escala)
+        clases = " | ".join(f"{'/'.join(f'{v:.0f}' for v in r[c]):20}" for c in ('A', 'M', 'B'))
+        print(f"| {nombre:20} | {r['tareas']:6} | {r['throughput']:10.1f} | {clases} | {r['max_b']:10.0f} |")
+
+def main():
+    print("=== BENCHMARK: POLÍTICAS DE PLANIFICACIÓN (PRIORIDAD ESTRICTA, AGING, DEFICIT ROUND ROBIN) ===")
+    print(f"{NUM_CONSUMIDORES} consumidores | Espera = desde la creación de la tarea hasta que un consumidor la obtiene")
+    politica = PoliticaDRR(PESOS)
+    print(f"DRR: pesos {PESOS}, quantum {politica.quantum} s; cota de una ronda para B: "
+          f"{politica.cota_ronda('B'):.1f} s de procesamiento de otras clases")
+
+    imprimir_tabla(f"SECUENCIAS DE main() (30 TAREAS + 6 ALEATORIAS, PROCESAMIENTO x{ESCALA_DOCUMENTO})",
+                   generar_secuencias(random.Random(1)), 0.05, ESCALA_DOCUMENTO)
+    total = PRODUCTORES_SOBRECARGA * TAREAS_POR_PRODUCTOR_SOBRECARGA
+    imprimir_tabla(f"SOBRECARGA SINTÉTICA ({total} TAREAS SIN PAUSA, 50% A / 30% M / 20% B, PROCESAMIENTO x{ESCALA_SOBRECARGA})",
+                   secuencias_sobrecarga(), 0.0, ESCALA_SOBRECARGA)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+import threading
+import time
+import tempfile
+import contextlib
+
+from registro_eventos import RegistroEventos
+from race_condition_solucion import GestorInventarioSeguro, generar_carga, ejecutar_carga
+from deadlock_solucion import Cuenta, transferir_sin_deadlock, generar_transferencias
+
+NUM_THREADS = 8
+OPERACIONES_POR_THREAD = 5000
+MODOS = ['sin mensajes', 'print', 'registro', 'registro + escritor']
+
+class LockCronometrado:
+    """Lock que acumula cuánto tiempo se lo retiene (solo el dueño actualiza sus campos)"""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.adquirido = 0
+        self.retencion_total = 0
+        self.retencion_maxima = 0
+        self.adquisiciones = 0
+
+    def acquire(self):
+        self.lock.acquire()
+        self.adquirido = time.perf_counter_ns()
+        return True
+
+    def release(self):
+        retencion = time.perf_counter_ns() - self.adquirido
+        self.retencion_total += retencion
+        self.adquisiciones += 1
+        if retencion > self.retencion_maxima:
+            self.retencion_maxima = retencion
+        self.lock.release()
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, *exc):
+        self.release()
+
+def resumen_locks(locks):
+    total = sum(lock.retencion_total for lock in locks)
+    adquisiciones = sum(lock.adquisiciones for lock in locks)
+    return total / adquisiciones / 1000, max(lock.retencion_maxima for lock in locks) / 1000
+
+@contextlib.contextmanager
+def configurar_salida(modo, archivo):
+    """Retorna el registro del modo (o None) y envía prints y volcados a archivo"""
+    registro = RegistroEventos(capacidad_por_thread=65536) if modo.startswith('registro') else None
+    with contextlib.redirect_stdout(archivo):
+        if modo == 'registro + escritor':
+            registro.iniciar_escritor(archivo)
+        yield registro
+        if modo == 'registro + escritor':
+            registro.detener_escritor()
+
+def medir_inventario(modo):
+    carga = generar_carga(10, NUM_THREADS, OPERACIONES_POR_THREAD, semilla=1)
+    with tempfile.TemporaryFile('w+', encoding='utf-8', errors='replace') as archivo:
+        with configurar_salida(modo, archivo) as registro:
+            inventario = GestorInventarioSeguro(10, tiempo_procesamiento=0, verbose=(modo == 'print'), registro=registro)
+            inventario.mutex_productos = [LockCronometrado() for _ in inventario.productos]
+            tiempo = ejecutar_carga(inventario, carga)
+        # El volcado final (sin escritor) queda fuera del tiempo de ejecución medido
+        inicio_volcado = time.perf_counter()
+        if registro is not None:
+            registro.volcar(archivo)
+        volcado = time.perf_counter() - inicio_volcado
+        archivo.seek(0)
+        lineas = sum(1 for _ in archivo)
+    return tiempo, volcado, *resumen_locks(inventario.mutex_productos), lineas
+
+def medir_transferencias(modo):
+    cargas = [generar_transferencias(5, OPERACIONES_POR_THREAD // 5, monto_maximo=300, semilla=i) for i in range(NUM_THREADS)]
+    cuentas = [Cuenta(i, 10**6) for i in range(5)]
+    for cuenta in cuentas:
+        cuenta.lock = LockCronometrado()
+    with tempfile.TemporaryFile('w+', encoding='utf-8', errors='replace') as archivo:
+        with configurar_salida(modo, archivo) as registro:
+            def thread(transferencias):
+                for origen, destino, monto in transferencias:
+                    transferir_sin_deadlock(cuentas, origen, destino, monto, tiempo_procesamiento=0,
+                                            verbose=(modo == 'print'), registro=registro)
+            threads = [threading.Thread(target=thread, args=(carga,)) for carga in cargas]
+            tiempo_inicio = time.perf_counter()
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            tiempo = time.perf_counter() - tiempo_inicio
+        inicio_volcado = time.perf_counter()
+        if registro is not None:
+            registro.volcar(archivo)
+        volcado = time.perf_counter() - inicio_volcado
+        archivo.seek(0)
+        lineas = sum(1 for _ in archivo)
+    return tiempo, volcado, *resumen_locks([cuenta.lock for cuenta in cuentas]), lineas
+
+def imprimir_tabla(titulo, medir):
+    print(f"=== {titulo} ===")
+    print("| Mensajes            | Ejecución (s) | Volcado final (s) | Retención media del lock (µs) | Retención máx. (µs) | Líneas |")
+    print("|---------------------|---------------|-------------------|-------------------------------|---------------------|--------|")
+    for modo in MODOS:
+        tiempo, volcado, media, maxima, lineas = medir(modo)
+        print(f"| {modo:19} | {tiempo:13.3f} | {volcado:17.3f} | {media:29.2f} | {maxima:19.1f} | {lineas:6} |")
+    print()
+
+def main():
+    print("=== BENCHMARK: print() vs REGISTRO DE EVENTOS EN BUFFERS POR THREAD ===")
+    print(f"{NUM_THREADS} threads, sin procesamiento simulado; la salida va a un archivo temporal "
+          "(en una terminal print() es aún más lento)")
+    print()
+    imprimir_tabla(f"INVENTARIO: {NUM_THREADS} x {OPERACIONES_POR_THREAD} operaciones sobre 10 productos", medir_inventario)
+    imprimir_tabla(f"TRANSFERENCIAS SIN DEADLOCK: {NUM_THREADS} x {OPERACIONES_POR_THREAD // 5} transferencias entre 5 cuentas",
+                   medir_transferencias)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import argparse
+import os
+import time
+
+from ejecucion_paralela import ejecutar_en_paralelo, ejecutar_silenciado, resumir_resultados
+from exportador_resultados import ExportadorResultados, FORMATOS, formatos_disponibles, identificador_corrida
+from race_condition_con_problema import ejecutar_simulacion
+from race_condition_solucion import ejecutar_simulacion_segura
+
+# (nombre, función, escenario de --exportar)
+VERSIONES = [
+    ("Con race condition", ejecutar_simulacion, "repeticiones_con_problema"),
+    ("Sin race condition", ejecutar_simulacion_segura, "repeticiones_solucion"),
+]
+RESULTADOS_MOSTRADOS = 10
+
+def medir_en_serie(funcion, ejecuciones):
+    """Segundos por ejecución corriendo en serie en este proceso, sin la pausa de 1 s de main()"""
+    tiempo_inicio = time.perf_counter()
+    for i in range(1, ejecuciones + 1):
+        ejecutar_silenciado(funcion, i)
+    return (time.perf_counter() - tiempo_inicio) / ejecuciones
+
+def main():
+    parser = argparse.ArgumentParser(description="Cientos de ejecuciones independientes repartidas en un pool de procesos")
+    parser.add_argument('--ejecuciones', type=int, default=200)
+    parser.add_argument('--procesos', type=int, default=os.cpu_count())
+    parser.add_argument('--metodo-inicio', choices=('spawn', 'fork', 'forkserver'), default='spawn')
+    parser.add_argument('--ejecuciones-serie', type=int, default=10, help="ejecuciones en serie para estimar la aceleración")
+    parser.add_argument('--exportar', help="directorio donde agregar cada ejecución (CSV/Parquet y resultados.xlsx)")
+    parser.add_argument('--formatos', nargs='+', choices=FORMATOS, default=formatos_disponibles())
+    opciones = parser.parse_args()
+    exportador = ExportadorResultados(opciones.exportar, opciones.formatos) if opciones.exportar else None
+    corrida = identificador_corrida()
+
+    print("=== EJECUCIONES REPETIDAS EN PARALELO (UN PROCESO NUEVO POR EJECUCIÓN) ===")
+    print(f"Ejecuciones por versión: {opciones.ejecuciones} | Procesos: {opciones.procesos} | "
+          f"Inicio: {opciones.metodo_inicio} | CPUs: {os.cpu_count()}")
+
+    print("\n=== FRECUENCIA DE RESULTADOS CORRECTOS (P0=120, P5=110) ===")
+    print("| Versión            | Correctas | Tasa    | IC 95% (Wilson)   | Resultados distintos | Tiempo/ejec. (ms) | Total paralelo (s) | Serie estimada (s) | Aceleración |")
+    print("|--------------------|-----------|---------|-------------------|----------------------|-------------------|--------------------|--------------------|-------------|")
+    resumenes = []
+    for nombre, funcion, escenario in VERSIONES:
+        tiempo_inicio = time.perf_counter()
+        resultados = ejecutar_en_paralelo(funcion, opciones.ejecuciones, opciones.procesos, opciones.metodo_inicio)
+        total = time.perf_counter() - tiempo_inicio
+        # La versión en serie de main() agrega 1 s de pausa entre ejecuciones
+        serie = medir_en_serie(funcion, opciones.ejecuciones_serie) * opciones.ejecuciones + (opciones.ejecuciones - 1)
+        r = resumir_resultados(resultados)
+        if exportador is not None:
+            exportador.agregar_muchas(escenario, ({'corrida': corrida, **resultado} for resultado in resultados))
+        resumenes.append((nombre, r))
+        inferior, superior = r['intervalo_correctas']
+        print(f"| {nombre:18} | {r['correctas']:9} | {r['tasa_correctas']:7.1%} | {inferior:7.1%} - {superior:7.1%} | "
+              f"{len(r['distribucion']):20} | {r['tiempo_promedio']*1000:17.1f} | {total:18.2f} | {serie:18.1f} | {serie/total:10.1f}x |")
+
+    for nombre, r in resumenes:
+        print(f"\n=== {nombre.upper()}: RESULTADOS MÁS FRECUENTES ===")
+        print("| Stock P0 | Stock P5 | Ejecuciones | Porcentaje |")
+        print("|----------|----------|-------------|------------|")
+        for (stock_0, stock_5), cantidad in r['distribucion'].most_common(RESULTADOS_MOSTRADOS):
+            print(f"| {stock_0:8} | {stock_5:8} | {cantidad:11} | {cantidad / r['ejecuciones']:10.1%} |")
+        print(f"Stock P0 observado: {min(r['stock_producto_0'])} - {max(r['stock_producto_0'])} | "
+              f"Stock P5 observado: {min(r['stock_producto_5'])} - {max(r['stock_producto_5'])}")
+
+    if exportador is not None:
+        if 'xlsx' in opciones.formatos:
+            exportador.exportar_xlsx(os.path.join(opciones.exportar, "resultados.xlsx"))
+        exportador.cerrar()
+        print(f"\nEjecuciones agregadas en {opciones.exportar} ({', '.join(opciones.formatos)})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import time
+
+from starvation_solucion import PoliticaAging, PoliticaPrioridadEstricta, PoliticaDRR
+from simulacion_virtual import (
+    ejecutar_virtual,
+    simular_transferencias,
+    simular_starvation,
+    ejecutar_inventario_repetido,
+    DeadlockVirtual,
+)
+
+SEMILLAS_STARVATION = 50
+SEMILLAS_DEADLOCK = 200
+REPETICIONES_INVENTARIO = 1000
+CONSUMIDORES = [1, 2, 3, 4, 6]
+POLITICAS = [('Aging', PoliticaAging), ('Prioridad estricta', PoliticaPrioridadEstricta), ('DRR', PoliticaDRR)]
+# Retardo máximo de arranque de cada thread simulado (s)
+RETARDOS_DEADLOCK = [0.0, 0.1, 0.5, 1.0, 2.0]
+RETARDOS_INVENTARIO = [0.0, 0.001, 0.002, 0.004, 0.008]
+
+def barrido_starvation():
+    print("=== PUNTO 2.2: CONSUMIDORES x POLÍTICA (VENTANA DE 10 s) ===")
+    print(f"Promedios sobre {SEMILLAS_STARVATION} semillas de las secuencias aleatorias")
+    print("Espera de las tareas B por clase original (las B promovidas a M por aging también cuentan)")
+    print()
+    print("| Consumidores | Política           | Tareas procesadas | Tareas B en espera | Espera media B (s) | Espera máx. B (s) | Tiempo real (ms) |")
+    print("|--------------|--------------------|-------------------|--------------------|--------------------|-------------------|------------------|")
+    for consumidores in CONSUMIDORES:
+        for nombre, politica in POLITICAS:
+            procesadas = en_espera = 0
+            esperas_b = []
+            inicio = time.perf_counter()
+            for semilla in range(SEMILLAS_STARVATION):
+                stats, _ = ejecutar_virtual(simular_starvation(semilla, consumidores, politica=politica()))
+                procesadas += stats['A_procesadas'] + stats['M_procesadas'] + stats['B_procesadas']
+                en_espera += stats['estado_final']['B']
+                esperas_b.extend(stats['espera_por_clase']['B'])
+            real = (time.perf_counter() - inicio) * 1000
+            print(f"| {consumidores:12} | {nombre:18} | {procesadas / SEMILLAS_STARVATION:17.1f} | "
+                  f"{en_espera / SEMILLAS_STARVATION:18.1f} | {sum(esperas_b) / len(esperas_b):18.2f} | "
+                  f"{max(esperas_b):17.2f} | {real:16.1f} |")
+
+def barrido_deadlock():
+    print("\n=== PUNTO 2.1: PROBABILIDAD DE DEADLOCK SIN ORDEN DE LOCKS ===")
+    print(f"{SEMILLAS_DEADLOCK} semillas por retardo de arranque")
+    print()
+    print("| Retardo máx. de arranque (s) | Ejecuciones con deadlock | Instante medio del deadlock (s) | Tiempo real (ms) |")
+    print("|------------------------------|--------------------------|---------------------------------|------------------|")
+    for retardo in RETARDOS_DEADLOCK:
+        instantes = []
+        inicio = time.perf_counter()
+        for semilla in range(SEMILLAS_DEADLOCK):
+            try:
+                ejecutar_virtual(simular_transferencias(ordenar_locks=False, tiempo_procesamiento=0.1, pausa=0.05,
+                                                        retardo_maximo=retardo, semilla=semilla))
+            except DeadlockVirtual as e:
+                instantes.append(e.tiempo)
+        real = (time.perf_counter() - inicio) * 1000
+        medio = sum(instantes) / len(instantes) if instantes else float('nan')
+        print(f"| {retardo:28.2f} | {len(instantes):24} | {medio:31.3f} | {real:16.1f} |")
+
+def barrido_inventario():
+    print("\n=== PUNTO 2.3: RESULTADOS DE LA VERSIÓN CON RACE CONDITION ===")
+    print(f"{REPETICIONES_INVENTARIO} ejecuciones por retardo de arranque (la versión con mutex siempre da 120/110)")
+    print()
+    print("| Retardo máx. de arranque (s) | Correctas | Resultados (P0, P5) más frecuentes        | Tiempo virtual (s) | Tiempo real (s) |")
+    print("|------------------------------|-----------|-------------------------------------------|--------------------|-----------------|")
+    for retardo in RETARDOS_INVENTARIO:
+        inicio = time.perf_counter()
+        correctas, resultados, tiempo_virtual = ejecutar_inventario_repetido(
+            REPETICIONES_INVENTARIO, version='con_race_condition', retardo_maximo=retardo)
+        real = time.perf_counter() - inicio
+        frecuentes = ", ".join(f"{p0}/{p5}: {n}" for (p0, p5), n in resultados.most_common(3))
+        print(f"| {retardo:28.4f} | {correctas:9} | {frecuentes:41} | {tiempo_virtual:18.1f} | {real:15.2f} |")
+
+def main():
+    print("=== BENCHMARK: BARRIDOS DE PARÁMETROS CON RELOJ VIRTUAL ===\n")
+    barrido_starvation()
+    barrido_deadlock()
+    barrido_inventario()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+import threading
+import time
+import random
+import statistics
+
+from deadlock_solucion import Cuenta, CuentaMultiversion, RegistroVersiones, transferir_sin_deadlock
+
+NUM_CUENTAS = 1000
+NUM_THREADS = 8
+DURACION = 2.0
+INTERVALO_SNAPSHOT = 0.02
+TIEMPO_PROCESAMIENTO = 0.0005
+
+def snapshot_deteniendo_todo(cuentas):
+    """Referencia: instantánea tomando todos los locks en orden ascendente (detiene las transferencias)"""
+    tiempo_inicio = time.perf_counter()
+    for cuenta in cuentas:
+        cuenta.lock.acquire()
+    try:
+        saldos = [cuenta.saldo for cuenta in cuentas]
+    finally:
+        for cuenta in reversed(cuentas):
+            cuenta.lock.release()
+    return {'saldos': saldos, 'total': sum(saldos), 'latencia': time.perf_counter() - tiempo_inicio}
+
+def ejecutar_escenario(cuentas, tomar_snapshot):
+    """Transferencias continuas durante DURACION segundos con instantáneas periódicas opcionales"""
+    saldo_inicial = sum(c.saldo for c in cuentas)
+    contadores = [0] * NUM_THREADS
+    detener = threading.Event()
+
+    def trabajador(indice):
+        rng = random.Random(indice)
+        while not detener.is_set():
+            origen = rng.randrange(NUM_CUENTAS)
+            destino = (origen + rng.randrange(1, NUM_CUENTAS)) % NUM_CUENTAS
+            transferir_sin_deadlock(cuentas, origen, destino, rng.randint(1, 500),
+                                    tiempo_procesamiento=TIEMPO_PROCESAMIENTO, verbose=False)
+            contadores[indice] += 1
+
+    threads = [threading.Thread(target=trabajador, args=(i,), name=f"Thread-{i+1}") for i in range(NUM_THREADS)]
+    for t in threads:
+        t.start()
+
+    snapshots = []
+    tiempo_inicio = time.perf_counter()
+    while time.perf_counter() - tiempo_inicio < DURACION:
+        time.sleep(INTERVALO_SNAPSHOT)
+        if tomar_snapshot is not None:
+            snapshots.append(tomar_snapshot(cuentas))
+    detener.set()
+    for t in threads:
+        t.join()
+    tiempo_total = time.perf_counter() - tiempo_inicio
+
+    resultado = {
+        'throughput': sum(contadores) / tiempo_total,
+        'snapshots': len(snapshots),
+        'correctos': sum(1 for s in snapshots if s['total'] == saldo_inicial),
+        'conservacion_final': sum(c.saldo for c in cuentas) == saldo_inicial
+    }
+    if snapshots:
+        latencias = [s['latencia'] for s in snapshots]
+        cuantiles = statistics.quantiles(latencias, n=100, method='inclusive') if len(latencias) > 1 else latencias * 99
+        resultado['latencia_p50_ms'] = cuantiles[49] * 1000
+        resultado['latencia_p99_ms'] = cuantiles[98] * 1000
+        resultado['latencia_max_ms'] = max(latencias) * 1000
+    return resultado
+
+def main():
+    print("=== BENCHMARK: INSTANTÁNEA CONSISTENTE DEL SALDO GLOBAL CON TRANSFERENCIAS EN CURSO ===")
+    print(f"{NUM_THREADS} threads transfiriendo durante {DURACION:.0f} s entre {NUM_CUENTAS} cuentas "
+          f"({TIEMPO_PROCESAMIENTO*1000:.1f} ms de procesamiento con el primer lock tomado), "
+          f"instantánea cada {INTERVALO_SNAPSHOT*1000:.0f} ms")
+    print()
+
+    # (nombre, resultado, throughput de referencia sin instantáneas)
+    escenarios = []
+    cuentas = [Cuenta(i, 1000*(i+1)) for i in range(NUM_CUENTAS)]
+    base_cuenta = ejecutar_escenario(cuentas, None)
+    escenarios.append(("Cuenta, sin instantáneas", base_cuenta, base_cuenta['throughput']))
+
+    registro = RegistroVersiones()
+    cuentas = [CuentaMultiversion(i, 1000*(i+1), registro) for i in range(NUM_CUENTAS)]
+    base_multiversion = ejecutar_escenario(cuentas, None)
+    escenarios.append(("Multiversión, sin instantáneas", base_multiversion, base_cuenta['throughput']))
+
+    registro = RegistroVersiones()
+    cuentas = [CuentaMultiversion(i, 1000*(i+1), registro) for i in range(NUM_CUENTAS)]
+    escenarios.append(("Multiversión + MVCC", ejecutar_escenario(cuentas, registro.snapshot), base_multiversion['throughput']))
+
+    cuentas = [Cuenta(i, 1000*(i+1)) for i in range(NUM_CUENTAS)]
+    escenarios.append(("Cuenta + todos los locks", ejecutar_escenario(cuentas, snapshot_deteniendo_todo), base_cuenta['throughput']))
+
+    print("| Escenario                      | Transf/seg | Caída vs base (%) | Snapshots | Correctos | p50 (ms) | p99 (ms) | Máx (ms) | Conservación |")
+    print("|--------------------------------|------------|-------------------|-----------|-----------|----------|----------|----------|--------------|")
+    for nombre, r, base in escenarios:
+        caida = (1 - r['throughput'] / base) * 100
+        if r['snapshots']:
+            detalle = (f"{r['snapshots']:9} | {r['correctos']:9} | "
+                       f"{r['latencia_p50_ms']:8.3f} | {r['latencia_p99_ms']:8.3f} | {r['latencia_max_ms']:8.3f}")
+        else:
+            detalle = f"{'-':>9} | {'-':>9} | {'-':>8} | {'-':>8} | {'-':>8}"
+        print(f"| {nombre:30} | {r['throughput']:10.0f} | {caida:17.1f} | {detalle} | {'✅' if r['conservacion_final'] else '❌':12} |")
+    print("\nCaída: multiversión sin instantáneas vs Cuenta = costo de versionar escrituras;")
+    print("con instantáneas vs su versión sin instantáneas = costo de tomarlas.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+import threading
+import time
+import os
+import contextlib
+
+from deadlock_solucion import (
+    Cuenta,
+    OPERACIONES,
+    transferir_lote_sin_deadlock,
+    generar_transferencias,
+    ejecutar_transferencias_sin_deadlock,
+)
+
+# Cargas generadas: (número de cuentas, número de transferencias, threads)
+CARGAS_GENERADAS = [
+    (100, 20000, 8),
+    (10000, 100000, 8),
+]
+TAMANOS_LOTE = [1, 10, 100, 1000]
+
+def crear_cuentas(num_cuentas):
+    """Crea cuentas con los saldos iniciales de la especificación: 1000 * (i+1)"""
+    return [Cuenta(i, 1000*(i+1)) for i in range(num_cuentas)]
+
+@contextlib.contextmanager
+def silenciar_salida():
+    """Descarta los prints de la versión por transferencia para no medir la terminal"""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+def ejecutar_en_threads(objetivo, argumentos_por_thread):
+    """Lanza un thread por lista de argumentos, espera a todos y retorna el tiempo total"""
+    threads = [threading.Thread(target=objetivo, args=args, name=f"Thread-{i+1}")
+               for i, args in enumerate(argumentos_por_thread)]
+    tiempo_inicio = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - tiempo_inicio
+
+def verificar_conservacion(cuentas, saldo_inicial):
+    return "✅" if sum(c.saldo for c in cuentas) == saldo_inicial else "❌"
+
+def benchmark_tabla_documento():
+    """Repite las 30 transferencias de main() con cada modo de ejecución"""
+    print("=== TABLA DEL DOCUMENTO (30 TRANSFERENCIAS, 10 THREADS) ===")
+    print("| Modo                        | Tiempo (ms) | Transf/seg | Exitosas | Conservación |")
+    print("|-----------------------------|-------------|------------|----------|--------------|")
+
+    saldo_inicial = sum(1000*(i+1) for i in range(5))
+    total = sum(len(ops) for ops in OPERACIONES)
+
+    # 1. Versión original: una transferencia (dos locks) a la vez
+    cuentas = crear_cuentas(5)
+    exitosas = []
+    def por_transferencia(cuentas, transferencias):
+        exitosas.append(ejecutar_transferencias_sin_deadlock(cuentas, transferencias))
+    with silenciar_salida():
+        tiempo = ejecutar_en_threads(por_transferencia, [(cuentas, ops) for ops in OPERACIONES])
+    print(f"| {'Por transferencia':27} | {tiempo*1000:11.2f} | {total/tiempo:10.1f} | {sum(exitosas):8} | {verificar_conservacion(cuentas, saldo_inicial):12} |")
+
+    # 2. Un lote por thread (las 3 transferencias de cada thread)
+    cuentas = crear_cuentas(5)
+    resultados = []
+    def por_lote(cuentas, transferencias):
+        resultados.append(transferir_lote_sin_deadlock(cuentas, transferencias))
+    tiempo = ejecutar_en_threads(por_lote, [(cuentas, ops) for ops in OPERACIONES])
+    exitosas_lote = sum(r['exitosas'] for r in resultados)
+    print(f"| {'Un lote por thread':27} | {tiempo*1000:11.2f} | {total/tiempo:10.1f} | {exitosas_lote:8} | {verificar_conservacion(cuentas, saldo_inicial):12} |")
+
+    # 3. Un único lote con las 30 transferencias
+    cuentas = crear_cuentas(5)
+    todas = [op for ops in OPERACIONES for op in ops]
+    resultado = transferir_lote_sin_deadlock(cuentas, todas)
+    print(f"| {'Lote único (30)':27} | {resultado['tiempo']*1000:11.2f} | {resultado['transferencias_por_segundo']:10.1f} | {resultado['exitosas']:8} | {verificar_conservacion(cuentas, saldo_inicial):12} |")
+
+    print("\nDetalle del lote único:")
+    for origen, destino, monto, exito in resultado['resultados']:
+        print(f"  Cuenta {origen} → Cuenta {destino} ${monto}: {'ÉXITO' if exito else 'FALLO (saldo insuficiente)'}")
+
+def benchmark_cargas_generadas():
+    """Mide transferencias/seg con cargas aleatorias grandes y distintos tamaños de lote"""
+    print("\n=== CARGAS GENERADAS (SIN TIEMPO DE PROCESAMIENTO SIMULADO) ===")
+    print("| Cuentas | Transferencias | Threads | Tamaño lote | Tiempo (s) | Transf/seg | Exitosas | Conservación |")
+    print("|---------|----------------|---------|-------------|------------|------------|----------|--------------|")
+
+    for num_cuentas, num_transferencias, num_threads in CARGAS_GENERADAS:
+        transferencias = generar_transferencias(num_cuentas, num_transferencias, semilla=42)
+        saldo_inicial = sum(1000*(i+1) for i in range(num_cuentas))
+        por_thread = num_transferencias // num_threads
+
+        for tamano_lote in TAMANOS_LOTE:
+            cuentas = crear_cuentas(num_cuentas)
+            exitosas = [0] * num_threads
+
+            def trabajador(indice, transferencias_thread):
+                for i in range(0, len(transferencias_thread), tamano_lote):
+                    lote = transferencias_thread[i:i+tamano_lote]
+                    exitosas[indice] += transferir_lote_sin_deadlock(cuentas, lote, tiempo_procesamiento=0)['exitosas']
+
+            argumentos = [(i, transferencias[i*por_thread:(i+1)*por_thread]) for i in range(num_threads)]
+            tiempo = ejecutar_en_threads(trabajador, argumentos)
+            total = por_thread * num_threads
+            print(f"| {num_cuentas:7} | {total:14} | {num_threads:7} | {tamano_lote:11} | {tiempo:10.3f} | {total/tiempo:10.0f} | {sum(exitosas):8} | {verificar_conservacion(cuentas, saldo_inicial):12} |")
+
+def main():
+    print("=== BENCHMARK: TRANSFERENCIAS POR LOTES SIN DEADLOCK ===")
+    print("TÉCNICA: Adquisición de todos los locks del lote en orden ascendente por ID")
+    print()
+    benchmark_tabla_documento()
+    benchmark_cargas_generadas()
+
+if __name__ == "__main__":
+    main()
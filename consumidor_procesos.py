@@ -0,0 +1,167 @@
+import threading
+import time
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from starvation_solucion import Tarea, ColaConAging, SECUENCIAS
+
+ITERACIONES_POR_DEFECTO = 300000
+
+def trabajo_cpu(tarea):
+    """Carga CPU-bound de ejemplo: suma de cuadrados de tarea.iteraciones enteros"""
+    return sum(i * i for i in range(getattr(tarea, 'iteraciones', ITERACIONES_POR_DEFECTO)))
+
+def ejecutar_en_proceso(funcion, tarea):
+    """Corre en el proceso trabajador; retorna el resultado y cuándo empezó y terminó"""
+    inicio = time.time()
+    resultado = funcion(tarea)
+    return resultado, inicio, time.time()
+
+class DespachadorProcesos(threading.Thread):
+    """
+    Consumidor que ejecuta el cuerpo de las tareas en procesos trabajadores
+
+    - La decisión de qué tarea sigue (prioridad + aging) queda en la cola del proceso
+      padre (ColaConAging): el despachador pide con cola.get_de_clases() la próxima tarea
+      entre las clases que tienen ventana libre
+    - El cuerpo (funcion(tarea)) se envía a un ProcessPoolExecutor, fuera del GIL del padre
+    - Ventanas en vuelo por clase: un contador por prioridad limita cuántas tareas de
+      esa clase ocupan procesos a la vez, así las A no pueden ocupar todos los procesos
+      y M y B conservan su parte. Una clase con la ventana llena no detiene a las demás:
+      sus tareas esperan en la cola mientras se despachan las de las otras clases.
+      Las ventanas por defecto suman num_procesos, así toda tarea despachada tiene un
+      proceso libre. Las ventanas deben cubrir A, M y B con al menos 1: la tarea de fin
+      es de clase A y el aging promueve tareas B a M.
+    - Termina al recibir una Tarea con id None (ver detener())
+    """
+    def __init__(self, cola, funcion=trabajo_cpu, num_procesos=None, ventanas=None, stats=None):
+        super().__init__(name="Despachador-Procesos")
+        self.cola = cola
+        self.funcion = funcion
+        self.num_procesos = num_procesos or max(3, os.cpu_count())
+        self.ventanas = ventanas or ventanas_por_defecto(self.num_procesos)
+        if set(self.ventanas) != {'A', 'M', 'B'} or any(tam < 1 for tam in self.ventanas.values()):
+            raise ValueError(f"ventanas debe tener las clases A, M y B con al menos 1 cada una, no {self.ventanas}")
+        self.stats = stats if stats is not None else crear_stats()
+        self.stats.setdefault('errores', [])  # (id de tarea, clase, excepción) de las tareas fallidas
+        self.executor = ProcessPoolExecutor(max_workers=self.num_procesos)
+        self.pendientes = 0
+        self.en_vuelo = {clase: 0 for clase in self.ventanas}
+        self.sin_pendientes = threading.Condition()  # también protege en_vuelo
+
+    def clases_con_ventana(self):
+        return {clase for clase, n in self.en_vuelo.items() if n < self.ventanas[clase]}
+
+    def run(self):
+        while True:
+            tarea = self.cola.get_de_clases(self.clases_con_ventana)
+            if tarea is None:
+                continue
+            if tarea.id is None:
+                break
+            clase = tarea.prioridad
+            with self.sin_pendientes:
+                self.en_vuelo[clase] += 1
+                self.pendientes += 1
+            despacho = time.time()
+            try:
+                futuro = self.executor.submit(ejecutar_en_proceso, self.funcion, tarea)
+            except Exception as e:
+                # Por ejemplo, el pool quedó roto porque un proceso trabajador murió
+                with self.stats['lock']:
+                    self.stats['errores'].append((tarea.id, clase, repr(e)))
+                self._liberar(clase)
+                continue
+            futuro.add_done_callback(lambda f, t=tarea, c=clase, d=despacho: self._completada(f, t, c, d))
+        with self.sin_pendientes:
+            self.sin_pendientes.wait_for(lambda: self.pendientes == 0)
+        self.executor.shutdown()
+
+    def _completada(self, futuro, tarea, clase, despacho):
+        """Callback en el padre: libera la ventana de la clase y actualiza las estadísticas"""
+        fin_padre = time.time()
+        stats = self.stats
+        try:
+            _, inicio, fin = futuro.result()
+            with stats['lock']:
+                stats[f"{clase}_procesadas"] += 1
+                if clase == 'B':
+                    stats['tiempo_espera_B'].append(despacho - tarea.tiempo_creacion)
+                # Latencia agregada por el backend: envío al proceso + retorno del resultado
+                stats['latencia_despacho'].append((inicio - despacho) + (fin_padre - fin))
+        except Exception as e:
+            # La tarea lanzó una excepción, o la tarea o su resultado no se pudieron serializar
+            with stats['lock']:
+                stats['errores'].append((tarea.id, clase, repr(e)))
+        finally:
+            self._liberar(clase)
+
+    def _liberar(self, clase):
+        """Devuelve la ventana de la clase y descuenta la tarea en vuelo"""
+        with self.sin_pendientes:
+            self.en_vuelo[clase] -= 1
+            self.pendientes -= 1
+            self.sin_pendientes.notify_all()
+        # La clase vuelve a ser elegible: el despachador puede estar esperando en la cola
+        self.cola.notificar()
+
+    def detener(self):
+        """Espera a que la cola se vacíe, encola la tarea de fin y espera las tareas en vuelo"""
+        # La tarea de fin se encola con la cola vacía para que no adelante a otras
+        while self.cola.size() > 0:
+            time.sleep(0.001)
+        self.cola.put(Tarea(None, 'A', time.time()))
+        self.join()
+
+def ventanas_por_defecto(num_procesos):
+    """
+    Un cuarto de los procesos para M, un cuarto para B (al menos 1 cada una) y el resto
+    para A; suman num_procesos, por lo que hacen falta al menos 3 procesos
+    """
+    if num_procesos < 3:
+        raise ValueError(f"Se necesitan al menos 3 procesos (uno por clase), no {num_procesos}")
+    medias = bajas = max(1, num_procesos // 4)
+    return {
+        'A': num_procesos - medias - bajas,
+        'M': medias,
+        'B': bajas
+    }
+
+def crear_stats():
+    """Estadísticas de main() más la latencia de despacho a procesos y las tareas fallidas"""
+    return {
+        'A_procesadas': 0,
+        'M_procesadas': 0,
+        'B_procesadas': 0,
+        'tiempo_espera_B': [],
+        'promociones_aging': 0,
+        'procesamientos_forzados': 0,
+        'latencia_despacho': [],
+        'errores': [],
+        'lock': threading.Lock()
+    }
+
+def main():
+    print("=== CONSUMIDOR CON PROCESOS - TAREAS CPU-BOUND CON PRIORIDADES ===")
+    cola = ColaConAging(capacidad_maxima=20)
+    despachador = DespachadorProcesos(cola)
+    print(f"Procesos: {despachador.num_procesos} | Ventanas en vuelo por clase: {despachador.ventanas}")
+    despachador.start()
+
+    tiempo_inicio = time.perf_counter()
+    # Secuencia de 30 tareas del documento con carga CPU-bound
+    for i, prioridad in enumerate(p for secuencia in SECUENCIAS for p in secuencia):
+        cola.put(Tarea(f"P-{i+1}", prioridad, time.time()))
+    despachador.detener()
+    tiempo_total = time.perf_counter() - tiempo_inicio
+
+    stats = despachador.stats
+    latencias = stats['latencia_despacho']
+    print(f"\nTareas A/M/B procesadas: {stats['A_procesadas']}/{stats['M_procesadas']}/{stats['B_procesadas']}")
+    print(f"Tareas con error: {len(stats['errores'])}")
+    print(f"Tiempo total: {tiempo_total:.2f} s")
+    if latencias:
+        print(f"Latencia de despacho promedio: {sum(latencias)/len(latencias)*1000:.2f} ms por tarea")
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,49 @@
 import threading
 import time
+import random
 from datetime import datetime
 
+from detector_deadlock import GrafoEspera, LockInstrumentado, DetectorDeadlock, DeadlockDetectado
+
+# Tabla de transferencias según especificación del documento (punto 2.1)
+# Formato: (origen, destino, monto)
+OPERACIONES = [
+    # Thread 1: 0→1, $200 | 1→2, $300 | 2→0, $150
+    [(0,1,200), (1,2,300), (2,0,150)],
+    # Thread 2: 1→0, $250 | 0→2, $100 | 2→1, $200
+    [(1,0,250), (0,2,100), (2,1,200)],
+    # Thread 3: 2→3, $300 | 3→4, $400 | 4→2, $250
+    [(2,3,300), (3,4,400), (4,2,250)],
+    # Thread 4: 3→2, $350 | 2→4, $200 | 4→3, $300
+    [(3,2,350), (2,4,200), (4,3,300)],
+    # Thread 5: 4→0, $400 | 0→3, $250 | 3→4, $150
+    [(4,0,400), (0,3,250), (3,4,150)],
+    # Thread 6: 0→4, $300 | 4→1, $350 | 1→0, $200
+    [(0,4,300), (4,1,350), (1,0,200)],
+    # Thread 7: 1→3, $250 | 3→0, $300 | 0→1, $150
+    [(1,3,250), (3,0,300), (0,1,150)],
+    # Thread 8: 2→1, $200 | 1→4, $250 | 4→2, $300
+    [(2,1,200), (1,4,250), (4,2,300)],
+    # Thread 9: 3→1, $300 | 1→2, $200 | 2→3, $250
+    [(3,1,300), (1,2,200), (2,3,250)],
+    # Thread 10: 4→3, $350 | 3→2, $250 | 2→4, $200
+    [(4,3,350), (3,2,250), (2,4,200)],
+]
+
 class Cuenta:
-    def __init__(self, id, saldo):
+    def __init__(self, id, saldo, lock=None):
         self.id = id
         self.saldo = saldo
-        self.lock = threading.Lock()
+        self.lock = lock if lock is not None else threading.Lock()
 
     def __str__(self):
         return f"Cuenta[{self.id}] = ${self.saldo}"
 
-def transferir(cuentas, origen, destino, monto):
+def _log(verbose, mensaje):
+    if verbose:
+        print(f"[{threading.current_thread().name}] [{timestamp()}] {mensaje}")
+
+def transferir(cuentas, origen, destino, monto, tiempo_procesamiento=0.1, verbose=True, dormir=time.sleep):
     """
     Versión CON deadlock - sin ordenamiento de locks
     Implementa el pseudocódigo especificado en el documento:
@@ -24,45 +56,48 @@ def transferir(cuentas, origen, destino, monto):
             saldo[cuenta_destino] += monto
         unlock(cuenta_destino)
         unlock(cuenta_origen)
+    
+    dormir reemplaza a time.sleep (simulacion_virtual.py pasa el de un BucleVirtual,
+    junto con cuentas creadas con sus locks).
     """
     cta_origen = cuentas[origen]
     cta_destino = cuentas[destino]
 
-    print(f"[{threading.current_thread().name}] [{timestamp()}] Iniciando transferencia ${monto}: Cuenta {origen} -> Cuenta {destino}")
+    _log(verbose, f"Iniciando transferencia ${monto}: Cuenta {origen} -> Cuenta {destino}")
     
     # PASO 1: Adquirir lock de cuenta origen
-    print(f"[{threading.current_thread().name}] [{timestamp()}] Intentando adquirir lock de cuenta {origen}...")
+    _log(verbose, f"Intentando adquirir lock de cuenta {origen}...")
     cta_origen.lock.acquire()
-    print(f"[{threading.current_thread().name}] [{timestamp()}] Lock adquirido para cuenta {origen}")
+    _log(verbose, f"Lock adquirido para cuenta {origen}")
     
     try:
         # Simular procesamiento que da tiempo a otros threads para crear condiciones de deadlock
-        time.sleep(0.1)  # Ventana crítica para que otros threads adquieran locks
+        dormir(tiempo_procesamiento)  # Ventana crítica para que otros threads adquieran locks
         
         # PASO 2: Intentar adquirir lock de cuenta destino
-        print(f"[{threading.current_thread().name}] [{timestamp()}] Intentando adquirir lock de cuenta {destino}...")
-        print(f"[{threading.current_thread().name}] [{timestamp()}] *** PUNTO CRITICO: POSIBLE DEADLOCK AQUI ***")
+        _log(verbose, f"Intentando adquirir lock de cuenta {destino}...")
+        _log(verbose, f"*** PUNTO CRITICO: POSIBLE DEADLOCK AQUI ***")
         cta_destino.lock.acquire()
-        print(f"[{threading.current_thread().name}] [{timestamp()}] Lock adquirido para cuenta {destino}")
+        _log(verbose, f"Lock adquirido para cuenta {destino}")
         
         try:
             # PASO 3: Realizar la transferencia si hay saldo suficiente
             if cta_origen.saldo >= monto:
                 cta_origen.saldo -= monto
                 cta_destino.saldo += monto
-                print(f"[{threading.current_thread().name}] [{timestamp()}] EXITO: Transferencia ${monto} de Cuenta {origen} -> Cuenta {destino}")
+                _log(verbose, f"EXITO: Transferencia ${monto} de Cuenta {origen} -> Cuenta {destino}")
             else:
-                print(f"[{threading.current_thread().name}] [{timestamp()}] FALLO: Saldo insuficiente en cuenta {origen} (saldo: ${cta_origen.saldo}, necesario: ${monto})")
+                _log(verbose, f"FALLO: Saldo insuficiente en cuenta {origen} (saldo: ${cta_origen.saldo}, necesario: ${monto})")
         finally:
             # PASO 4: Liberar lock de cuenta destino
             cta_destino.lock.release()
-            print(f"[{threading.current_thread().name}] [{timestamp()}] Lock liberado para cuenta {destino}")
+            _log(verbose, f"Lock liberado para cuenta {destino}")
     finally:
         # PASO 5: Liberar lock de cuenta origen
         cta_origen.lock.release()
-        print(f"[{threading.current_thread().name}] [{timestamp()}] Lock liberado para cuenta {origen}")
+        _log(verbose, f"Lock liberado para cuenta {origen}")
     
-    print(f"[{threading.current_thread().name}] [{timestamp()}] Transferencia completada.")
+    _log(verbose, f"Transferencia completada.")
 
 def ejecutar_transferencias(cuentas, transferencias):
     """Ejecuta una secuencia de transferencias para un thread específico"""
@@ -77,11 +112,45 @@ def ejecutar_transferencias(cuentas, transferencias):
     
     print(f"\n{thread_name} FINALIZADO - Todas las transferencias completadas")
 
+def transferir_con_reintentos(cuentas, origen, destino, monto, reintentos_max=10, backoff_base=0.01):
+    """
+    Ejecuta transferir() y, si el detector la eligió como víctima de un deadlock
+    (DeadlockDetectado en el acquire de la cuenta destino), reintenta con backoff
+    exponencial aleatorio. El lock de origen ya quedó liberado por el finally de transferir().
+    Retorna el número de reintentos realizados.
+    """
+    for intento in range(reintentos_max + 1):
+        try:
+            transferir(cuentas, origen, destino, monto)
+            return intento
+        except DeadlockDetectado as e:
+            if intento == reintentos_max:
+                raise
+            espera = random.uniform(0, backoff_base * (2 ** intento))
+            print(f"[{threading.current_thread().name}] [{timestamp()}] VÍCTIMA DE DEADLOCK ({e}) - reintento {intento+1} en {espera*1000:.1f} ms")
+            time.sleep(espera)
+
+def ejecutar_transferencias_con_reintentos(cuentas, transferencias, reintentos):
+    """Igual que ejecutar_transferencias pero reintentando las transferencias elegidas como víctima"""
+    thread_name = threading.current_thread().name
+    print(f"\n{thread_name} iniciado - Ejecutando {len(transferencias)} transferencias (con detector)")
+    
+    for i, (origen, destino, monto) in enumerate(transferencias, 1):
+        print(f"\n{thread_name} - Operación {i}/{len(transferencias)}")
+        reintentos[thread_name] = reintentos.get(thread_name, 0) + transferir_con_reintentos(cuentas, origen, destino, monto)
+        time.sleep(0.05)
+    
+    print(f"\n{thread_name} FINALIZADO - Todas las transferencias completadas")
+
+def crear_cuentas_instrumentadas(grafo, num_cuentas=5):
+    """Crea las cuentas de la especificación usando LockInstrumentado (nombres cuenta0, cuenta1, ...)"""
+    return [Cuenta(i, 1000*(i+1), LockInstrumentado(f"cuenta{i}", grafo)) for i in range(num_cuentas)]
+
 def timestamp():
     """Genera timestamp formateado para screenshots"""
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
 
-def analizar_deadlock(threads):
+def analizar_deadlock(threads, detector=None):
     """Analiza el patrón de deadlock que se produce"""
     print(f"\n*** ANALISIS DEL DEADLOCK ***")
     print(f"TIMESTAMP DEADLOCK DETECTADO: {timestamp()}")
@@ -96,6 +165,13 @@ def analizar_deadlock(threads):
     bloqueados = [t for t in threads if t.is_alive()]
     for t in bloqueados:
         print(f"  - {t.name}: Bloqueado esperando lock de cuenta")
+    
+    if detector is not None:
+        print("\nCICLOS DETECTADOS EN EL GRAFO DE ESPERA:")
+        for deteccion in detector.detecciones:
+            print(f"  [{deteccion['timestamp']}] latencia de detección: {deteccion['latencia']*1000:.2f} ms")
+            for thread_name, tenido, esperado in deteccion['ciclo']:
+                print(f"      {thread_name} tiene {tenido} y espera {esperado}")
     return bloqueados
 
 def mostrar_estado_screenshot(titulo, cuentas, threads=None, extra_info=""):
@@ -131,7 +207,11 @@ def mostrar_estado_screenshot(titulo, cuentas, threads=None, extra_info=""):
 def main():
     # Crear 5 cuentas bancarias con saldos iniciales según especificación
     # Cuenta[i] = 1000 * (i+1): Cuenta 0: $1000, Cuenta 1: $2000, etc.
-    cuentas = [Cuenta(i, 1000*(i+1)) for i in range(5)]
+    # Los locks de las cuentas se instrumentan para construir el grafo de espera
+    grafo = GrafoEspera()
+    cuentas = crear_cuentas_instrumentadas(grafo)
+    detector = DetectorDeadlock(grafo)
+    detector.start()
     
     print("=== SIMULACIÓN DE DEADLOCK - SISTEMA DE TRANSFERENCIAS BANCARIAS ===")
     
@@ -151,29 +231,7 @@ def main():
     )
     
     # Tabla de transferencias según especificación del documento (punto 2.1)
-    # Formato: (origen, destino, monto)
-    operaciones = [
-        # Thread 1: 0→1, $200 | 1→2, $300 | 2→0, $150
-        [(0,1,200), (1,2,300), (2,0,150)],
-        # Thread 2: 1→0, $250 | 0→2, $100 | 2→1, $200
-        [(1,0,250), (0,2,100), (2,1,200)],
-        # Thread 3: 2→3, $300 | 3→4, $400 | 4→2, $250
-        [(2,3,300), (3,4,400), (4,2,250)],
-        # Thread 4: 3→2, $350 | 2→4, $200 | 4→3, $300
-        [(3,2,350), (2,4,200), (4,3,300)],
-        # Thread 5: 4→0, $400 | 0→3, $250 | 3→4, $150
-        [(4,0,400), (0,3,250), (3,4,150)],
-        # Thread 6: 0→4, $300 | 4→1, $350 | 1→0, $200
-        [(0,4,300), (4,1,350), (1,0,200)],
-        # Thread 7: 1→3, $250 | 3→0, $300 | 0→1, $150
-        [(1,3,250), (3,0,300), (0,1,150)],
-        # Thread 8: 2→1, $200 | 1→4, $250 | 4→2, $300
-        [(2,1,200), (1,4,250), (4,2,300)],
-        # Thread 9: 3→1, $300 | 1→2, $200 | 2→3, $250
-        [(3,1,300), (1,2,200), (2,3,250)],
-        # Thread 10: 4→3, $350 | 3→2, $250 | 2→4, $200
-        [(4,3,350), (3,2,250), (2,4,200)],
-    ]
+    operaciones = OPERACIONES
 
     print("Iniciando 10 threads con transferencias concurrentes...")
     print("VERSIÓN CON DEADLOCK: locks sin ordenamiento")
@@ -215,7 +273,7 @@ def main():
     # Analizar el deadlock si ocurrió
     threads_bloqueados = []
     if threads_completados < 10:
-        threads_bloqueados = analizar_deadlock(threads)
+        threads_bloqueados = analizar_deadlock(threads, detector)
     
     # Screenshot 4: Resultados finales
     extra_info_resultado = f"Threads completados: {threads_completados}/10, Bloqueados: {10-threads_completados}/10"
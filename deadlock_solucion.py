@@ -1,16 +1,216 @@
 import threading
 import time
+import random
+import contextlib
+
+# Tabla de transferencias según especificación del documento (punto 2.1)
+# Formato: (origen, destino, monto) - una lista de 3 transferencias por thread
+OPERACIONES = [
+    [(0,1,200), (1,2,300), (2,0,150)],    # Thread 1
+    [(1,0,250), (0,2,100), (2,1,200)],    # Thread 2
+    [(2,3,300), (3,4,400), (4,2,250)],    # Thread 3
+    [(3,2,350), (2,4,200), (4,3,300)],    # Thread 4
+    [(4,0,400), (0,3,250), (3,4,150)],    # Thread 5
+    [(0,4,300), (4,1,350), (1,0,200)],    # Thread 6
+    [(1,3,250), (3,0,300), (0,1,150)],    # Thread 7
+    [(2,1,200), (1,4,250), (4,2,300)],    # Thread 8
+    [(3,1,300), (1,2,200), (2,3,250)],    # Thread 9
+    [(4,3,350), (3,2,250), (2,4,200)],    # Thread 10
+]
 
 class Cuenta:
-    def __init__(self, id, saldo):
+    def __init__(self, id, saldo, lock=None):
         self.id = id
         self.saldo = saldo
-        self.lock = threading.Lock()
+        self.lock = lock if lock is not None else threading.Lock()
 
     def __str__(self):
         return f"Cuenta[{self.id}] = ${self.saldo}"
 
-def transferir_sin_deadlock(cuentas, origen, destino, monto):
+class CuentaVersionada(Cuenta):
+    """
+    Cuenta con contador de versión al estilo seqlock
+    
+    - Toda escritura del saldo (incluida `saldo -= monto` en cualquier estrategia)
+      pasa por el setter: versión impar durante la escritura, par al terminar
+    - leer() no toma el lock: reintenta si la versión es impar o cambió durante la lectura
+    """
+    def __init__(self, id, saldo):
+        self.version = 0
+        super().__init__(id, saldo)
+
+    @property
+    def saldo(self):
+        return self._saldo
+
+    @saldo.setter
+    def saldo(self, valor):
+        # Requiere el lock de la cuenta (o ser el único escritor)
+        self.version += 1
+        self._saldo = valor
+        self.version += 1
+
+    def leer(self):
+        """Lectura sin lock: retorna (saldo, version) de una instantánea consistente"""
+        while True:
+            version = self.version
+            if not version & 1:
+                saldo = self._saldo
+                if self.version == version:
+                    return saldo, version
+            # Escritura en curso: ceder el GIL para que el escritor termine
+            time.sleep(0)
+
+    def leer_saldo(self):
+        return self.leer()[0]
+
+class RegistroVersiones:
+    """
+    Marcas de confirmación globales para instantáneas consistentes (MVCC)
+    
+    - Cada transferencia confirma su débito y su crédito con una misma marca `ts`,
+      asignada en orden creciente bajo un mutex que solo se retiene unos microsegundos
+    - Cada CuentaMultiversion guarda las versiones (ts, saldo) que alguna instantánea
+      activa todavía puede necesitar
+    - snapshot() fija la marca S, espera solo a las confirmaciones ya iniciadas con
+      ts <= S (dos escrituras en memoria, nunca el procesamiento ni los locks de cuenta)
+      y lee en cada cuenta la última versión con ts <= S
+    """
+    def __init__(self):
+        self.mutex = threading.Lock()
+        self.confirmacion_terminada = threading.Condition(self.mutex)
+        self.ultima_marca = 0
+        self.en_curso = set()
+        self.snapshots_activos = []
+        self.marca_minima_activa = float('inf')
+        self._local = threading.local()
+
+    @contextlib.contextmanager
+    def confirmacion(self):
+        """Agrupa las escrituras del bloque bajo una misma marca de confirmación"""
+        with self.mutex:
+            self.ultima_marca += 1
+            marca = self.ultima_marca
+            self.en_curso.add(marca)
+        self._local.marca = marca
+        try:
+            yield marca
+        finally:
+            self._local.marca = None
+            with self.mutex:
+                self.en_curso.discard(marca)
+                self.confirmacion_terminada.notify_all()
+
+    def marca_actual(self):
+        """Marca de la confirmación en curso del thread actual (None si no hay)"""
+        return getattr(self._local, 'marca', None)
+
+    def snapshot(self, cuentas, espera_maxima=1.0):
+        """
+        Instantánea consistente sin detener las transferencias.
+        Retorna {'marca', 'saldos', 'total', 'latencia', 'espera_confirmaciones'}.
+        """
+        tiempo_inicio = time.perf_counter()
+        with self.mutex:
+            marca = self.ultima_marca
+            self.snapshots_activos.append(marca)
+            self.marca_minima_activa = min(self.snapshots_activos)
+            pendientes = set(self.en_curso)
+            # Solo se espera a confirmaciones ya iniciadas (acotadas a dos escrituras)
+            limite = tiempo_inicio + espera_maxima
+            while pendientes & self.en_curso:
+                restante = limite - time.perf_counter()
+                if restante <= 0:
+                    self._liberar_snapshot(marca)
+                    raise TimeoutError("Confirmaciones en curso no terminaron a tiempo")
+                self.confirmacion_terminada.wait(restante)
+        espera = time.perf_counter() - tiempo_inicio
+        
+        try:
+            saldos = [cuenta.saldo_en(marca) for cuenta in cuentas]
+        finally:
+            with self.mutex:
+                self._liberar_snapshot(marca)
+        
+        return {
+            'marca': marca,
+            'saldos': saldos,
+            'total': sum(saldos),
+            'latencia': time.perf_counter() - tiempo_inicio,
+            'espera_confirmaciones': espera
+        }
+
+    def _liberar_snapshot(self, marca):
+        # Requiere self.mutex
+        self.snapshots_activos.remove(marca)
+        self.marca_minima_activa = min(self.snapshots_activos) if self.snapshots_activos else float('inf')
+
+class CuentaMultiversion(Cuenta):
+    """
+    Cuenta que conserva versiones (marca, saldo) para RegistroVersiones.snapshot()
+    
+    Las escrituras dentro de registro.confirmacion() usan la marca de esa confirmación;
+    una escritura suelta (fuera de una confirmación) obtiene su propia marca.
+    """
+    def __init__(self, id, saldo, registro):
+        self.registro = registro
+        self.versiones = [(0, saldo)]
+        super().__init__(id, saldo)
+
+    @property
+    def saldo(self):
+        return self.versiones[-1][1]
+
+    @saldo.setter
+    def saldo(self, valor):
+        # Requiere el lock de la cuenta
+        marca = self.registro.marca_actual()
+        if marca is None:
+            with self.registro.confirmacion():
+                self._escribir_version(self.registro.marca_actual(), valor)
+        else:
+            self._escribir_version(marca, valor)
+
+    def _escribir_version(self, marca, valor):
+        versiones = self.versiones
+        versiones.append((marca, valor))
+        # Descartar versiones que ninguna instantánea activa puede leer: se conserva
+        # la más reciente con marca <= marca mínima activa y todas las posteriores
+        minima = self.registro.marca_minima_activa
+        while len(versiones) > 1 and versiones[1][0] <= minima:
+            versiones.pop(0)
+
+    def saldo_en(self, marca):
+        """Saldo de la última versión confirmada con marca <= marca (lectura sin lock)"""
+        for marca_version, saldo in reversed(list(self.versiones)):
+            if marca_version <= marca:
+                return saldo
+        raise LookupError(f"Versión {marca} de la cuenta {self.id} ya descartada")
+
+def mover_saldo(cta_origen, cta_destino, monto):
+    """
+    Débito y crédito de una transferencia (requiere los locks de ambas cuentas).
+    Con CuentaMultiversion, ambas escrituras comparten una marca de confirmación,
+    así que ninguna instantánea ve el débito sin el crédito.
+    """
+    registro = getattr(cta_origen, 'registro', None)
+    if registro is None:
+        cta_origen.saldo -= monto
+        cta_destino.saldo += monto
+    else:
+        with registro.confirmacion():
+            cta_origen.saldo -= monto
+            cta_destino.saldo += monto
+
+def _log(thread_name, verbose, registro, formato, *args):
+    """Mensaje de una transferencia: al RegistroEventos si hay uno, si no print() con verbose"""
+    if registro is not None:
+        registro.registrar(formato, *args)
+    elif verbose:
+        print(f"[{thread_name}] {formato.format(*args)}")
+
+def transferir_sin_deadlock(cuentas, origen, destino, monto, tiempo_procesamiento=0.05, verbose=True, registro=None,
+                            dormir=time.sleep):
     """
     VERSIÓN SIN DEADLOCK - Prevención mediante Ordenamiento de Recursos
     
@@ -20,7 +220,15 @@ def transferir_sin_deadlock(cuentas, origen, destino, monto):
     - Evita la espera circular que causa deadlock
     
     Estrategia: lock(min(origen, destino)) primero, luego lock(max(origen, destino))
+    
+    registro: RegistroEventos opcional; los mensajes se guardan sin formatear en lugar
+    de imprimirse mientras se tienen los locks de las cuentas.
+    dormir: reemplaza a time.sleep (simulacion_virtual.py pasa el de un BucleVirtual,
+    junto con cuentas creadas con sus locks).
+    
+    Retorna (exito, reintentos); esta estrategia nunca reintenta.
     """
+    thread_name = threading.current_thread().name
     cta_origen = cuentas[origen]
     cta_destino = cuentas[destino]
     
@@ -37,52 +245,268 @@ def transferir_sin_deadlock(cuentas, origen, destino, monto):
         primer_id = destino
         segundo_id = origen
 
-    print(f"[{threading.current_thread().name}] Iniciando transferencia ${monto}: Cuenta {origen} → Cuenta {destino}")
-    print(f"[{threading.current_thread().name}] Orden de locks: Cuenta {primer_id} → Cuenta {segundo_id}")
+    _log(thread_name, verbose, registro, "Iniciando transferencia ${}: Cuenta {} → Cuenta {}", monto, origen, destino)
+    _log(thread_name, verbose, registro, "Orden de locks: Cuenta {} → Cuenta {}", primer_id, segundo_id)
     
     # PASO 1: Adquirir lock de la cuenta con menor ID primero
-    print(f"[{threading.current_thread().name}] Adquiriendo lock de cuenta {primer_id}...")
+    _log(thread_name, verbose, registro, "Adquiriendo lock de cuenta {}...", primer_id)
     primera_cuenta.lock.acquire()
-    print(f"[{threading.current_thread().name}] ✓ Lock adquirido para cuenta {primer_id}")
+    _log(thread_name, verbose, registro, "✓ Lock adquirido para cuenta {}", primer_id)
     
     try:
         # Simular procesamiento (menor tiempo que en versión con deadlock)
-        time.sleep(0.05)
+        if tiempo_procesamiento:
+            dormir(tiempo_procesamiento)
         
         # PASO 2: Adquirir lock de la cuenta con mayor ID
-        print(f"[{threading.current_thread().name}] Adquiriendo lock de cuenta {segundo_id}...")
+        _log(thread_name, verbose, registro, "Adquiriendo lock de cuenta {}...", segundo_id)
         segunda_cuenta.lock.acquire()
-        print(f"[{threading.current_thread().name}] ✓ Lock adquirido para cuenta {segundo_id}")
+        _log(thread_name, verbose, registro, "✓ Lock adquirido para cuenta {}", segundo_id)
         
         try:
             # PASO 3: Realizar la transferencia
-            if cta_origen.saldo >= monto:
-                cta_origen.saldo -= monto
-                cta_destino.saldo += monto
-                print(f"[{threading.current_thread().name}] ✅ ÉXITO: Transferencia ${monto} de Cuenta {origen} → Cuenta {destino}")
-                print(f"[{threading.current_thread().name}] Saldos actuales: Cuenta {origen}=${cta_origen.saldo}, Cuenta {destino}=${cta_destino.saldo}")
+            exito = cta_origen.saldo >= monto
+            if exito:
+                mover_saldo(cta_origen, cta_destino, monto)
+                _log(thread_name, verbose, registro, "✅ ÉXITO: Transferencia ${} de Cuenta {} → Cuenta {}", monto, origen, destino)
+                _log(thread_name, verbose, registro, "Saldos actuales: Cuenta {}=${}, Cuenta {}=${}",
+                     origen, cta_origen.saldo, destino, cta_destino.saldo)
             else:
-                print(f"[{threading.current_thread().name}] ❌ FALLO: Saldo insuficiente en cuenta {origen} (saldo: ${cta_origen.saldo}, necesario: ${monto})")
+                _log(thread_name, verbose, registro, "❌ FALLO: Saldo insuficiente en cuenta {} (saldo: ${}, necesario: ${})",
+                     origen, cta_origen.saldo, monto)
         finally:
             # PASO 4: Liberar locks en orden inverso
             segunda_cuenta.lock.release()
-            print(f"[{threading.current_thread().name}] ✓ Lock liberado para cuenta {segundo_id}")
+            _log(thread_name, verbose, registro, "✓ Lock liberado para cuenta {}", segundo_id)
     finally:
         primera_cuenta.lock.release()
-        print(f"[{threading.current_thread().name}] ✓ Lock liberado para cuenta {primer_id}")
+        _log(thread_name, verbose, registro, "✓ Lock liberado para cuenta {}", primer_id)
     
-    print(f"[{threading.current_thread().name}] Transferencia completada sin deadlock.")
+    _log(thread_name, verbose, registro, "Transferencia completada sin deadlock.")
+    return exito, 0
 
-def ejecutar_transferencias_sin_deadlock(cuentas, transferencias):
-    """Ejecuta una secuencia de transferencias para un thread específico - VERSIÓN SIN DEADLOCK"""
+def transferir_con_timeout(cuentas, origen, destino, monto, tiempo_procesamiento=0.05, verbose=True,
+                           timeout=0.01, backoff_base=0.001, backoff_maximo=0.1):
+    """
+    VERSIÓN SIN DEADLOCK - Timeout y reintento con backoff
+    
+    TÉCNICA IMPLEMENTADA: Eliminación de Retención y Espera (hold and wait)
+    - Adquiere el lock de la cuenta origen (sin ningún otro lock retenido)
+    - Intenta el lock de la cuenta destino con lock.acquire(timeout=...)
+    - Si vence el timeout libera el origen y reintenta tras un backoff exponencial
+      aleatorio, por lo que ningún thread espera indefinidamente con un lock tomado
+    
+    Retorna (exito, reintentos).
+    """
     thread_name = threading.current_thread().name
-    print(f"\n{thread_name} iniciado - Ejecutando {len(transferencias)} transferencias (SIN DEADLOCK)")
+    cta_origen = cuentas[origen]
+    cta_destino = cuentas[destino]
+    reintentos = 0
+    
+    if verbose:
+        print(f"[{thread_name}] Iniciando transferencia ${monto}: Cuenta {origen} → Cuenta {destino} (timeout {timeout*1000:.0f} ms)")
+    
+    while True:
+        # PASO 1: Adquirir lock de la cuenta origen
+        cta_origen.lock.acquire()
+        try:
+            if tiempo_procesamiento:
+                time.sleep(tiempo_procesamiento)
+            
+            # PASO 2: Intentar lock de la cuenta destino con timeout
+            if cta_destino.lock.acquire(timeout=timeout):
+                try:
+                    # PASO 3: Realizar la transferencia
+                    exito = cta_origen.saldo >= monto
+                    if exito:
+                        mover_saldo(cta_origen, cta_destino, monto)
+                    if verbose:
+                        resultado = "✅ ÉXITO" if exito else "❌ FALLO: Saldo insuficiente"
+                        print(f"[{thread_name}] {resultado}: Transferencia ${monto} de Cuenta {origen} → Cuenta {destino} ({reintentos} reintentos)")
+                    return exito, reintentos
+                finally:
+                    cta_destino.lock.release()
+        finally:
+            # PASO 4: Liberar el origen (también cuando vence el timeout)
+            cta_origen.lock.release()
+        
+        # Timeout: backoff exponencial aleatorio antes de reintentar
+        reintentos += 1
+        espera = random.uniform(0, min(backoff_maximo, backoff_base * (2 ** reintentos)))
+        if verbose:
+            print(f"[{thread_name}] ⏱ Timeout esperando cuenta {destino}; lock de cuenta {origen} liberado, reintento {reintentos} en {espera*1000:.1f} ms")
+        time.sleep(espera)
+
+def transferir_optimista(cuentas, origen, destino, monto, tiempo_procesamiento=0.05, verbose=True,
+                         conflictos_maximos=3):
+    """
+    VERSIÓN SIN DEADLOCK - Control de concurrencia optimista (requiere CuentaVersionada)
+    
+    TÉCNICA IMPLEMENTADA: Validación de versiones + ordenamiento de recursos al confirmar
+    - Lee saldo y versión de la cuenta origen sin tomar locks
+    - Realiza el procesamiento simulado fuera de cualquier sección crítica
+    - Confirma tomando ambos locks en orden ascendente por ID solo para validar que
+      la versión del origen no cambió y escribir; si cambió, es un conflicto y se repite
+    - Tras `conflictos_maximos` conflictos usa bloqueo pesimista con ordenamiento
+    
+    El destino no se valida: el crédito no depende de su saldo anterior.
+    Retorna (exito, reintentos).
+    """
+    thread_name = threading.current_thread().name
+    cta_origen = cuentas[origen]
+    cta_destino = cuentas[destino]
+    if origen < destino:
+        primera_cuenta, segunda_cuenta = cta_origen, cta_destino
+    else:
+        primera_cuenta, segunda_cuenta = cta_destino, cta_origen
+    
+    for conflictos in range(conflictos_maximos):
+        # FASE 1: Lectura optimista (sin locks)
+        saldo_origen, version_origen = cta_origen.leer()
+        if tiempo_procesamiento:
+            time.sleep(tiempo_procesamiento)
+        exito = saldo_origen >= monto
+        
+        # FASE 2: Validación y confirmación con locks ordenados
+        with primera_cuenta.lock:
+            with segunda_cuenta.lock:
+                if cta_origen.version == version_origen:
+                    if exito:
+                        cta_origen.saldo = saldo_origen - monto
+                        cta_destino.saldo += monto
+                    if verbose:
+                        resultado = "✅ ÉXITO" if exito else "❌ FALLO: Saldo insuficiente"
+                        print(f"[{thread_name}] {resultado}: Transferencia ${monto} de Cuenta {origen} → Cuenta {destino} (optimista, {conflictos} conflictos)")
+                    return exito, conflictos
+        if verbose:
+            print(f"[{thread_name}] ⚠ Conflicto de versión en cuenta {origen}, reintentando ({conflictos+1}/{conflictos_maximos})")
+    
+    # FASE 3: Demasiados conflictos - bloqueo pesimista con ordenamiento de recursos
+    with primera_cuenta.lock:
+        with segunda_cuenta.lock:
+            if tiempo_procesamiento:
+                time.sleep(tiempo_procesamiento)
+            exito = cta_origen.saldo >= monto
+            if exito:
+                mover_saldo(cta_origen, cta_destino, monto)
+    if verbose:
+        resultado = "✅ ÉXITO" if exito else "❌ FALLO: Saldo insuficiente"
+        print(f"[{thread_name}] {resultado}: Transferencia ${monto} de Cuenta {origen} → Cuenta {destino} (bloqueo pesimista)")
+    return exito, conflictos_maximos
+
+# Estrategias de prevención seleccionables desde ejecutar_transferencias_sin_deadlock
+ESTRATEGIAS = {
+    'ordenamiento': transferir_sin_deadlock,
+    'timeout': transferir_con_timeout,
+    'optimista': transferir_optimista,
+}
+
+def transferir_lote_sin_deadlock(cuentas, transferencias, tiempo_procesamiento=0.05, verbose=False):
+    """
+    VERSIÓN POR LOTES - Adquisición de todos los locks en una sola pasada
+    
+    TÉCNICA IMPLEMENTADA: Prevención de Espera Circular (igual que transferir_sin_deadlock)
+    - Calcula el conjunto de cuentas que toca el lote completo
+    - Adquiere todos sus locks una sola vez en orden ascendente por ID de cuenta
+    - Aplica en orden cada transferencia con saldo suficiente y libera los locks
+    
+    El tiempo de procesamiento simulado se paga una vez por lote y no una vez por
+    transferencia, por lo que el costo de locks y espera se amortiza entre todo el lote.
+    
+    Retorna un diccionario con el resultado de cada transferencia (origen, destino,
+    monto, exito), los contadores de éxito/fallo y las transferencias por segundo.
+    """
+    thread_name = threading.current_thread().name
+    
+    # PREVENCIÓN DE DEADLOCK: conjunto de cuentas ordenado por ID
+    ids_ordenados = sorted({cuenta_id for origen, destino, _ in transferencias for cuenta_id in (origen, destino)})
+    
+    if verbose:
+        print(f"[{thread_name}] Iniciando lote de {len(transferencias)} transferencias")
+        print(f"[{thread_name}] Orden de locks: {' → '.join(f'Cuenta {i}' for i in ids_ordenados)}")
+    
+    tiempo_inicio = time.perf_counter()
+    
+    # PASO 1: Adquirir todos los locks del lote en orden ascendente
+    adquiridos = []
+    try:
+        for cuenta_id in ids_ordenados:
+            cuentas[cuenta_id].lock.acquire()
+            adquiridos.append(cuentas[cuenta_id])
+        
+        if tiempo_procesamiento:
+            time.sleep(tiempo_procesamiento)
+        
+        # PASO 2: Aplicar cada transferencia que tenga saldo suficiente
+        resultados = []
+        exitosas = 0
+        for origen, destino, monto in transferencias:
+            cta_origen = cuentas[origen]
+            cta_destino = cuentas[destino]
+            exito = cta_origen.saldo >= monto
+            if exito:
+                mover_saldo(cta_origen, cta_destino, monto)
+                exitosas += 1
+            resultados.append((origen, destino, monto, exito))
+    finally:
+        # PASO 3: Liberar locks en orden inverso
+        for cuenta in reversed(adquiridos):
+            cuenta.lock.release()
+    
+    tiempo_total = time.perf_counter() - tiempo_inicio
+    
+    if verbose:
+        print(f"[{thread_name}] Lote completado: {exitosas}/{len(transferencias)} exitosas en {tiempo_total*1000:.2f} ms")
+    
+    return {
+        'transferencias': len(transferencias),
+        'exitosas': exitosas,
+        'fallidas': len(transferencias) - exitosas,
+        'resultados': resultados,
+        'locks_adquiridos': len(ids_ordenados),
+        'tiempo': tiempo_total,
+        'transferencias_por_segundo': len(transferencias) / tiempo_total if tiempo_total > 0 else float('inf')
+    }
+
+def generar_transferencias(num_cuentas, num_transferencias, monto_maximo=500, semilla=None,
+                           cuentas_calientes=0, prob_caliente=0.0):
+    """
+    Genera una carga aleatoria de transferencias (origen, destino, monto) entre cuentas distintas.
+    Con prob_caliente > 0, esa fracción de transferencias ocurre solo entre las primeras
+    `cuentas_calientes` cuentas (tráfico concentrado en pocas cuentas).
+    """
+    rng = random.Random(semilla)
+    transferencias = []
+    for _ in range(num_transferencias):
+        rango = cuentas_calientes if cuentas_calientes >= 2 and rng.random() < prob_caliente else num_cuentas
+        origen = rng.randrange(rango)
+        destino = rng.randrange(rango - 1)
+        if destino >= origen:
+            destino += 1
+        transferencias.append((origen, destino, rng.randint(1, monto_maximo)))
+    return transferencias
+
+def ejecutar_transferencias_sin_deadlock(cuentas, transferencias, estrategia='ordenamiento', ledger=None):
+    """
+    Ejecuta una secuencia de transferencias para un thread específico - VERSIÓN SIN DEADLOCK
+    estrategia: 'ordenamiento' (locks en orden ascendente), 'timeout' (timeout + backoff)
+                u 'optimista' (validación de versiones, requiere CuentaVersionada)
+    ledger: LedgerParticionado ya iniciado sobre `cuentas`; si se indica, cada transferencia
+            se encola en el dueño de su partición y se espera su Future (sin locks de cuenta)
+    """
+    if ledger is not None:
+        estrategia = 'ledger'
+        transferir = lambda cuentas, origen, destino, monto: ledger.transferir(origen, destino, monto).result()
+    else:
+        transferir = ESTRATEGIAS[estrategia]
+    thread_name = threading.current_thread().name
+    print(f"\n{thread_name} iniciado - Ejecutando {len(transferencias)} transferencias (SIN DEADLOCK, estrategia: {estrategia})")
     
     transferencias_exitosas = 0
     for i, (origen, destino, monto) in enumerate(transferencias, 1):
         print(f"\n{thread_name} - Operación {i}/{len(transferencias)}")
         try:
-            transferir_sin_deadlock(cuentas, origen, destino, monto)
+            transferir(cuentas, origen, destino, monto)
             transferencias_exitosas += 1
         except Exception as e:
             print(f"{thread_name} - ERROR en operación {i}: {e}")
@@ -93,9 +517,19 @@ def ejecutar_transferencias_sin_deadlock(cuentas, transferencias):
     print(f"\n{thread_name} FINALIZADO - {transferencias_exitosas}/{len(transferencias)} transferencias exitosas")
     return transferencias_exitosas
 
+def auditar_en_vuelo(registro, cuentas, threads, intervalo=0.1):
+    """Toma instantáneas consistentes mientras los threads de transferencias siguen activos"""
+    auditorias = []
+    while any(t.is_alive() for t in threads):
+        auditorias.append(registro.snapshot(cuentas))
+        time.sleep(intervalo)
+    return auditorias
+
 def main():
     # Crear 5 cuentas bancarias con saldos iniciales según especificación
-    cuentas = [Cuenta(i, 1000*(i+1)) for i in range(5)]
+    # (multiversión para poder auditar el saldo total mientras hay transferencias en curso)
+    registro = RegistroVersiones()
+    cuentas = [CuentaMultiversion(i, 1000*(i+1), registro) for i in range(5)]
     
     print("=== SIMULACIÓN SIN DEADLOCK - PREVENCIÓN POR ORDENAMIENTO DE RECURSOS ===")
     print("TÉCNICA: Prevención de Espera Circular")
@@ -108,18 +542,7 @@ def main():
     print()
     
     # Tabla de transferencias según especificación del documento (punto 2.1)
-    operaciones = [
-        [(0,1,200), (1,2,300), (2,0,150)],    # Thread 1
-        [(1,0,250), (0,2,100), (2,1,200)],    # Thread 2
-        [(2,3,300), (3,4,400), (4,2,250)],    # Thread 3
-        [(3,2,350), (2,4,200), (4,3,300)],    # Thread 4
-        [(4,0,400), (0,3,250), (3,4,150)],    # Thread 5
-        [(0,4,300), (4,1,350), (1,0,200)],    # Thread 6
-        [(1,3,250), (3,0,300), (0,1,150)],    # Thread 7
-        [(2,1,200), (1,4,250), (4,2,300)],    # Thread 8
-        [(3,1,300), (1,2,200), (2,3,250)],    # Thread 9
-        [(4,3,350), (3,2,250), (2,4,200)],    # Thread 10
-    ]
+    operaciones = OPERACIONES
 
     print("Iniciando 10 threads con transferencias concurrentes...")
     print("VERSIÓN SIN DEADLOCK: Prevención por ordenamiento de recursos")
@@ -135,6 +558,9 @@ def main():
         threads.append(t)
         t.start()
 
+    # Auditoría del saldo total con transferencias en curso
+    auditorias = auditar_en_vuelo(registro, cuentas, threads)
+    
     # Esperar por todos los threads (sin timeout, deberían completarse)
     print("Esperando finalización de threads...")
     threads_completados = 0
@@ -171,6 +597,13 @@ def main():
     print(f"Saldo total final: ${saldo_total_final}")
     print(f"Conservación de dinero: {'✅ CORRECTO' if saldo_total_inicial == saldo_total_final else '❌ ERROR'}")
     
+    print(f"\n=== Auditoría con transferencias en curso (instantáneas MVCC) ===")
+    auditorias_correctas = sum(1 for a in auditorias if a['total'] == saldo_total_inicial)
+    print(f"Instantáneas tomadas: {len(auditorias)}")
+    print(f"Instantáneas con total correcto: {auditorias_correctas}/{len(auditorias)}")
+    if auditorias:
+        print(f"Latencia máxima de instantánea: {max(a['latencia'] for a in auditorias)*1000:.3f} ms")
+    
     print(f"\nTransferencias especificadas: 30 total")
     print(f"Técnica de prevención: Ordenamiento de recursos (lock ordering)")
 
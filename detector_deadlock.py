@@ -0,0 +1,205 @@
+import threading
+import time
+from datetime import datetime
+
+class DeadlockDetectado(Exception):
+    """Se lanza en el acquire() del thread elegido como víctima para romper un ciclo"""
+    def __init__(self, ciclo):
+        self.ciclo = ciclo
+        super().__init__("Deadlock detectado: " + describir_ciclo(ciclo))
+
+class GrafoEspera:
+    """
+    Grafo de espera (wait-for graph) compartido por todos los LockInstrumentado
+
+    - duenos:    lock -> thread que lo tiene adquirido
+    - esperando: thread -> (lock que espera, instante en que empezó a esperar)
+
+    Como un thread espera a lo sumo un lock y un lock tiene a lo sumo un dueño,
+    cada thread tiene como máximo una arista saliente y un ciclo se encuentra
+    siguiendo la cadena thread -> lock esperado -> dueño -> ... en O(n).
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.duenos = {}
+        self.esperando = {}
+        self.victimas = set()
+
+    def buscar_ciclos(self):
+        """
+        Retorna los ciclos actuales como listas de (thread, lock_tenido, lock_esperado),
+        junto con el instante en que se cerró cada ciclo (la espera más reciente del ciclo).
+        Debe llamarse con self.lock adquirido.
+        """
+        ciclos = []
+        visitados = set()
+        for inicio in self.esperando:
+            if inicio in visitados:
+                continue
+            camino = []
+            posicion = {}
+            thread = inicio
+            while thread in self.esperando and thread not in visitados and thread not in posicion:
+                posicion[thread] = len(camino)
+                camino.append(thread)
+                thread = self.duenos.get(self.esperando[thread][0])
+            if thread in posicion:
+                miembros = camino[posicion[thread]:]
+                ciclo = []
+                for i, t in enumerate(miembros):
+                    lock_tenido = self.esperando[miembros[i-1]][0]
+                    ciclo.append((t, lock_tenido, self.esperando[t][0]))
+                cierre = max(self.esperando[t][1] for t in miembros)
+                ciclos.append((ciclo, cierre))
+            visitados.update(camino)
+        return ciclos
+
+class LockInstrumentado:
+    """
+    Reemplazo de threading.Lock que registra sus aristas en un GrafoEspera
+
+    La espera se hace en intervalos cortos (intervalo_espera) para poder lanzar
+    DeadlockDetectado si el detector elige a este thread como víctima.
+    """
+    def __init__(self, nombre, grafo, intervalo_espera=0.005):
+        self.nombre = nombre
+        self.grafo = grafo
+        self.intervalo_espera = intervalo_espera
+        self._lock = threading.Lock()
+
+    def acquire(self, blocking=True, timeout=-1):
+        thread = threading.current_thread()
+        grafo = self.grafo
+
+        # Camino rápido: lock libre, solo se registra el dueño
+        if self._lock.acquire(False):
+            with grafo.lock:
+                grafo.duenos[self] = thread
+            return True
+        if not blocking:
+            return False
+
+        with grafo.lock:
+            grafo.esperando[thread] = (self, time.perf_counter())
+
+        limite = None if timeout < 0 else time.perf_counter() + timeout
+        try:
+            while True:
+                intervalo = self.intervalo_espera
+                if limite is not None:
+                    intervalo = min(intervalo, max(limite - time.perf_counter(), 0))
+                if self._lock.acquire(timeout=intervalo):
+                    with grafo.lock:
+                        del grafo.esperando[thread]
+                        grafo.victimas.discard(thread)
+                        grafo.duenos[self] = thread
+                    return True
+                with grafo.lock:
+                    if thread in grafo.victimas:
+                        grafo.victimas.discard(thread)
+                        ciclo = [c for c, _ in grafo.buscar_ciclos() if any(t is thread for t, _, _ in c)]
+                        del grafo.esperando[thread]
+                        raise DeadlockDetectado(ciclo[0] if ciclo else [])
+                if limite is not None and time.perf_counter() >= limite:
+                    with grafo.lock:
+                        del grafo.esperando[thread]
+                    return False
+        except BaseException:
+            with grafo.lock:
+                grafo.esperando.pop(thread, None)
+            raise
+
+    def release(self):
+        # El dueño se borra antes de liberar para que el grafo nunca muestre
+        # un dueño que ya no tiene el lock
+        with self.grafo.lock:
+            self.grafo.duenos.pop(self, None)
+        self._lock.release()
+
+    def locked(self):
+        return self._lock.locked()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *args):
+        self.release()
+
+    def __repr__(self):
+        return self.nombre
+
+class DetectorDeadlock(threading.Thread):
+    """
+    Thread en segundo plano que revisa el grafo de espera cada `intervalo` segundos
+
+    - Reporta cada ciclo nuevo una sola vez, con su latencia de detección
+      (tiempo entre la arista que cerró el ciclo y su detección)
+    - Con romper=True marca como víctima al thread que empezó a esperar más
+      recientemente (el más joven del ciclo); su acquire() lanza DeadlockDetectado
+    """
+    def __init__(self, grafo, intervalo=0.001, romper=False, verbose=True):
+        super().__init__(name="DetectorDeadlock", daemon=True)
+        self.grafo = grafo
+        self.intervalo = intervalo
+        self.romper = romper
+        self.verbose = verbose
+        self.detecciones = []
+        self._reportados = set()
+        self._detener = threading.Event()
+
+    def run(self):
+        while not self._detener.wait(self.intervalo):
+            self.revisar()
+
+    def detener(self):
+        self._detener.set()
+        self.join()
+
+    def revisar(self):
+        """Busca ciclos una vez; retorna el número de ciclos nuevos detectados"""
+        nuevas = []
+        with self.grafo.lock:
+            ahora = time.perf_counter()
+            activos = set()
+            for ciclo, cierre in self.grafo.buscar_ciclos():
+                clave = frozenset(ciclo)
+                activos.add(clave)
+                if clave in self._reportados:
+                    continue
+                self._reportados.add(clave)
+
+                victima = None
+                if self.romper:
+                    victima = max((t for t, _, _ in ciclo), key=lambda t: self.grafo.esperando[t][1])
+                    self.grafo.victimas.add(victima)
+
+                nuevas.append((ciclo, {
+                    'ciclo': [(t.name, tenido.nombre, esperado.nombre) for t, tenido, esperado in ciclo],
+                    'latencia': ahora - cierre,
+                    'victima': victima.name if victima else None,
+                    'timestamp': timestamp()
+                }))
+            # Olvidar ciclos ya resueltos para poder reportarlos si se vuelven a formar
+            self._reportados &= activos
+
+        # Reportar fuera del lock del grafo para no bloquear los acquire()
+        for ciclo, deteccion in nuevas:
+            self.detecciones.append(deteccion)
+            if self.verbose:
+                print(f"[DETECTOR] [{deteccion['timestamp']}] DEADLOCK: {describir_ciclo(ciclo)} "
+                      f"(latencia {deteccion['latencia']*1000:.2f} ms)"
+                      + (f" - víctima: {deteccion['victima']}" if deteccion['victima'] else ""))
+        return len(nuevas)
+
+def describir_ciclo(ciclo):
+    """Ej.: 'Thread-1 tiene cuenta0 y espera cuenta1 -> Thread-2 tiene cuenta1 y espera cuenta0'"""
+    partes = []
+    for t, tenido, esperado in ciclo:
+        nombre = t if isinstance(t, str) else t.name
+        partes.append(f"{nombre} tiene {tenido} y espera {esperado}")
+    return " -> ".join(partes)
+
+def timestamp():
+    """Genera timestamp formateado"""
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
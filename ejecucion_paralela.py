@@ -0,0 +1,60 @@
+import os
+import contextlib
+import math
+import multiprocessing
+from collections import Counter
+
+def ejecutar_silenciado(funcion, ejecucion_num, silenciar=True):
+    """Corre en el proceso trabajador: una ejecución con la salida descartada"""
+    if not silenciar:
+        return funcion(ejecucion_num)
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        return funcion(ejecucion_num)
+
+def ejecutar_en_paralelo(funcion, ejecuciones, procesos=None, metodo_inicio='spawn', silenciar=True):
+    """
+    Ejecuta funcion(1) ... funcion(ejecuciones) repartidas en un pool de procesos
+
+    - funcion debe estar definida a nivel de módulo (se envía por nombre al trabajador),
+      por ejemplo ejecutar_simulacion o ejecutar_simulacion_segura
+    - maxtasksperchild=1: cada ejecución corre en un proceso nuevo, así ninguna hereda
+      threads, locks ni estado de módulo de otra; con metodo_inicio='spawn' además es un
+      intérprete recién iniciado ('fork' arranca más rápido pero copia el estado del padre)
+    - procesos: ejecuciones simultáneas (por defecto os.cpu_count())
+    Retorna la lista de resultados en orden de ejecución.
+    """
+    contexto = multiprocessing.get_context(metodo_inicio)
+    with contexto.Pool(procesos or os.cpu_count(), maxtasksperchild=1) as pool:
+        return pool.starmap(ejecutar_silenciado, [(funcion, i, silenciar) for i in range(1, ejecuciones + 1)],
+                            chunksize=1)
+
+def intervalo_wilson(exitos, total, z=1.96):
+    """Intervalo de confianza (95% por defecto) de una proporción, válido también cerca de 0 y 1"""
+    if not total:
+        return 0.0, 1.0
+    p = exitos / total
+    denominador = 1 + z * z / total
+    centro = (p + z * z / (2 * total)) / denominador
+    margen = z * math.sqrt(p * (1 - p) / total + z * z / (4 * total * total)) / denominador
+    return max(0.0, centro - margen), min(1.0, centro + margen)
+
+def resumir_resultados(resultados):
+    """
+    Agrega los diccionarios de ejecutar_simulacion()/ejecutar_simulacion_segura():
+    ejecuciones correctas con su intervalo de Wilson, distribución de (stock P0, stock P5)
+    y de cada stock por separado, y tiempos mínimo/promedio/máximo
+    """
+    correctas = sum(r['todos_correctos'] for r in resultados)
+    tiempos = [r['tiempo'] for r in resultados]
+    return {
+        'ejecuciones': len(resultados),
+        'correctas': correctas,
+        'tasa_correctas': correctas / len(resultados),
+        'intervalo_correctas': intervalo_wilson(correctas, len(resultados)),
+        'distribucion': Counter((r['stock_producto_0'], r['stock_producto_5']) for r in resultados),
+        'stock_producto_0': Counter(r['stock_producto_0'] for r in resultados),
+        'stock_producto_5': Counter(r['stock_producto_5'] for r in resultados),
+        'tiempo_min': min(tiempos),
+        'tiempo_promedio': sum(tiempos) / len(tiempos),
+        'tiempo_max': max(tiempos)
+    }
@@ -0,0 +1,368 @@
+import argparse
+import contextlib
+import json
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+
+import race_condition_con_problema
+import race_condition_solucion
+import deadlock_con_problema
+import deadlock_solucion
+import starvation_con_problema
+import starvation_solucion
+from detector_deadlock import GrafoEspera, DetectorDeadlock
+from exportador_resultados import ExportadorResultados, FORMATOS, formatos_disponibles, identificador_corrida
+
+NUM_CUENTAS = 5
+SALDO_TOTAL_INICIAL = sum(1000*(i+1) for i in range(NUM_CUENTAS))
+OPERACIONES_RACE_CON_PROBLEMA = 20 * 5  # 20 threads x 5 operaciones en ejecutar_simulacion()
+TIEMPO_MAXIMO_TRANSFERENCIAS = 10.0     # Threads aún vivos después de esto cuentan como bloqueados
+TIEMPO_MAXIMO_TAREA = 1.2               # Tarea más lenta (B en starvation_con_problema.py)
+NIVEL_CONFIANZA = 0.95
+REMUESTREOS_BOOTSTRAP = 2000
+
+@contextlib.contextmanager
+def silenciar_salida():
+    """Descarta los prints de los escenarios para no medir la terminal"""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+# ---------------------------------------------------------------------------
+# Escenarios: cada uno ejecuta una vez la simulación de su script y retorna
+# {'tiempo', 'operaciones', 'invariantes': {nombre: bool}, 'metricas': {...}}
+# ---------------------------------------------------------------------------
+
+def escenario_race_con_problema(ejecucion, opciones):
+    resultado = race_condition_con_problema.ejecutar_simulacion(ejecucion)
+    return {
+        'tiempo': resultado['tiempo'],
+        'operaciones': OPERACIONES_RACE_CON_PROBLEMA,
+        'invariantes': {
+            'producto_0_120': resultado['stock_producto_0'] == 120,
+            'producto_5_110': resultado['stock_producto_5'] == 110
+        },
+        'metricas': {'stock_producto_0': resultado['stock_producto_0'], 'stock_producto_5': resultado['stock_producto_5']}
+    }
+
+def escenario_race_solucion(ejecucion, opciones):
+    resultado = race_condition_solucion.ejecutar_simulacion_segura(ejecucion)
+    return {
+        'tiempo': resultado['tiempo'],
+        'operaciones': sum(len(ops) for ops in race_condition_solucion.OPERACIONES_DOCUMENTO),
+        'invariantes': {
+            'producto_0_120': resultado['stock_producto_0'] == 120,
+            'producto_5_110': resultado['stock_producto_5'] == 110
+        },
+        'metricas': {'stock_producto_0': resultado['stock_producto_0'], 'stock_producto_5': resultado['stock_producto_5']}
+    }
+
+def ejecutar_threads_transferencias(cuentas, funcion, argumentos_extra=()):
+    """
+    Un thread daemon por lista de OPERACIONES; espera hasta TIEMPO_MAXIMO_TRANSFERENCIAS.
+    Retorna (segundos, threads aún vivos).
+    """
+    threads = [threading.Thread(target=funcion, args=(cuentas, ops, *argumentos_extra), name=f"Thread-{i+1}", daemon=True)
+               for i, ops in enumerate(deadlock_solucion.OPERACIONES)]
+    tiempo_inicio = time.perf_counter()
+    for t in threads:
+        t.start()
+    limite = tiempo_inicio + TIEMPO_MAXIMO_TRANSFERENCIAS
+    for t in threads:
+        t.join(timeout=max(limite - time.perf_counter(), 0))
+    tiempo = time.perf_counter() - tiempo_inicio
+    return tiempo, sum(t.is_alive() for t in threads)
+
+def escenario_deadlock_con_problema(ejecucion, opciones):
+    """
+    transferir() sin orden de locks; como sin ayuda quedaría bloqueado para siempre, el
+    detector rompe cada ciclo eligiendo una víctima que reintenta (ejecutar_transferencias_con_reintentos)
+    """
+    grafo = GrafoEspera()
+    cuentas = deadlock_con_problema.crear_cuentas_instrumentadas(grafo, NUM_CUENTAS)
+    detector = DetectorDeadlock(grafo, romper=True, verbose=False)
+    detector.start()
+    reintentos = {}
+    tiempo, bloqueados = ejecutar_threads_transferencias(
+        cuentas, deadlock_con_problema.ejecutar_transferencias_con_reintentos, (reintentos,))
+    detector.detener()
+    return {
+        'tiempo': tiempo,
+        'operaciones': sum(len(ops) for ops in deadlock_con_problema.OPERACIONES),
+        'invariantes': {
+            'conservacion_dinero': sum(c.saldo for c in cuentas) == SALDO_TOTAL_INICIAL,
+            'sin_threads_bloqueados': bloqueados == 0
+        },
+        'metricas': {
+            'threads_bloqueados': bloqueados,
+            'deadlocks_detectados': len(detector.detecciones),
+            'reintentos': sum(reintentos.values())
+        }
+    }
+
+def escenario_deadlock_solucion(ejecucion, opciones):
+    cuentas = [deadlock_solucion.Cuenta(i, 1000*(i+1)) for i in range(NUM_CUENTAS)]
+    exitosas = []
+
+    def ejecutar(cuentas, transferencias):
+        exitosas.append(deadlock_solucion.ejecutar_transferencias_sin_deadlock(cuentas, transferencias))
+
+    tiempo, bloqueados = ejecutar_threads_transferencias(cuentas, ejecutar)
+    return {
+        'tiempo': tiempo,
+        'operaciones': sum(len(ops) for ops in deadlock_solucion.OPERACIONES),
+        'invariantes': {
+            'conservacion_dinero': sum(c.saldo for c in cuentas) == SALDO_TOTAL_INICIAL,
+            'sin_threads_bloqueados': bloqueados == 0
+        },
+        'metricas': {'threads_bloqueados': bloqueados, 'transferencias_exitosas': sum(exitosas)}
+    }
+
+def ejecutar_ventana_starvation(modulo, cola, secuencias, num_consumidores, duracion, stats):
+    """
+    Productores y consumidores de `modulo` durante `duracion` segundos, como main().
+    Son threads daemon: un productor que queda esperando lugar en la cola al cerrar
+    la ventana no impide continuar. Retorna (segundos, estado final de la cola).
+    """
+    tiempo_inicio = time.perf_counter()
+    producers = [modulo.Producer(cola, i+1, secuencia) for i, secuencia in enumerate(secuencias)]
+    consumers = [modulo.Consumer(cola, i+1, stats, tiempo_limite=duracion) for i in range(num_consumidores)]
+    for thread in producers + consumers:
+        thread.daemon = True
+        thread.start()
+    time.sleep(max(0, duracion - (time.perf_counter() - tiempo_inicio)))
+    for consumer in consumers:
+        consumer.running = False
+    # Un consumidor de la versión con problema puede quedar esperando en get() con la cola vacía
+    for consumer in consumers:
+        consumer.join(timeout=TIEMPO_MAXIMO_TAREA)
+    return time.perf_counter() - tiempo_inicio, cola.get_estado()
+
+def crear_stats_starvation():
+    return {
+        'A_procesadas': 0,
+        'M_procesadas': 0,
+        'B_procesadas': 0,
+        'tiempo_espera_B': [],
+        'procesamientos_forzados': 0,
+        'lock': threading.Lock()
+    }
+
+def resultado_starvation(tiempo, estado, stats, **metricas):
+    with stats['lock']:
+        procesadas = {clase: stats[f"{clase}_procesadas"] for clase in ('A', 'M', 'B')}
+        esperas_b = list(stats['tiempo_espera_B'])
+    return {
+        'tiempo': tiempo,
+        'operaciones': sum(procesadas.values()),
+        'invariantes': {'sin_tareas_b_pendientes': estado['B'] == 0},
+        'metricas': {
+            **{f'{clase}_procesadas': cantidad for clase, cantidad in procesadas.items()},
+            'tareas_b_pendientes': estado['B'],
+            'espera_maxima_b': max(esperas_b, default=None),
+            **metricas
+        },
+        'esperas_b': esperas_b
+    }
+
+def escenario_starvation_con_problema(ejecucion, opciones):
+    cola = starvation_con_problema.ColaPrioridades(capacidad_maxima=20)
+    stats = crear_stats_starvation()
+    tiempo, estado = ejecutar_ventana_starvation(starvation_con_problema, cola, starvation_con_problema.SECUENCIAS_PRODUCTORES,
+                                                 2, opciones.duracion_starvation, stats)
+    return resultado_starvation(tiempo, estado, stats)
+
+def escenario_starvation_solucion(ejecucion, opciones):
+    cola = starvation_solucion.ColaConAging(capacidad_maxima=20)
+    stats = crear_stats_starvation()
+    secuencias = starvation_solucion.generar_secuencias(random.Random(ejecucion))
+    tiempo, estado = ejecutar_ventana_starvation(starvation_solucion, cola, secuencias, 3, opciones.duracion_starvation, stats)
+    return resultado_starvation(tiempo, estado, stats, procesamientos_forzados=stats['procesamientos_forzados'])
+
+# nombre -> (función, ¿sus invariantes deben cumplirse siempre?)
+ESCENARIOS = {
+    'race_condition_con_problema': (escenario_race_con_problema, False),
+    'race_condition_solucion': (escenario_race_solucion, True),
+    'deadlock_con_problema': (escenario_deadlock_con_problema, False),
+    'deadlock_solucion': (escenario_deadlock_solucion, True),
+    'starvation_con_problema': (escenario_starvation_con_problema, False),
+    'starvation_solucion': (escenario_starvation_solucion, True),
+}
+
+# ---------------------------------------------------------------------------
+# Estadística
+# ---------------------------------------------------------------------------
+
+def intervalo_confianza_mediana(valores, nivel=NIVEL_CONFIANZA, remuestreos=REMUESTREOS_BOOTSTRAP, semilla=0):
+    """Intervalo bootstrap de percentiles para la mediana (semilla fija: mismos datos, mismo intervalo)"""
+    if len(valores) < 2:
+        return valores[0], valores[0]
+    rng = random.Random(semilla)
+    medianas = sorted(statistics.median(rng.choices(valores, k=len(valores))) for _ in range(remuestreos))
+    alfa = (1 - nivel) / 2
+    return medianas[round(alfa * (remuestreos - 1))], medianas[round((1 - alfa) * (remuestreos - 1))]
+
+def resumir(valores):
+    """Mediana, cuartiles, IQR, intervalo de confianza de la mediana, mínimo y máximo"""
+    if len(valores) >= 2:
+        q1, _, q3 = statistics.quantiles(valores, n=4, method='inclusive')
+    else:
+        q1 = q3 = valores[0]
+    ic_inferior, ic_superior = intervalo_confianza_mediana(valores)
+    return {
+        'mediana': statistics.median(valores),
+        'q1': q1,
+        'q3': q3,
+        'iqr': q3 - q1,
+        'ic_inferior': ic_inferior,
+        'ic_superior': ic_superior,
+        'min': min(valores),
+        'max': max(valores)
+    }
+
+# ---------------------------------------------------------------------------
+# Ejecución, comparación con la base y reporte
+# ---------------------------------------------------------------------------
+
+def ejecutar_escenario(nombre, repeticiones, calentamiento, opciones):
+    """Ejecuta calentamiento + repeticiones (solo se registran las repeticiones)"""
+    funcion, _ = ESCENARIOS[nombre]
+    ejecuciones = []
+    for i in range(calentamiento + repeticiones):
+        with silenciar_salida():
+            resultado = funcion(i + 1, opciones)
+        if i < calentamiento:
+            continue
+        resultado['ejecucion'] = len(ejecuciones) + 1
+        resultado['ops_seg'] = resultado['operaciones'] / resultado['tiempo']
+        ejecuciones.append(resultado)
+
+    nombres_invariantes = ejecuciones[0]['invariantes']
+    return {
+        'ejecuciones': ejecuciones,
+        'tiempo': resumir([e['tiempo'] for e in ejecuciones]),
+        'ops_seg': resumir([e['ops_seg'] for e in ejecuciones]),
+        'invariantes': {inv: sum(e['invariantes'][inv] for e in ejecuciones) for inv in nombres_invariantes}
+    }
+
+def comparar_con_base(resultados, base, tolerancia):
+    """
+    Regresión: la mediana empeora más que `tolerancia` respecto de la base (más tiempo
+    o menos ops/s) y los intervalos de confianza de ambas medianas no se solapan.
+    Retorna una fila por escenario y métrica comparados: (escenario, métrica, base, actual, cambio, regresión).
+    """
+    filas = []
+    for nombre, resultado in resultados.items():
+        if nombre not in base:
+            continue
+        for metrica, mayor_es_peor in (('tiempo', True), ('ops_seg', False)):
+            anterior, actual = base[nombre][metrica], resultado[metrica]
+            cambio = actual['mediana'] / anterior['mediana'] - 1
+            if mayor_es_peor:
+                regresion = cambio > tolerancia and actual['ic_inferior'] > anterior['ic_superior']
+            else:
+                regresion = -cambio > tolerancia and actual['ic_superior'] < anterior['ic_inferior']
+            filas.append((nombre, metrica, anterior['mediana'], actual['mediana'], cambio, regresion))
+    return filas
+
+def exportar_resultados(resultados, directorio, formatos):
+    """
+    Agrega las ejecuciones de esta corrida a directorio/<escenario>.csv (y Parquet):
+    una fila por ejecución y, en starvation, una fila por tarea B procesada con su espera
+    """
+    corrida = identificador_corrida()
+    with ExportadorResultados(directorio, formatos) as exportador:
+        for nombre, r in resultados.items():
+            for ejecucion in r['ejecuciones']:
+                exportador.agregar(nombre, {'corrida': corrida, **{clave: valor for clave, valor in ejecucion.items()
+                                                                   if clave != 'esperas_b'}})
+                for espera in ejecucion.get('esperas_b', ()):
+                    exportador.agregar(f"{nombre}_esperas_b",
+                                       {'corrida': corrida, 'ejecucion': ejecucion['ejecucion'], 'espera_b': espera})
+        if 'xlsx' in formatos:
+            exportador.exportar_xlsx(os.path.join(directorio, "resultados.xlsx"))
+
+def imprimir_resultados(resultados, repeticiones):
+    print(f"\n=== RESULTADOS ({repeticiones} EJECUCIONES POR ESCENARIO, IC {NIVEL_CONFIANZA:.0%} DE LA MEDIANA) ===")
+    print("| Escenario                   | Mediana (s) | IQR (s) | IC mediana (s)    | Ops/s (mediana) | IC ops/s          |")
+    print("|-----------------------------|-------------|---------|-------------------|-----------------|-------------------|")
+    for nombre, r in resultados.items():
+        t, o = r['tiempo'], r['ops_seg']
+        print(f"| {nombre:27} | {t['mediana']:11.3f} | {t['iqr']:7.3f} | {t['ic_inferior']:7.3f} - {t['ic_superior']:7.3f} | "
+              f"{o['mediana']:15.1f} | {o['ic_inferior']:7.1f} - {o['ic_superior']:7.1f} |")
+
+    print(f"\n=== INVARIANTES (EJECUCIONES QUE LOS CUMPLEN) ===")
+    print("| Escenario                   | Invariante               | Cumplen | Exigido |")
+    print("|-----------------------------|--------------------------|---------|---------|")
+    for nombre, r in resultados.items():
+        exigido = ESCENARIOS[nombre][1]
+        for invariante, cumplen in r['invariantes'].items():
+            print(f"| {nombre:27} | {invariante:24} | {f'{cumplen}/{repeticiones}':>7} | {'SÍ' if exigido else 'NO':7} |")
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Ejecuta los escenarios con problema y con solución N veces y reporta estadísticas")
+    parser.add_argument('--escenarios', nargs='+', choices=list(ESCENARIOS), default=list(ESCENARIOS))
+    parser.add_argument('--repeticiones', type=int, default=10)
+    parser.add_argument('--calentamiento', type=int, default=1, help="ejecuciones descartadas antes de medir")
+    parser.add_argument('--duracion-starvation', type=float, default=10.0, help="segundos de la ventana de starvation")
+    parser.add_argument('--json', help="ruta donde guardar los resultados (sirve como --base de una ejecución posterior)")
+    parser.add_argument('--base', help="JSON de una ejecución anterior contra el que detectar regresiones")
+    parser.add_argument('--tolerancia', type=float, default=0.10, help="empeoramiento relativo de la mediana tolerado")
+    parser.add_argument('--exportar', help="directorio donde agregar las ejecuciones (CSV/Parquet y resultados.xlsx)")
+    parser.add_argument('--formatos', nargs='+', choices=FORMATOS, default=formatos_disponibles(),
+                        help="formatos de --exportar (por defecto los que tienen sus dependencias instaladas)")
+    opciones = parser.parse_args(argumentos)
+
+    print("=== EJECUCIÓN DE PRUEBAS AUTOMATIZADAS ===")
+    print(f"Escenarios: {', '.join(opciones.escenarios)}")
+    print(f"Repeticiones: {opciones.repeticiones} (+{opciones.calentamiento} de calentamiento)")
+
+    resultados = {}
+    for nombre in opciones.escenarios:
+        tiempo_inicio = time.perf_counter()
+        resultados[nombre] = ejecutar_escenario(nombre, opciones.repeticiones, opciones.calentamiento, opciones)
+        print(f"[{nombre}] completado en {time.perf_counter() - tiempo_inicio:.1f} s")
+
+    imprimir_resultados(resultados, opciones.repeticiones)
+
+    fallos = [f"{nombre}: {invariante} {cumplen}/{opciones.repeticiones}"
+              for nombre, r in resultados.items() if ESCENARIOS[nombre][1]
+              for invariante, cumplen in r['invariantes'].items() if cumplen < opciones.repeticiones]
+
+    if opciones.base:
+        with open(opciones.base, encoding='utf-8') as archivo:
+            base = json.load(archivo)['escenarios']
+        print(f"\n=== COMPARACIÓN CON LA BASE ({opciones.base}, tolerancia {opciones.tolerancia:.0%}) ===")
+        print("| Escenario                   | Métrica | Base (mediana) | Actual (mediana) | Cambio   | Estado    |")
+        print("|-----------------------------|---------|----------------|------------------|----------|-----------|")
+        for nombre, metrica, anterior, actual, cambio, regresion in comparar_con_base(resultados, base, opciones.tolerancia):
+            print(f"| {nombre:27} | {metrica:7} | {anterior:14.3f} | {actual:16.3f} | {cambio:+8.1%} | {'REGRESIÓN' if regresion else 'OK':9} |")
+            if regresion:
+                fallos.append(f"{nombre}: regresión en {metrica} ({cambio:+.1%})")
+
+    if opciones.json:
+        datos = {
+            'configuracion': {clave: valor for clave, valor in vars(opciones).items() if clave not in ('json', 'base', 'exportar', 'formatos')},
+            'escenarios': resultados
+        }
+        with open(opciones.json, 'w', encoding='utf-8') as archivo:
+            json.dump(datos, archivo, indent=2, ensure_ascii=False)
+        print(f"\nResultados guardados en {opciones.json}")
+
+    if opciones.exportar:
+        exportar_resultados(resultados, opciones.exportar, opciones.formatos)
+        print(f"Ejecuciones agregadas en {opciones.exportar} ({', '.join(opciones.formatos)})")
+
+    if fallos:
+        print("\n❌ FALLOS:")
+        for fallo in fallos:
+            print(f"- {fallo}")
+        return 1
+    print("\n✅ Invariantes exigidos cumplidos y sin regresiones")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
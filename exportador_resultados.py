@@ -0,0 +1,228 @@
+import csv
+import json
+import os
+from datetime import datetime
+
+# Dependencias opcionales: solo hacen falta para exportar en su formato
+try:
+    import openpyxl
+except ImportError:
+    openpyxl = None
+try:
+    import pyarrow
+    import pyarrow.parquet as pq
+except ImportError:
+    pyarrow = pq = None
+
+FORMATOS = ('csv', 'parquet', 'xlsx')
+FILAS_MAXIMAS_HOJA = 1048576   # Límite de filas de una hoja de Excel (incluye el encabezado)
+LARGO_MAXIMO_NOMBRE_HOJA = 31
+
+def formatos_disponibles():
+    """Formatos cuyas dependencias están instaladas (csv siempre)"""
+    return tuple(formato for formato, disponible in (('csv', True), ('parquet', pq is not None), ('xlsx', openpyxl is not None))
+                 if disponible)
+
+def verificar_formato(formato):
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato desconocido: {formato} (disponibles: {', '.join(FORMATOS)})")
+    if formato == 'parquet' and pq is None:
+        raise ImportError("Exportar a Parquet requiere pyarrow: pip install pyarrow")
+    if formato == 'xlsx' and openpyxl is None:
+        raise ImportError("Exportar a XLSX requiere openpyxl: pip install openpyxl")
+
+def identificador_corrida():
+    """Identifica las filas de una misma invocación dentro de archivos que se van agregando"""
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+def aplanar(diccionario, prefijo=''):
+    """{'metricas': {'reintentos': 2}} -> {'metricas_reintentos': 2}; listas y tuplas como JSON"""
+    fila = {}
+    for clave, valor in diccionario.items():
+        nombre = f"{prefijo}{clave}"
+        if isinstance(valor, dict):
+            fila.update(aplanar(valor, f"{nombre}_"))
+        elif isinstance(valor, (list, tuple)):
+            fila[nombre] = json.dumps(valor)
+        else:
+            fila[nombre] = valor
+    return fila
+
+def convertir_celda(texto):
+    """Valor de una celda CSV con su tipo (int, float, bool o None) para Excel y los resúmenes"""
+    if texto == '':
+        return None
+    if texto in ('True', 'False'):
+        return texto == 'True'
+    for tipo in (int, float):
+        try:
+            return tipo(texto)
+        except ValueError:
+            pass
+    return texto
+
+def partes_parquet(directorio):
+    return sorted(os.path.join(directorio, n) for n in os.listdir(directorio) if n.endswith('.parquet'))
+
+def leer_parquet(directorio, escenario):
+    """
+    Tabla de pyarrow con todas las partes de un escenario. Los esquemas de las partes se
+    unifican: una columna que en una parte quedó de tipo null toma el tipo de las demás.
+    """
+    verificar_formato('parquet')
+    partes = partes_parquet(os.path.join(directorio, escenario))
+    esquema = pyarrow.unify_schemas([pq.read_schema(parte) for parte in partes])
+    return pq.read_table(partes, schema=esquema)
+
+class EscenarioExportado:
+    """Archivos abiertos de un escenario: CSV en modo append y lote pendiente de Parquet"""
+    def __init__(self, directorio, nombre, formatos):
+        self.nombre = nombre
+        self.archivo_csv = None
+        self.escritor_csv = None
+        self.lote_parquet = [] if 'parquet' in formatos else None
+        self.directorio_parquet = os.path.join(directorio, nombre)
+        if 'csv' in formatos:
+            ruta = os.path.join(directorio, f"{nombre}.csv")
+            self.columnas = self._leer_encabezado(ruta)
+            self.archivo_csv = open(ruta, 'a', newline='', encoding='utf-8')
+
+    @staticmethod
+    def _leer_encabezado(ruta):
+        if not os.path.exists(ruta) or os.path.getsize(ruta) == 0:
+            return None
+        with open(ruta, newline='', encoding='utf-8') as archivo:
+            return next(csv.reader(archivo))
+
+    def escribir_csv(self, fila):
+        if self.escritor_csv is None:
+            # Al agregar a un CSV existente se conservan sus columnas (una columna nueva es un error)
+            nuevo = self.columnas is None
+            self.columnas = self.columnas or list(fila)
+            self.escritor_csv = csv.DictWriter(self.archivo_csv, fieldnames=self.columnas)
+            if nuevo:
+                self.escritor_csv.writeheader()
+        self.escritor_csv.writerow(fila)
+
+    def volcar_parquet(self):
+        """Escribe el lote pendiente como una parte nueva: agregar nunca reescribe las anteriores"""
+        if not self.lote_parquet:
+            return
+        os.makedirs(self.directorio_parquet, exist_ok=True)
+        partes = partes_parquet(self.directorio_parquet)
+        tabla = pyarrow.Table.from_pylist(self.lote_parquet)
+        if partes:
+            # Una columna sin valores en este lote queda de tipo null: usar el tipo de las partes anteriores
+            anterior = pq.read_schema(partes[0])
+            tabla = tabla.cast(pyarrow.schema([
+                anterior.field(campo.name) if pyarrow.types.is_null(campo.type) and campo.name in anterior.names else campo
+                for campo in tabla.schema]))
+        pq.write_table(tabla, os.path.join(self.directorio_parquet, f"parte-{len(partes) + 1:05d}.parquet"))
+        self.lote_parquet = []
+
+    def cerrar(self):
+        if self.lote_parquet is not None:
+            self.volcar_parquet()
+        if self.archivo_csv is not None:
+            self.archivo_csv.close()
+
+class ExportadorResultados:
+    """
+    Exporta resultados por ejecución o por evento, escenario por escenario, en streaming
+
+    directorio/
+        <escenario>.csv              una fila por agregar(); se abre en modo append
+        <escenario>/parte-NNNNN.parquet
+                                     una parte por cada `filas_por_parte` filas (se leen
+                                     juntas con leer_parquet(directorio, escenario))
+
+    Ninguno de los dos formatos reescribe lo ya exportado, así que ejecutar de nuevo agrega
+    las ejecuciones nuevas. exportar_xlsx() genera el libro a partir de los CSV.
+    """
+    def __init__(self, directorio, formatos=('csv',), filas_por_parte=50000):
+        for formato in formatos:
+            verificar_formato(formato)
+        self.directorio = directorio
+        # El libro XLSX se genera a partir de los CSV
+        self.formatos = tuple(formato for formato in formatos if formato != 'xlsx')
+        if 'xlsx' in formatos and 'csv' not in self.formatos:
+            self.formatos = ('csv',) + self.formatos
+        self.filas_por_parte = filas_por_parte
+        self.escenarios = {}
+        os.makedirs(directorio, exist_ok=True)
+
+    def agregar(self, escenario, fila):
+        """Agrega una fila (diccionario; los anidados se aplanan) al escenario"""
+        exportado = self.escenarios.get(escenario)
+        if exportado is None:
+            exportado = self.escenarios[escenario] = EscenarioExportado(self.directorio, escenario, self.formatos)
+        fila = aplanar(fila)
+        if exportado.archivo_csv is not None:
+            exportado.escribir_csv(fila)
+        if exportado.lote_parquet is not None:
+            exportado.lote_parquet.append(fila)
+            if len(exportado.lote_parquet) >= self.filas_por_parte:
+                exportado.volcar_parquet()
+
+    def agregar_muchas(self, escenario, filas):
+        for fila in filas:
+            self.agregar(escenario, fila)
+
+    def cerrar(self):
+        for exportado in self.escenarios.values():
+            exportado.cerrar()
+        self.escenarios = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+        return False
+
+    def exportar_xlsx(self, ruta):
+        """
+        Libro con una hoja por CSV del directorio y una hoja Resumen
+
+        Se escribe con el modo write-only de openpyxl fila por fila leyendo cada CSV, así que
+        la memoria no crece con la cantidad de filas. Un escenario con más filas de las que
+        admite una hoja continúa en '<escenario> (2)', '<escenario> (3)', ...
+        Resumen: por escenario, corrida y columna numérica, filas, promedio, mínimo y máximo
+        (en columnas booleanas el promedio es la proporción de True).
+        """
+        verificar_formato('xlsx')
+        self.cerrar()
+        libro = openpyxl.Workbook(write_only=True)
+        resumen = {}
+        for nombre in sorted(n[:-len('.csv')] for n in os.listdir(self.directorio) if n.endswith('.csv')):
+            with open(os.path.join(self.directorio, f"{nombre}.csv"), newline='', encoding='utf-8') as archivo:
+                lector = csv.reader(archivo)
+                columnas = next(lector, None)
+                if columnas is None:
+                    continue
+                indice_corrida = columnas.index('corrida') if 'corrida' in columnas else None
+                hoja, filas_hoja, numero_hoja = None, FILAS_MAXIMAS_HOJA, 0
+                for textos in lector:
+                    if filas_hoja >= FILAS_MAXIMAS_HOJA:
+                        numero_hoja += 1
+                        sufijo = f" ({numero_hoja})" if numero_hoja > 1 else ""
+                        hoja = libro.create_sheet(nombre[:LARGO_MAXIMO_NOMBRE_HOJA - len(sufijo)] + sufijo)
+                        hoja.append(columnas)
+                        filas_hoja = 1
+                    valores = [convertir_celda(texto) for texto in textos]
+                    hoja.append(valores)
+                    filas_hoja += 1
+                    corrida = textos[indice_corrida] if indice_corrida is not None else ''
+                    for columna, valor in zip(columnas, valores):
+                        if isinstance(valor, (int, float)):
+                            acumulado = resumen.setdefault((nombre, corrida, columna), [0, 0.0, valor, valor])
+                            acumulado[0] += 1
+                            acumulado[1] += valor
+                            acumulado[2] = min(acumulado[2], valor)
+                            acumulado[3] = max(acumulado[3], valor)
+
+        hoja = libro.create_sheet("Resumen")
+        hoja.append(["Escenario", "Corrida", "Columna", "Filas", "Promedio", "Mínimo", "Máximo"])
+        for (nombre, corrida, columna), (filas, suma, minimo, maximo) in resumen.items():
+            hoja.append([nombre, corrida, columna, filas, suma / filas, minimo, maximo])
+        libro.save(ruta)
@@ -0,0 +1,130 @@
+import threading
+import time
+import queue
+from concurrent.futures import Future
+
+class DuenoParticion(threading.Thread):
+    """
+    Thread único que escribe los saldos de una partición de cuentas
+
+    Toma mensajes de su cola en lotes (hasta lote_maximo por ciclo) y los aplica sin
+    locks de cuenta, porque ningún otro thread modifica los saldos de su partición:
+    - ('transferir', origen, destino, monto, futuro): el origen es de esta partición
+    - ('acreditar', destino, monto, futuro): crédito enviado por otra partición
+    - ('barrera', evento): marca que todo lo encolado antes ya fue aplicado
+    """
+    def __init__(self, ledger, particion_id, lote_maximo, tiempo_procesamiento):
+        super().__init__(name=f"Ledger-{particion_id}", daemon=True)
+        self.ledger = ledger
+        self.particion_id = particion_id
+        self.cola = queue.SimpleQueue()
+        self.lote_maximo = lote_maximo
+        self.tiempo_procesamiento = tiempo_procesamiento
+        self.lotes_aplicados = 0
+        self.mensajes_aplicados = 0
+
+    def run(self):
+        cola = self.cola
+        while True:
+            lote = [cola.get()]
+            try:
+                while len(lote) < self.lote_maximo:
+                    lote.append(cola.get_nowait())
+            except queue.Empty:
+                pass
+
+            # El procesamiento simulado se paga una vez por lote
+            if self.tiempo_procesamiento:
+                time.sleep(self.tiempo_procesamiento)
+
+            for mensaje in lote:
+                if mensaje is None:
+                    return
+                self.aplicar(mensaje)
+            self.lotes_aplicados += 1
+            self.mensajes_aplicados += len(lote)
+
+    def aplicar(self, mensaje):
+        cuentas = self.ledger.cuentas
+        if mensaje[0] == 'barrera':
+            mensaje[1].set()
+            return
+        if mensaje[0] == 'acreditar':
+            _, destino, monto, futuro = mensaje
+            cuentas[destino].saldo += monto
+            futuro.set_result(True)
+            return
+
+        _, origen, destino, monto, futuro = mensaje
+        cta_origen = cuentas[origen]
+        if cta_origen.saldo < monto:
+            futuro.set_result(False)
+            return
+
+        cta_origen.saldo -= monto
+        particion_destino = self.ledger.particion(destino)
+        if particion_destino == self.particion_id:
+            cuentas[destino].saldo += monto
+            futuro.set_result(True)
+        else:
+            # Transferencia entre particiones: el débito ya es definitivo y el
+            # crédito se delega al dueño de la cuenta destino, que completa el futuro
+            self.ledger.duenos[particion_destino].cola.put(('acreditar', destino, monto, futuro))
+
+class LedgerParticionado:
+    """
+    VERSIÓN SIN DEADLOCK - Escritor único por partición (modelo de actores)
+
+    TÉCNICA IMPLEMENTADA: Eliminación de la Exclusión Mutua sobre las cuentas
+    - Las cuentas se reparten en particiones (cuenta_id % num_particiones)
+    - Cada partición tiene un único thread dueño que aplica las transferencias en lotes
+    - Los clientes encolan la transferencia en el dueño de la cuenta origen y reciben
+      un Future que se resuelve con True (éxito) o False (saldo insuficiente)
+    - Entre particiones, el dueño del origen debita y envía el crédito al dueño del
+      destino; ningún thread espera a otro mientras retiene un recurso, así que no
+      puede formarse espera circular
+
+    El dinero debitado y aún no acreditado está "en tránsito": la suma de saldos solo
+    es exacta cuando no hay mensajes pendientes (por ejemplo, después de detener()).
+    """
+    def __init__(self, cuentas, num_particiones=4, lote_maximo=256, tiempo_procesamiento=0.0):
+        self.cuentas = cuentas
+        self.num_particiones = num_particiones
+        self.duenos = [DuenoParticion(self, i, lote_maximo, tiempo_procesamiento) for i in range(num_particiones)]
+        for dueno in self.duenos:
+            dueno.start()
+
+    def particion(self, cuenta_id):
+        return cuenta_id % self.num_particiones
+
+    def transferir(self, origen, destino, monto):
+        """Encola la transferencia y retorna un Future con el resultado (True/False)"""
+        futuro = Future()
+        self.duenos[self.particion(origen)].cola.put(('transferir', origen, destino, monto, futuro))
+        return futuro
+
+    def detener(self):
+        """
+        Aplica todo lo encolado y detiene los dueños (los clientes ya no deben enviar).
+        Primero una barrera en cada cola: al pasarla, todas las transferencias previas
+        fueron procesadas y sus créditos entre particiones ya están encolados. Después
+        el fin (None) queda detrás de esos créditos en cada cola.
+        """
+        barreras = [threading.Event() for _ in self.duenos]
+        for dueno, barrera in zip(self.duenos, barreras):
+            dueno.cola.put(('barrera', barrera))
+        for barrera in barreras:
+            barrera.wait()
+        for dueno in self.duenos:
+            dueno.cola.put(None)
+        for dueno in self.duenos:
+            dueno.join()
+
+    def estadisticas(self):
+        lotes = sum(d.lotes_aplicados for d in self.duenos)
+        mensajes = sum(d.mensajes_aplicados for d in self.duenos)
+        return {
+            'lotes': lotes,
+            'mensajes': mensajes,
+            'mensajes_por_lote': mensajes / lotes if lotes else 0.0
+        }
@@ -0,0 +1,61 @@
+import threading
+import contextlib
+
+class LockLectoresEscritor:
+    """
+    Lock de lectores/escritor con preferencia de escritura
+
+    - lectura(): varios lectores pueden tener el lock a la vez
+    - `with lock:` o acquire()/release(): escritura, un solo escritor y sin lectores,
+      así que reemplaza directamente a un threading.Lock usado de forma exclusiva
+    - Preferencia de escritura: mientras haya un escritor esperando, los lectores nuevos
+      esperan detrás de él. Un flujo continuo de lectores no puede dejar sin turno a las
+      ventas y reabastecimientos (los lectores sí pueden esperar si las escrituras no paran)
+    - No es reentrante: un thread con lectura no debe volver a pedir lectura ni escritura
+    - condicion: la Condition interna (por ejemplo la de un BucleVirtual para simular)
+    """
+    def __init__(self, condicion=None):
+        self.condicion = condicion if condicion is not None else threading.Condition(threading.Lock())
+        self.lectores = 0
+        self.escritor_activo = False
+        self.escritores_esperando = 0
+
+    def adquirir_lectura(self):
+        with self.condicion:
+            while self.escritor_activo or self.escritores_esperando:
+                self.condicion.wait()
+            self.lectores += 1
+
+    def liberar_lectura(self):
+        with self.condicion:
+            self.lectores -= 1
+            if self.lectores == 0:
+                self.condicion.notify_all()
+
+    def acquire(self):
+        with self.condicion:
+            self.escritores_esperando += 1
+            while self.escritor_activo or self.lectores:
+                self.condicion.wait()
+            self.escritores_esperando -= 1
+            self.escritor_activo = True
+        return True
+
+    def release(self):
+        with self.condicion:
+            self.escritor_activo = False
+            self.condicion.notify_all()
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, *exc):
+        self.release()
+
+    @contextlib.contextmanager
+    def lectura(self):
+        self.adquirir_lectura()
+        try:
+            yield
+        finally:
+            self.liberar_lectura()
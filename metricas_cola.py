@@ -0,0 +1,178 @@
+import threading
+import time
+import json
+import csv
+from array import array
+
+class HistogramaLatencia:
+    """
+    Histograma de latencias con memoria fija al estilo HDR (log-lineal)
+
+    Los valores se registran en microsegundos enteros. Hasta 2**bits_sub µs cada
+    valor tiene su propio contador; por encima, cada potencia de dos se divide en
+    2**(bits_sub-1) sub-buckets, así que el error relativo es menor a 1/2**(bits_sub-1)
+    (< 1.6% con bits_sub=7). Con valor_maximo de 1 hora son ~1.700 contadores,
+    independientemente de cuántas tareas se registren.
+    """
+    def __init__(self, valor_maximo=3600.0, bits_sub=7):
+        self.bits_sub = bits_sub
+        self.mitad = 1 << (bits_sub - 1)
+        self.maximo_us = int(valor_maximo * 1e6)
+        self.contadores = array('q', [0] * (self._indice(self.maximo_us) + 1))
+        self.total = 0
+        self.suma_us = 0
+        self.minimo_us = None
+        self.maximo_registrado_us = 0
+        self.lock = threading.Lock()
+
+    def _indice(self, valor_us):
+        magnitud = valor_us.bit_length() - self.bits_sub
+        if magnitud <= 0:
+            return valor_us
+        return magnitud * self.mitad + (valor_us >> magnitud)
+
+    def _valor(self, indice):
+        """Valor representativo (punto medio) del bucket"""
+        if indice < 2 * self.mitad:
+            return indice
+        magnitud = indice // self.mitad - 1
+        sub = indice - magnitud * self.mitad
+        return (sub << magnitud) + (1 << magnitud) // 2
+
+    def registrar(self, segundos):
+        valor_us = min(max(int(segundos * 1e6), 0), self.maximo_us)
+        indice = self._indice(valor_us)
+        with self.lock:
+            self.contadores[indice] += 1
+            self.total += 1
+            self.suma_us += valor_us
+            if self.minimo_us is None or valor_us < self.minimo_us:
+                self.minimo_us = valor_us
+            if valor_us > self.maximo_registrado_us:
+                self.maximo_registrado_us = valor_us
+
+    def percentil(self, p):
+        """Latencia (segundos) bajo la cual está el p% de los registros"""
+        with self.lock:
+            if not self.total:
+                return None
+            objetivo = max(1, -(-self.total * p // 100))
+            acumulado = 0
+            for indice, cantidad in enumerate(self.contadores):
+                acumulado += cantidad
+                if acumulado >= objetivo:
+                    return min(self._valor(indice), self.maximo_registrado_us) / 1e6
+        return self.maximo_registrado_us / 1e6
+
+    def resumen(self):
+        """Cantidad, media, máximo y p50/p90/p99/p999 en milisegundos"""
+        if not self.total:
+            return {'cantidad': 0}
+        resumen = {
+            'cantidad': self.total,
+            'media_ms': self.suma_us / self.total / 1000,
+            'min_ms': self.minimo_us / 1000,
+            'max_ms': self.maximo_registrado_us / 1000
+        }
+        for nombre, p in (('p50', 50), ('p90', 90), ('p99', 99), ('p999', 99.9)):
+            resumen[f'{nombre}_ms'] = self.percentil(p) * 1000
+        return resumen
+
+class SerieProfundidad:
+    """
+    Profundidad de la cola por clase muestreada periódicamente en un buffer circular
+
+    Un thread daemon llama a cola.get_estado() cada `intervalo` segundos y guarda
+    (t, A, M, B) en un array preasignado de `capacidad` muestras; al llenarse se
+    sobrescriben las más antiguas.
+    """
+    CAMPOS = ('t', 'A', 'M', 'B')
+
+    def __init__(self, capacidad=1024, intervalo=0.1):
+        self.capacidad = capacidad
+        self.intervalo = intervalo
+        self.muestras = array('d', [0.0] * (capacidad * len(self.CAMPOS)))
+        self.escritas = 0
+        self.lock = threading.Lock()
+        self.detener_evento = threading.Event()
+        self.thread = None
+
+    def registrar(self, t, estado):
+        with self.lock:
+            base = (self.escritas % self.capacidad) * len(self.CAMPOS)
+            self.muestras[base:base + 4] = array('d', (t, estado['A'], estado['M'], estado['B']))
+            self.escritas += 1
+
+    def iniciar(self, cola):
+        tiempo_inicio = time.perf_counter()
+
+        def muestrear():
+            while not self.detener_evento.wait(self.intervalo):
+                self.registrar(time.perf_counter() - tiempo_inicio, cola.get_estado())
+
+        self.thread = threading.Thread(target=muestrear, name="Muestreo-Profundidad", daemon=True)
+        self.thread.start()
+
+    def detener(self):
+        self.detener_evento.set()
+        if self.thread is not None:
+            self.thread.join()
+
+    def filas(self):
+        """Muestras retenidas en orden cronológico como tuplas (t, A, M, B)"""
+        with self.lock:
+            cantidad = min(self.escritas, self.capacidad)
+            primera = self.escritas - cantidad
+            filas = []
+            for i in range(primera, self.escritas):
+                base = (i % self.capacidad) * len(self.CAMPOS)
+                t, a, m, b = self.muestras[base:base + 4]
+                filas.append((t, int(a), int(m), int(b)))
+            return filas
+
+class MetricasCola:
+    """
+    Instrumentación de ColaConAging y Consumer con memoria fija
+
+    - espera: encolado -> desencolado (registrada por la cola en get())
+    - servicio: desencolado -> completada (registrada por el consumidor)
+    Ambas por clase original de la tarea (una B promovida a M cuenta como B).
+    """
+    CLASES = ('A', 'M', 'B')
+
+    def __init__(self, intervalo_muestreo=0.1, capacidad_serie=1024):
+        self.espera = {clase: HistogramaLatencia() for clase in self.CLASES}
+        self.servicio = {clase: HistogramaLatencia() for clase in self.CLASES}
+        self.profundidad = SerieProfundidad(capacidad_serie, intervalo_muestreo)
+
+    def registrar_espera(self, clase, segundos):
+        self.espera[clase].registrar(segundos)
+
+    def registrar_servicio(self, clase, segundos):
+        self.servicio[clase].registrar(segundos)
+
+    def iniciar_muestreo(self, cola):
+        self.profundidad.iniciar(cola)
+
+    def detener_muestreo(self):
+        self.profundidad.detener()
+
+    def percentiles(self):
+        """Resumen por clase de espera y servicio; se puede llamar durante la ejecución"""
+        return {
+            'espera': {clase: h.resumen() for clase, h in self.espera.items()},
+            'servicio': {clase: h.resumen() for clase, h in self.servicio.items()}
+        }
+
+    def guardar_json(self, ruta, extra=None):
+        datos = {'latencias': self.percentiles(), 'profundidad': self.profundidad.filas()}
+        if extra:
+            datos.update(extra)
+        with open(ruta, 'w', encoding='utf-8') as archivo:
+            json.dump(datos, archivo, indent=2, ensure_ascii=False)
+
+    def guardar_csv_profundidad(self, ruta):
+        with open(ruta, 'w', newline='', encoding='utf-8') as archivo:
+            escritor = csv.writer(archivo)
+            escritor.writerow(SerieProfundidad.CAMPOS)
+            escritor.writerows(self.profundidad.filas())
@@ -1,8 +1,11 @@
 import threading
+import argparse
 import time
 from datetime import datetime
 import random
 
+from ejecucion_paralela import ejecutar_en_paralelo
+
 class Producto:
     def __init__(self, id, stock_inicial=100):
         self.id = id
@@ -12,48 +15,56 @@ class Producto:
         return f"Producto[{self.id}] = {self.stock} unidades"
 
 class GestorInventario:
-    def __init__(self, num_productos=10):
+    """dormir reemplaza a time.sleep (simulacion_virtual.py pasa el de un BucleVirtual)"""
+    def __init__(self, num_productos=10, tiempo_procesamiento=0.001, verbose=True, dormir=time.sleep):
         # Crear 10 productos con stock inicial de 100 unidades cada uno
         self.productos = [Producto(i, 100) for i in range(num_productos)]
         self.operaciones_completadas = 0
         self.operaciones_fallidas = 0
+        self.tiempo_procesamiento = tiempo_procesamiento
+        self.verbose = verbose
+        self.dormir = dormir
+    
+    def _log(self, thread_name, mensaje):
+        if self.verbose:
+            print(f"[{thread_name}] [{timestamp()}] {mensaje}")
         
     def vender(self, producto_id, cantidad, thread_name):
         """VERSIÓN CON RACE CONDITION: Sin sincronización"""
         producto = self.productos[producto_id]
         
-        print(f"[{thread_name}] [{timestamp()}] Iniciando VENTA: Producto {producto_id}, cantidad {cantidad}")
+        self._log(thread_name, f"Iniciando VENTA: Producto {producto_id}, cantidad {cantidad}")
         
         # SECCIÓN CRÍTICA SIN PROTECCIÓN - AQUÍ OCURRE LA RACE CONDITION
         stock_actual = producto.stock  # Lectura
-        time.sleep(0.001)  # Simula tiempo de procesamiento (ventana para race condition)
+        self.dormir(self.tiempo_procesamiento)  # Simula tiempo de procesamiento (ventana para race condition)
         
         if stock_actual >= cantidad:
             nuevo_stock = stock_actual - cantidad  # Cálculo
-            time.sleep(0.001)  # Más tiempo para aumentar probabilidad de race condition
+            self.dormir(self.tiempo_procesamiento)  # Más tiempo para aumentar probabilidad de race condition
             producto.stock = nuevo_stock  # Escritura
             
-            print(f"[{thread_name}] [{timestamp()}] VENTA EXITOSA: Producto {producto_id}, vendido {cantidad}, stock restante: {producto.stock}")
+            self._log(thread_name, f"VENTA EXITOSA: Producto {producto_id}, vendido {cantidad}, stock restante: {producto.stock}")
             self.operaciones_completadas += 1
         else:
-            print(f"[{thread_name}] [{timestamp()}] VENTA FALLIDA: Producto {producto_id}, stock insuficiente ({stock_actual} < {cantidad})")
+            self._log(thread_name, f"VENTA FALLIDA: Producto {producto_id}, stock insuficiente ({stock_actual} < {cantidad})")
             self.operaciones_fallidas += 1
     
     def reabastecer(self, producto_id, cantidad, thread_name):
         """VERSIÓN CON RACE CONDITION: Sin sincronización"""
         producto = self.productos[producto_id]
         
-        print(f"[{thread_name}] [{timestamp()}] Iniciando REABASTECIMIENTO: Producto {producto_id}, cantidad {cantidad}")
+        self._log(thread_name, f"Iniciando REABASTECIMIENTO: Producto {producto_id}, cantidad {cantidad}")
         
         # SECCIÓN CRÍTICA SIN PROTECCIÓN - AQUÍ OCURRE LA RACE CONDITION
         stock_actual = producto.stock  # Lectura
-        time.sleep(0.001)  # Simula tiempo de procesamiento (ventana para race condition)
+        self.dormir(self.tiempo_procesamiento)  # Simula tiempo de procesamiento (ventana para race condition)
         
         nuevo_stock = stock_actual + cantidad  # Cálculo
-        time.sleep(0.001)  # Más tiempo para aumentar probabilidad de race condition
+        self.dormir(self.tiempo_procesamiento)  # Más tiempo para aumentar probabilidad de race condition
         producto.stock = nuevo_stock  # Escritura
         
-        print(f"[{thread_name}] [{timestamp()}] REABASTECIMIENTO EXITOSO: Producto {producto_id}, agregado {cantidad}, stock actual: {producto.stock}")
+        self._log(thread_name, f"REABASTECIMIENTO EXITOSO: Producto {producto_id}, agregado {cantidad}, stock actual: {producto.stock}")
         self.operaciones_completadas += 1
     
     def obtener_stock(self, producto_id):
@@ -230,7 +241,7 @@ def ejecutar_simulacion(ejecucion_num):
         'tiempo': tiempo_total
     }
 
-def main():
+def main(procesos=None):
     print("=== SIMULACIÓN DE RACE CONDITIONS - GESTOR DE INVENTARIO CONCURRENTE ===")
     print("VERSIÓN CON RACE CONDITION: Sin sincronización")
     print("Especificaciones:")
@@ -242,17 +253,22 @@ def main():
     
     resultados = []
     
-    # Ejecutar 10 veces para documentar inconsistencias
-    for i in range(1, 11):
-        resultado = ejecutar_simulacion(i)
-        resultados.append(resultado)
-        
-        # Pausa entre ejecuciones
-        if i < 10:
-            print(f"\n{'*'*60}")
-            print(f"Preparando ejecución #{i+1}...")
-            print(f"{'*'*60}")
-            time.sleep(1)
+    if procesos:
+        # Ejecuciones independientes repartidas en procesos (salida de cada una descartada)
+        print(f"Modo paralelo: {procesos} procesos, un proceso nuevo por ejecución")
+        resultados = ejecutar_en_paralelo(ejecutar_simulacion, 10, procesos)
+    else:
+        # Ejecutar 10 veces para documentar inconsistencias
+        for i in range(1, 11):
+            resultado = ejecutar_simulacion(i)
+            resultados.append(resultado)
+            
+            # Pausa entre ejecuciones
+            if i < 10:
+                print(f"\n{'*'*60}")
+                print(f"Preparando ejecución #{i+1}...")
+                print(f"{'*'*60}")
+                time.sleep(1)
     
     # Resumen final de todas las ejecuciones
     print(f"\n{'='*80}")
@@ -311,4 +327,6 @@ def main():
     print(f"\nTIMESTAMP FIN: {timestamp()}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--procesos', type=int, help="repartir las 10 ejecuciones en N procesos (sin pausas entre ejecuciones)")
+    main(parser.parse_args().procesos)
\ No newline at end of file
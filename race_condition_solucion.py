@@ -1,9 +1,21 @@
 import threading
+import argparse
 import time
 from datetime import datetime
 import random
+import os
+import contextlib
+import bisect
+import itertools
+from array import array
+
+from atomico import EnteroAtomico, ContadorFragmentado, bloquear_varios
+from lock_lectores_escritor import LockLectoresEscritor
+from ejecucion_paralela import ejecutar_en_paralelo
 
 class Producto:
+    __slots__ = ('id', 'stock')  # Inventarios de hasta 10^6 productos
+    
     def __init__(self, id, stock_inicial=100):
         self.id = id
         self.stock = stock_inicial
@@ -11,118 +23,543 @@ class Producto:
     def __str__(self):
         return f"Producto[{self.id}] = {self.stock} unidades"
 
+class ProductoVersionado(Producto):
+    """
+    Producto con contador de versión al estilo seqlock (como CuentaVersionada)
+    
+    - Toda escritura del stock pasa por el setter: versión impar durante la escritura
+    - Una escritura de varios productos (escritura_conjunta) deja impares todas sus
+      versiones desde antes de la primera escritura hasta después de la última
+    - leer() no toma el mutex del producto: reintenta si la versión es impar o cambió
+    """
+    __slots__ = ('version', '_stock')
+    
+    def __init__(self, id, stock_inicial=100):
+        self.version = 0
+        super().__init__(id, stock_inicial)
+    
+    @property
+    def stock(self):
+        return self._stock
+    
+    @stock.setter
+    def stock(self, valor):
+        # Requiere el mutex del producto
+        if self.version & 1:
+            # Dentro de una escritura_conjunta: la versión ya es impar
+            self._stock = valor
+            return
+        self.version += 1
+        self._stock = valor
+        self.version += 1
+    
+    def leer(self):
+        """Lectura sin lock: retorna (stock, version) de una instantánea consistente"""
+        while True:
+            version = self.version
+            if not version & 1:
+                stock = self._stock
+                if self.version == version:
+                    return stock, version
+            # Escritura en curso: ceder el GIL para que el escritor termine
+            time.sleep(0)
+
+@contextlib.contextmanager
+def escritura_conjunta(productos):
+    """
+    Escritura de varios ProductoVersionado como una sola (requiere los mutex de todos):
+    snapshot_inventario() ve todas las versiones impares o ya cambiadas y reintenta, así
+    nunca combina productos ya escritos con otros todavía sin escribir. Con productos
+    sin versión no hace nada.
+    """
+    versionados = [producto for producto in productos if isinstance(producto, ProductoVersionado)]
+    for producto in versionados:
+        producto.version += 1
+    try:
+        yield
+    finally:
+        for producto in versionados:
+            producto.version += 1
+
+MODOS_LECTURA = ('mutex', 'lectores_escritor', 'snapshot')
+
+class LockMedido:
+    """
+    Mutex de un producto que acumula cuánto se esperó para adquirirlo
+    
+    Si el lock está libre se adquiere sin medir nada; si no, se mide la espera y se
+    suma en espera[indice] y contenciones[indice]. La suma se hace con el lock ya
+    tomado, así que dos threads nunca actualizan a la vez la posición del mismo producto.
+    """
+    __slots__ = ('lock', 'indice', 'espera', 'contenciones', 'reloj')
+    
+    def __init__(self, indice, espera, contenciones, lock=None, reloj=time.perf_counter):
+        self.lock = lock if lock is not None else threading.Lock()
+        self.indice = indice
+        self.espera = espera
+        self.contenciones = contenciones
+        self.reloj = reloj
+    
+    def acquire(self):
+        if not self.lock.acquire(blocking=False):
+            inicio = self.reloj()
+            self.lock.acquire()
+            self.espera[self.indice] += self.reloj() - inicio
+            self.contenciones[self.indice] += 1
+        return True
+    
+    def release(self):
+        self.lock.release()
+    
+    def __enter__(self):
+        return self.acquire()
+    
+    def __exit__(self, *exc):
+        self.release()
+
 class GestorInventarioSeguro:
-    def __init__(self, num_productos=10):
+    """
+    modo_lectura define cómo leen obtener_stock() y snapshot_inventario():
+    - 'mutex': toman el mismo mutex exclusivo que las ventas (versión original)
+    - 'lectores_escritor': cada producto usa un LockLectoresEscritor; las escrituras lo
+      toman en exclusiva (igual que el mutex) y las lecturas en modo compartido
+    - 'snapshot': productos versionados (seqlock); las lecturas no toman ningún lock
+    
+    Con medir_espera_locks=True cada mutex de producto es un LockMedido y
+    espera_locks[i] / contenciones_locks[i] acumulan la espera por producto.
+    
+    Con registro (un RegistroEventos) los mensajes de cada operación se guardan en
+    buffers por thread en lugar de imprimirse dentro de la sección crítica.
+    
+    dormir, reloj, crear_lock y crear_condicion reemplazan a time.sleep, time.perf_counter,
+    threading.Lock y la Condition de LockLectoresEscritor (simulacion_virtual.py pasa los
+    de un BucleVirtual para ejecutar este mismo gestor con reloj virtual).
+    """
+    def __init__(self, num_productos=10, contadores_fragmentados=False, tiempo_procesamiento=0.001, verbose=True,
+                 modo_lectura='mutex', medir_espera_locks=False, registro=None,
+                 dormir=time.sleep, reloj=time.perf_counter, crear_lock=threading.Lock, crear_condicion=None):
+        if modo_lectura not in MODOS_LECTURA:
+            raise ValueError(f"modo_lectura debe ser uno de {MODOS_LECTURA}")
+        if medir_espera_locks and modo_lectura == 'lectores_escritor':
+            raise ValueError("medir_espera_locks requiere modo_lectura 'mutex' o 'snapshot'")
+        self.modo_lectura = modo_lectura
+        
         # Crear 10 productos con stock inicial de 100 unidades cada uno
-        self.productos = [Producto(i, 100) for i in range(num_productos)]
+        clase_producto = ProductoVersionado if modo_lectura == 'snapshot' else Producto
+        self.productos = [clase_producto(i, 100) for i in range(num_productos)]
         
         # MECANISMO DE SINCRONIZACIÓN: Mutex para cada producto
-        self.mutex_productos = [threading.Lock() for _ in range(num_productos)]
+        if medir_espera_locks:
+            self.espera_locks = array('d', bytes(8 * num_productos))
+            self.contenciones_locks = array('q', bytes(8 * num_productos))
+            self.mutex_productos = [LockMedido(i, self.espera_locks, self.contenciones_locks, crear_lock(), reloj)
+                                    for i in range(num_productos)]
+        elif modo_lectura == 'lectores_escritor':
+            self.mutex_productos = [LockLectoresEscritor(crear_condicion() if crear_condicion else None)
+                                    for _ in range(num_productos)]
+        else:
+            self.mutex_productos = [crear_lock() for _ in range(num_productos)]
         
         # Mutex global para estadísticas
         self.mutex_stats = threading.Lock()
+        self._iniciar_contadores(contadores_fragmentados)
+        
+        self.tiempo_procesamiento = tiempo_procesamiento  # Cada una de las dos pausas dentro de la sección crítica
+        self.dormir = dormir
+        self.verbose = verbose
+        self.registro = registro
+    
+    def _iniciar_contadores(self, contadores_fragmentados):
+        """Contadores de operaciones completadas y fallidas (ver _registrar_operacion)"""
         self.operaciones_completadas = 0
         self.operaciones_fallidas = 0
+        # Alternativa sin mutex global: contadores por thread sumados al leer
+        self.contadores = (ContadorFragmentado(), ContadorFragmentado()) if contadores_fragmentados else None
+    
+    def _log(self, thread_name, formato, *args):
+        """
+        Evento de la operación: con registro se guarda sin formatear en su buffer por
+        thread (ver registro_eventos.py); si no, con verbose se imprime como siempre
+        """
+        if self.registro is not None:
+            self.registro.registrar(formato, *args)
+        elif self.verbose:
+            print(f"[{thread_name}] [{timestamp()}] {formato.format(*args)}")
+    
+    def _procesar(self):
+        """Simula tiempo de procesamiento"""
+        if self.tiempo_procesamiento:
+            self.dormir(self.tiempo_procesamiento)
+    
+    def _registrar_operacion(self, exito):
+        """Cuenta una operación completada o fallida"""
+        if self.contadores is not None:
+            self.contadores[0 if exito else 1].incrementar()
+            return
+        # Actualizar estadísticas de forma segura
+        with self.mutex_stats:
+            if exito:
+                self.operaciones_completadas += 1
+            else:
+                self.operaciones_fallidas += 1
+    
+    def obtener_estadisticas(self):
+        """(operaciones completadas, operaciones fallidas)"""
+        if self.contadores is not None:
+            return self.contadores[0].valor(), self.contadores[1].valor()
+        with self.mutex_stats:
+            return self.operaciones_completadas, self.operaciones_fallidas
         
     def vender(self, producto_id, cantidad, thread_name):
         """VERSIÓN SIN RACE CONDITION: Con mutex de sincronización"""
         producto = self.productos[producto_id]
         
-        print(f"[{thread_name}] [{timestamp()}] Iniciando VENTA: Producto {producto_id}, cantidad {cantidad}")
+        self._log(thread_name, "Iniciando VENTA: Producto {}, cantidad {}", producto_id, cantidad)
         
         # ADQUIRIR MUTEX DEL PRODUCTO ANTES DE LA SECCIÓN CRÍTICA
         with self.mutex_productos[producto_id]:
-            print(f"[{thread_name}] [{timestamp()}] MUTEX ADQUIRIDO para Producto {producto_id}")
+            self._log(thread_name, "MUTEX ADQUIRIDO para Producto {}", producto_id)
             
             # SECCIÓN CRÍTICA PROTEGIDA - NO HAY RACE CONDITION
             stock_actual = producto.stock  # Lectura protegida
-            time.sleep(0.001)  # Simula tiempo de procesamiento (sin race condition)
+            self._procesar()  # Simula tiempo de procesamiento (sin race condition)
             
             if stock_actual >= cantidad:
                 nuevo_stock = stock_actual - cantidad  # Cálculo con dato válido
-                time.sleep(0.001)  # Sin race condition gracias al mutex
+                self._procesar()  # Sin race condition gracias al mutex
                 producto.stock = nuevo_stock  # Escritura protegida
                 
-                print(f"[{thread_name}] [{timestamp()}] VENTA EXITOSA: Producto {producto_id}, vendido {cantidad}, stock restante: {producto.stock}")
+                self._log(thread_name, "VENTA EXITOSA: Producto {}, vendido {}, stock restante: {}", producto_id, cantidad, producto.stock)
                 
-                # Actualizar estadísticas de forma segura
-                with self.mutex_stats:
-                    self.operaciones_completadas += 1
+                self._registrar_operacion(True)
+                exito = True
             else:
-                print(f"[{thread_name}] [{timestamp()}] VENTA FALLIDA: Producto {producto_id}, stock insuficiente ({stock_actual} < {cantidad})")
+                self._log(thread_name, "VENTA FALLIDA: Producto {}, stock insuficiente ({} < {})", producto_id, stock_actual, cantidad)
                 
-                # Actualizar estadísticas de forma segura
-                with self.mutex_stats:
-                    self.operaciones_fallidas += 1
+                self._registrar_operacion(False)
+                exito = False
             
-            print(f"[{thread_name}] [{timestamp()}] MUTEX LIBERADO para Producto {producto_id}")
+            self._log(thread_name, "MUTEX LIBERADO para Producto {}", producto_id)
         # MUTEX AUTOMÁTICAMENTE LIBERADO AL SALIR DEL BLOQUE WITH
+        return exito
     
     def reabastecer(self, producto_id, cantidad, thread_name):
         """VERSIÓN SIN RACE CONDITION: Con mutex de sincronización"""
         producto = self.productos[producto_id]
         
-        print(f"[{thread_name}] [{timestamp()}] Iniciando REABASTECIMIENTO: Producto {producto_id}, cantidad {cantidad}")
+        self._log(thread_name, "Iniciando REABASTECIMIENTO: Producto {}, cantidad {}", producto_id, cantidad)
         
         # ADQUIRIR MUTEX DEL PRODUCTO ANTES DE LA SECCIÓN CRÍTICA
         with self.mutex_productos[producto_id]:
-            print(f"[{thread_name}] [{timestamp()}] MUTEX ADQUIRIDO para Producto {producto_id}")
+            self._log(thread_name, "MUTEX ADQUIRIDO para Producto {}", producto_id)
             
             # SECCIÓN CRÍTICA PROTEGIDA - NO HAY RACE CONDITION
             stock_actual = producto.stock  # Lectura protegida
-            time.sleep(0.001)  # Simula tiempo de procesamiento (sin race condition)
+            self._procesar()  # Simula tiempo de procesamiento (sin race condition)
             
             nuevo_stock = stock_actual + cantidad  # Cálculo con dato válido
-            time.sleep(0.001)  # Sin race condition gracias al mutex
+            self._procesar()  # Sin race condition gracias al mutex
             producto.stock = nuevo_stock  # Escritura protegida
             
-            print(f"[{thread_name}] [{timestamp()}] REABASTECIMIENTO EXITOSO: Producto {producto_id}, agregado {cantidad}, stock actual: {producto.stock}")
+            self._log(thread_name, "REABASTECIMIENTO EXITOSO: Producto {}, agregado {}, stock actual: {}", producto_id, cantidad, producto.stock)
             
-            # Actualizar estadísticas de forma segura
-            with self.mutex_stats:
-                self.operaciones_completadas += 1
+            self._registrar_operacion(True)
             
-            print(f"[{thread_name}] [{timestamp()}] MUTEX LIBERADO para Producto {producto_id}")
+            self._log(thread_name, "MUTEX LIBERADO para Producto {}", producto_id)
         # MUTEX AUTOMÁTICAMENTE LIBERADO AL SALIR DEL BLOQUE WITH
-    
+
+    @contextlib.contextmanager
+    def _bloquear_productos(self, producto_ids):
+        """Adquiere los mutex de varios productos en orden ascendente de ID (sin espera circular)"""
+        adquiridos = []
+        try:
+            for producto_id in producto_ids:
+                self.mutex_productos[producto_id].acquire()
+                adquiridos.append(self.mutex_productos[producto_id])
+            yield
+        finally:
+            for mutex in reversed(adquiridos):
+                mutex.release()
+
+    def procesar_pedido(self, lineas, thread_name=None):
+        """
+        VENTA DE VARIOS PRODUCTOS: todas las líneas o ninguna
+
+        lineas es una lista de (producto_id, cantidad); las líneas repetidas de un mismo
+        producto se suman. Se adquieren los mutex de los productos del pedido una sola
+        vez, en orden ascendente de ID, se valida el stock de cada producto y solo si
+        todos alcanzan se descuentan todas las cantidades. El procesamiento simulado se
+        paga una vez por pedido y el pedido cuenta como una operación.
+
+        Retorna True si el pedido se confirmó y False si se rechazó completo.
+        """
+        thread_name = thread_name or threading.current_thread().name
+        if len(lineas) == 1:
+            # Una sola línea ya es atómica con vender()
+            return self.vender(*lineas[0], thread_name)
+        cantidades = {}
+        for producto_id, cantidad in lineas:
+            cantidades[producto_id] = cantidades.get(producto_id, 0) + cantidad
+        ids_ordenados = sorted(cantidades)
+
+        self._log(thread_name, "Iniciando PEDIDO: {} líneas, productos {}", len(lineas), ids_ordenados)
+
+        with self._bloquear_productos(ids_ordenados):
+            self._procesar()
+            faltantes = [producto_id for producto_id in ids_ordenados
+                         if self.productos[producto_id].stock < cantidades[producto_id]]
+            if faltantes:
+                self._log(thread_name, "PEDIDO RECHAZADO: stock insuficiente en productos {}", faltantes)
+                self._registrar_operacion(False)
+                return False
+
+            self._procesar()
+            with escritura_conjunta([self.productos[producto_id] for producto_id in ids_ordenados]):
+                for producto_id in ids_ordenados:
+                    self.productos[producto_id].stock -= cantidades[producto_id]
+            self._log(thread_name, "PEDIDO CONFIRMADO: {} productos actualizados", len(ids_ordenados))
+            self._registrar_operacion(True)
+            return True
+
+    def reabastecer_lote(self, lineas, thread_name=None):
+        """REABASTECIMIENTO DE VARIOS PRODUCTOS bajo los mutex de todos ellos, en orden de ID"""
+        thread_name = thread_name or threading.current_thread().name
+        cantidades = {}
+        for producto_id, cantidad in lineas:
+            cantidades[producto_id] = cantidades.get(producto_id, 0) + cantidad
+        ids_ordenados = sorted(cantidades)
+
+        self._log(thread_name, "Iniciando REABASTECIMIENTO POR LOTE: {} líneas, productos {}", len(lineas), ids_ordenados)
+
+        with self._bloquear_productos(ids_ordenados):
+            self._procesar()
+            self._procesar()
+            with escritura_conjunta([self.productos[producto_id] for producto_id in ids_ordenados]):
+                for producto_id in ids_ordenados:
+                    self.productos[producto_id].stock += cantidades[producto_id]
+            self._log(thread_name, "REABASTECIMIENTO POR LOTE EXITOSO: {} productos actualizados", len(ids_ordenados))
+            self._registrar_operacion(True)
+
     def obtener_stock(self, producto_id):
         """Obtiene el stock actual de un producto de forma segura"""
+        if self.modo_lectura == 'snapshot':
+            return self.productos[producto_id].leer()[0]
+        if self.modo_lectura == 'lectores_escritor':
+            with self.mutex_productos[producto_id].lectura():
+                return self.productos[producto_id].stock
         with self.mutex_productos[producto_id]:
             return self.productos[producto_id].stock
     
+    def snapshot_inventario(self, intentos=100):
+        """
+        Stock de todos los productos en un mismo instante (ninguna venta o pedido a medias)
+        
+        - 'snapshot': doble lectura de versiones sin locks; si alguna versión cambió
+          entre ambas lecturas se reintenta, y tras `intentos` fallidos se toman los locks
+        - 'mutex' / 'lectores_escritor': locks de todos los productos en orden ascendente
+          (en modo compartido con 'lectores_escritor', así los lectores no se bloquean entre sí)
+        """
+        productos = self.productos
+        if self.modo_lectura == 'snapshot':
+            for _ in range(intentos):
+                versiones = [producto.version for producto in productos]
+                if any(version & 1 for version in versiones):
+                    time.sleep(0)
+                    continue
+                stocks = [producto._stock for producto in productos]
+                if all(producto.version == version for producto, version in zip(productos, versiones)):
+                    return stocks
+        
+        if self.modo_lectura == 'lectores_escritor':
+            with contextlib.ExitStack() as pila:
+                for lock in self.mutex_productos:
+                    pila.enter_context(lock.lectura())
+                return [producto.stock for producto in productos]
+        with self._bloquear_productos(range(len(productos))):
+            return [producto.stock for producto in productos]
+    
     def mostrar_inventario(self):
         """Muestra el estado completo del inventario de forma segura"""
         print("\n=== ESTADO DEL INVENTARIO ===")
-        for i, producto in enumerate(self.productos):
-            # Lectura segura del stock
-            stock_seguro = self.obtener_stock(i)
+        # Lectura segura y consistente de todos los stocks
+        for i, stock_seguro in enumerate(self.snapshot_inventario()):
             print(f"  Producto[{i}] = {stock_seguro} unidades")
         
-        with self.mutex_stats:
-            print(f"Operaciones completadas: {self.operaciones_completadas}")
-            print(f"Operaciones fallidas: {self.operaciones_fallidas}")
+        # Los contadores se suman recién al leerlos
+        completadas, fallidas = self.obtener_estadisticas()
+        print(f"Operaciones completadas: {completadas}")
+        print(f"Operaciones fallidas: {fallidas}")
+
+class GestorInventarioAtomico(GestorInventarioSeguro):
+    """
+    VERSIÓN SIN RACE CONDITION - Enteros atómicos en lugar de mutex por producto
+    
+    - El stock de cada producto y los contadores de operaciones son EnteroAtomico
+    - vender(): lectura sin lock, procesamiento y confirmación con compare_and_swap;
+      si otro thread cambió el stock en el medio, se vuelve a leer y validar (CAS loop)
+    - reabastecer(): fetch_add, no depende del valor leído
+    - Ningún lock se mantiene durante el procesamiento simulado, y los contadores
+      dejan de pasar por el mutex_stats global
+    """
+    def __init__(self, num_productos=10, tiempo_procesamiento=0.001, verbose=True, registro=None, dormir=time.sleep):
+        super().__init__(num_productos, tiempo_procesamiento=tiempo_procesamiento, verbose=verbose,
+                         registro=registro, dormir=dormir)
+        # Producto conserva el stock inicial; el stock vigente está en self.stocks
+        self.stocks = [EnteroAtomico(producto.stock) for producto in self.productos]
+        self.reintentos = EnteroAtomico(0)
+    
+    def _iniciar_contadores(self, contadores_fragmentados):
+        # Enteros atómicos en lugar del mutex_stats global
+        self.contadores = None
+        self.operaciones_completadas_atomico = EnteroAtomico(0)
+        self.operaciones_fallidas_atomico = EnteroAtomico(0)
+    
+    def _registrar_operacion(self, exito):
+        (self.operaciones_completadas_atomico if exito else self.operaciones_fallidas_atomico).fetch_add(1)
+    
+    @property
+    def operaciones_completadas(self):
+        return self.operaciones_completadas_atomico.get()
+    
+    @property
+    def operaciones_fallidas(self):
+        return self.operaciones_fallidas_atomico.get()
+    
+    def obtener_estadisticas(self):
+        return self.operaciones_completadas, self.operaciones_fallidas
+    
+    def vender(self, producto_id, cantidad, thread_name):
+        """VERSIÓN SIN RACE CONDITION: CAS loop que valida stock >= cantidad"""
+        stock = self.stocks[producto_id]
+        self._log(thread_name, "Iniciando VENTA: Producto {}, cantidad {}", producto_id, cantidad)
+        
+        while True:
+            stock_actual = stock.get()  # Lectura sin lock
+            self._procesar()  # Simula tiempo de procesamiento (sin lock tomado)
+            
+            if stock_actual < cantidad:
+                self._log(thread_name, "VENTA FALLIDA: Producto {}, stock insuficiente ({} < {})", producto_id, stock_actual, cantidad)
+                self._registrar_operacion(False)
+                return False
+            
+            nuevo_stock = stock_actual - cantidad
+            self._procesar()
+            # Solo escribe si nadie modificó el stock desde la lectura
+            if stock.compare_and_swap(stock_actual, nuevo_stock):
+                self._log(thread_name, "VENTA EXITOSA: Producto {}, vendido {}, stock restante: {}", producto_id, cantidad, nuevo_stock)
+                self._registrar_operacion(True)
+                return True
+            
+            self.reintentos.fetch_add(1)
+            self._log(thread_name, "CAS FALLIDO: Producto {} modificado por otro thread, reintentando", producto_id)
+    
+    def reabastecer(self, producto_id, cantidad, thread_name):
+        """VERSIÓN SIN RACE CONDITION: fetch_add atómico"""
+        self._log(thread_name, "Iniciando REABASTECIMIENTO: Producto {}, cantidad {}", producto_id, cantidad)
+        # Mismo procesamiento simulado que la versión con mutex
+        self._procesar()
+        self._procesar()
+        nuevo_stock = self.stocks[producto_id].fetch_add(cantidad) + cantidad
+        self._log(thread_name, "REABASTECIMIENTO EXITOSO: Producto {}, agregado {}, stock actual: {}", producto_id, cantidad, nuevo_stock)
+        self._registrar_operacion(True)
+        return True
+
+    def procesar_pedido(self, lineas, thread_name=None):
+        """
+        VENTA DE VARIOS PRODUCTOS: todas las líneas o ninguna
+
+        Un CAS por producto no alcanza (otro thread podría vender entre dos CAS), así
+        que el pedido toma juntos los locks de franja de sus enteros (bloquear_varios)
+        y valida y descuenta todas las líneas sin que se intercale ningún CAS ni fetch_add.
+        """
+        thread_name = thread_name or threading.current_thread().name
+        if len(lineas) == 1:
+            # Una sola línea ya es atómica con vender()
+            return self.vender(*lineas[0], thread_name)
+        cantidades = {}
+        for producto_id, cantidad in lineas:
+            cantidades[producto_id] = cantidades.get(producto_id, 0) + cantidad
+        stocks = [(self.stocks[producto_id], cantidad) for producto_id, cantidad in sorted(cantidades.items())]
+
+        self._log(thread_name, "Iniciando PEDIDO: {} líneas, productos {}", len(lineas), sorted(cantidades))
+        # Procesamiento simulado fuera de los locks, como en vender()
+        self._procesar()
+        self._procesar()
+
+        with bloquear_varios(stock for stock, _ in stocks):
+            if any(stock.valor < cantidad for stock, cantidad in stocks):
+                exito = False
+            else:
+                for stock, cantidad in stocks:
+                    stock.valor -= cantidad
+                exito = True
+
+        if exito:
+            self._log(thread_name, "PEDIDO CONFIRMADO: {} productos actualizados", len(stocks))
+            self._registrar_operacion(True)
+        else:
+            self._log(thread_name, "PEDIDO RECHAZADO: stock insuficiente")
+            self._registrar_operacion(False)
+        return exito
+
+    def reabastecer_lote(self, lineas, thread_name=None):
+        """
+        REABASTECIMIENTO DE VARIOS PRODUCTOS: todas las sumas bajo los locks de franja
+        de sus enteros (bloquear_varios), así snapshot_inventario() y procesar_pedido()
+        nunca ven un lote aplicado a medias
+        """
+        thread_name = thread_name or threading.current_thread().name
+        cantidades = {}
+        for producto_id, cantidad in lineas:
+            cantidades[producto_id] = cantidades.get(producto_id, 0) + cantidad
+        stocks = [(self.stocks[producto_id], cantidad) for producto_id, cantidad in sorted(cantidades.items())]
+
+        self._log(thread_name, "Iniciando REABASTECIMIENTO POR LOTE: {} líneas, productos {}", len(lineas), sorted(cantidades))
+        # Procesamiento simulado fuera de los locks, como en reabastecer()
+        self._procesar()
+        self._procesar()
+        with bloquear_varios(stock for stock, _ in stocks):
+            for stock, cantidad in stocks:
+                stock.valor += cantidad
+        self._log(thread_name, "REABASTECIMIENTO POR LOTE EXITOSO: {} productos actualizados", len(stocks))
+        self._registrar_operacion(True)
+
+    def obtener_stock(self, producto_id):
+        """Lectura atómica del stock, sin lock"""
+        return self.stocks[producto_id].get()
+    
+    def snapshot_inventario(self, intentos=100):
+        """Todos los stocks bajo los locks de franja (a lo sumo NUM_FRANJAS locks)"""
+        with bloquear_varios(self.stocks):
+            return [stock.valor for stock in self.stocks]
+    
 
 def timestamp():
     """Genera timestamp formateado"""
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
 
-def mostrar_estado_screenshot(titulo, inventario, ejecucion_num, tiempo_overhead=None):
-    """Muestra información formateada para captura de screenshots"""
+def mostrar_estado_screenshot(titulo, inventario, ejecucion_num, tiempo_overhead=None, max_productos=10):
+    """Muestra información formateada para captura de screenshots (hasta max_productos líneas de stock)"""
     print("\n" + "="*80)
     print(f"MOMENTO PARA SCREENSHOT: {titulo}")
     print(f"TIMESTAMP: {timestamp()}")
     print(f"EJECUCIÓN: #{ejecucion_num}")
     print("="*80)
     
+    # Una sola lectura consistente de todo el inventario en lugar de un obtener_stock() por línea
+    stocks = inventario.snapshot_inventario()
     print("STOCK FINAL DE PRODUCTOS:")
-    for i in range(10):
-        stock = inventario.obtener_stock(i)
+    for i, stock in enumerate(stocks[:max_productos]):
         print(f"    Producto {i}: {stock} unidades")
+    if len(stocks) > max_productos:
+        print(f"    ... {len(stocks) - max_productos} productos más ({sum(stocks)} unidades en total)")
     
-    # Mostrar productos específicos requeridos para la tabla
-    print(f"\nPRODUCTOS CLAVE PARA TABLA:")
-    print(f"    Producto 0: {inventario.obtener_stock(0)} unidades (Esperado: 120)")
-    print(f"    Producto 5: {inventario.obtener_stock(5)} unidades (Esperado: 110)")
+    # Mostrar productos específicos requeridos para la tabla (solo con el inventario de
+    # 10 productos del documento: con otros inventarios los valores esperados no aplican)
+    if len(stocks) == 10:
+        print(f"\nPRODUCTOS CLAVE PARA TABLA:")
+        print(f"    Producto 0: {stocks[0]} unidades (Esperado: 120)")
+        print(f"    Producto 5: {stocks[5]} unidades (Esperado: 110)")
     
     print(f"\nSINCRONIZACIÓN:")
     print(f"    Mecanismo: Mutex individual por producto")
@@ -137,69 +574,123 @@ def mostrar_estado_screenshot(titulo, inventario, ejecucion_num, tiempo_overhead
     print("="*80)
 
 class WorkerThreadSeguro(threading.Thread):
-    def __init__(self, thread_id, inventario, operaciones):
+    def __init__(self, thread_id, inventario, operaciones, verbose=True):
         super().__init__(name=f"Thread-{thread_id}")
         self.thread_id = thread_id
         self.inventario = inventario
         self.operaciones = operaciones
+        self.verbose = verbose
         
     def run(self):
-        print(f"[{self.name}] [{timestamp()}] Iniciado")
-        
-        # Cada thread ejecuta UNA sola operación
-        operacion, producto_id, cantidad = self.operaciones[0]
-        print(f"\n[{self.name}] [{timestamp()}] Operación: {operacion}({producto_id}, {cantidad})")
+        if self.verbose:
+            print(f"[{self.name}] [{timestamp()}] Iniciado")
         
-        if operacion == "vender":
-            self.inventario.vender(producto_id, cantidad, self.name)
-        elif operacion == "reabastecer":
-            self.inventario.reabastecer(producto_id, cantidad, self.name)
+        # Cada thread ejecuta su flujo completo de operaciones (una en la tabla del documento)
+        inventario = self.inventario
+        for operacion, producto_id, cantidad in self.operaciones:
+            if self.verbose:
+                print(f"\n[{self.name}] [{timestamp()}] Operación: {operacion}({producto_id}, {cantidad})")
+            
+            if operacion == "vender":
+                inventario.vender(producto_id, cantidad, self.name)
+            elif operacion == "reabastecer":
+                inventario.reabastecer(producto_id, cantidad, self.name)
+            elif operacion == "obtener_stock":
+                inventario.obtener_stock(producto_id)
         
-        print(f"[{self.name}] [{timestamp()}] Finalizado - 1 operación completada")
+        if self.verbose:
+            total = len(self.operaciones)
+            resumen = "1 operación completada" if total == 1 else f"{total} operaciones completadas"
+            print(f"[{self.name}] [{timestamp()}] Finalizado - {resumen}")
+
+MEZCLA_POR_DEFECTO = {'vender': 0.45, 'reabastecer': 0.45, 'obtener_stock': 0.10}
 
-def ejecutar_simulacion_segura(ejecucion_num):
+def generar_carga(num_productos, num_threads, operaciones_por_thread, mezcla=None, zipf_s=0.0,
+                  cantidad_maxima=5, semilla=None):
+    """
+    Genera un flujo de operaciones (operacion, producto_id, cantidad) por thread
+    
+    - mezcla: proporción de cada operación ('vender', 'reabastecer', 'obtener_stock')
+    - zipf_s: sesgo de Zipf sobre los productos; el producto de rango k (producto k)
+      se elige con peso 1/(k+1)^zipf_s. Con 0 la elección es uniforme; con 1 o más unos
+      pocos productos calientes concentran la mayoría de las operaciones
+    
+    Retorna una lista de num_threads listas, lista para WorkerThreadSeguro.
+    """
+    rng = random.Random(semilla)
+    mezcla = mezcla or MEZCLA_POR_DEFECTO
+    operaciones = list(mezcla)
+    pesos_operacion = list(itertools.accumulate(mezcla[op] for op in operaciones))
+    
+    if zipf_s:
+        pesos_producto = list(itertools.accumulate(1.0 / (k + 1) ** zipf_s for k in range(num_productos)))
+        total = pesos_producto[-1]
+        elegir_producto = lambda: min(bisect.bisect(pesos_producto, rng.random() * total), num_productos - 1)
+    else:
+        elegir_producto = lambda: rng.randrange(num_productos)
+    
+    carga = []
+    for _ in range(num_threads):
+        tipos = rng.choices(operaciones, cum_weights=pesos_operacion, k=operaciones_por_thread)
+        carga.append([(tipo, elegir_producto(), rng.randint(1, cantidad_maxima)) for tipo in tipos])
+    return carga
+
+def ejecutar_carga(inventario, carga):
+    """Ejecuta un WorkerThreadSeguro silencioso por flujo de la carga; retorna el tiempo total"""
+    threads = [WorkerThreadSeguro(i+1, inventario, operaciones, verbose=False) for i, operaciones in enumerate(carga)]
+    tiempo_inicio = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - tiempo_inicio
+
+# Secuencia de operaciones según documento - CADA THREAD EJECUTA UNA OPERACIÓN ÚNICA
+OPERACIONES_DOCUMENTO = [
+    # Threads 1-5: Operaciones de VENTA (cada thread vende de UN producto diferente)
+    [("vender", 0, 10)],      # Thread 1: Solo vende Producto 0
+    [("vender", 1, 15)],      # Thread 2: Solo vende Producto 1
+    [("vender", 2, 20)],      # Thread 3: Solo vende Producto 2
+    [("vender", 3, 5)],       # Thread 4: Solo vende Producto 3
+    [("vender", 4, 25)],      # Thread 5: Solo vende Producto 4
+    
+    # Threads 6-10: Operaciones de REABASTECIMIENTO (cada thread reabastece UN producto diferente)
+    [("reabastecer", 0, 30)],  # Thread 6: Solo reabastece Producto 0
+    [("reabastecer", 1, 20)],  # Thread 7: Solo reabastece Producto 1
+    [("reabastecer", 2, 40)],  # Thread 8: Solo reabastece Producto 2
+    [("reabastecer", 3, 10)],  # Thread 9: Solo reabastece Producto 3
+    [("reabastecer", 4, 35)],  # Thread 10: Solo reabastece Producto 4
+    
+    # Threads 11-15: Operaciones de VENTA (productos 5-9, cada thread vende de UN producto)
+    [("vender", 5, 15)],      # Thread 11: Solo vende Producto 5
+    [("vender", 6, 20)],      # Thread 12: Solo vende Producto 6
+    [("vender", 7, 10)],      # Thread 13: Solo vende Producto 7
+    [("vender", 8, 25)],      # Thread 14: Solo vende Producto 8
+    [("vender", 9, 15)],      # Thread 15: Solo vende Producto 9
+    
+    # Threads 16-20: Operaciones de REABASTECIMIENTO (productos 5-9, cada thread reabastece UN producto)
+    [("reabastecer", 5, 25)],  # Thread 16: Solo reabastece Producto 5
+    [("reabastecer", 6, 30)],  # Thread 17: Solo reabastece Producto 6
+    [("reabastecer", 7, 15)],  # Thread 18: Solo reabastece Producto 7
+    [("reabastecer", 8, 40)],  # Thread 19: Solo reabastece Producto 8
+    [("reabastecer", 9, 20)]   # Thread 20: Solo reabastece Producto 9
+]
+
+def ejecutar_simulacion_segura(ejecucion_num, clase_gestor=GestorInventarioSeguro):
     """Ejecuta una simulación completa del sistema de inventario SIN race conditions"""
     print(f"\n{'='*60}")
     print(f"EJECUCIÓN #{ejecucion_num} - VERSIÓN SIN RACE CONDITION")
     print(f"{'='*60}")
     
     # Crear inventario con sincronización
-    inventario = GestorInventarioSeguro()
+    inventario = clase_gestor()
     
     # Mostrar estado inicial
     print(f"\n=== ESTADO INICIAL ===")
     inventario.mostrar_inventario()
     
     # Secuencia de operaciones según documento - CADA THREAD EJECUTA UNA OPERACIÓN ÚNICA
-    operaciones_threads = [
-        # Threads 1-5: Operaciones de VENTA (cada thread vende de UN producto diferente)
-        [("vender", 0, 10)],      # Thread 1: Solo vende Producto 0
-        [("vender", 1, 15)],      # Thread 2: Solo vende Producto 1
-        [("vender", 2, 20)],      # Thread 3: Solo vende Producto 2
-        [("vender", 3, 5)],       # Thread 4: Solo vende Producto 3
-        [("vender", 4, 25)],      # Thread 5: Solo vende Producto 4
-        
-        # Threads 6-10: Operaciones de REABASTECIMIENTO (cada thread reabastece UN producto diferente)
-        [("reabastecer", 0, 30)],  # Thread 6: Solo reabastece Producto 0
-        [("reabastecer", 1, 20)],  # Thread 7: Solo reabastece Producto 1
-        [("reabastecer", 2, 40)],  # Thread 8: Solo reabastece Producto 2
-        [("reabastecer", 3, 10)],  # Thread 9: Solo reabastece Producto 3
-        [("reabastecer", 4, 35)],  # Thread 10: Solo reabastece Producto 4
-        
-        # Threads 11-15: Operaciones de VENTA (productos 5-9, cada thread vende de UN producto)
-        [("vender", 5, 15)],      # Thread 11: Solo vende Producto 5
-        [("vender", 6, 20)],      # Thread 12: Solo vende Producto 6
-        [("vender", 7, 10)],      # Thread 13: Solo vende Producto 7
-        [("vender", 8, 25)],      # Thread 14: Solo vende Producto 8
-        [("vender", 9, 15)],      # Thread 15: Solo vende Producto 9
-        
-        # Threads 16-20: Operaciones de REABASTECIMIENTO (productos 5-9, cada thread reabastece UN producto)
-        [("reabastecer", 5, 25)],  # Thread 16: Solo reabastece Producto 5
-        [("reabastecer", 6, 30)],  # Thread 17: Solo reabastece Producto 6
-        [("reabastecer", 7, 15)],  # Thread 18: Solo reabastece Producto 7
-        [("reabastecer", 8, 40)],  # Thread 19: Solo reabastece Producto 8
-        [("reabastecer", 9, 20)]   # Thread 20: Solo reabastece Producto 9
-    ]
+    operaciones_threads = OPERACIONES_DOCUMENTO
     
     print(f"\n=== MECANISMO DE SINCRONIZACIÓN ===")
     print("TÉCNICA UTILIZADA: Mutex individual por producto")
@@ -213,7 +704,7 @@ def ejecutar_simulacion_segura(ejecucion_num):
     
     # Crear y iniciar threads
     threads = []
-    for i in range(20):
+    for i in range(len(operaciones_threads)):
         thread = WorkerThreadSeguro(i+1, inventario, operaciones_threads[i])
         threads.append(thread)
         thread.start()
@@ -257,7 +748,7 @@ def ejecutar_simulacion_segura(ejecucion_num):
         'tiempo': tiempo_total
     }
 
-def main():
+def main(procesos=None):
     print("=== SIMULACIÓN SIN RACE CONDITIONS - GESTOR DE INVENTARIO CONCURRENTE ===")
     print("VERSIÓN SIN RACE CONDITION: Con mutex de sincronización")
     print("Especificaciones:")
@@ -269,20 +760,24 @@ def main():
     print(f"\n=== EJECUCIÓN DE 10 PRUEBAS PARA VERIFICAR CONSISTENCIA ===")
     
     resultados = []
-    tiempos = []
     
-    # Ejecutar 10 veces para verificar consistencia
-    for i in range(1, 11):
-        resultado = ejecutar_simulacion_segura(i)
-        resultados.append(resultado)
-        tiempos.append(resultado['tiempo'])
-        
-        # Pausa entre ejecuciones
-        if i < 10:
-            print(f"\n{'*'*60}")
-            print(f"Preparando ejecución #{i+1}...")
-            print(f"{'*'*60}")
-            time.sleep(1)
+    if procesos:
+        # Ejecuciones independientes repartidas en procesos (salida de cada una descartada)
+        print(f"Modo paralelo: {procesos} procesos, un proceso nuevo por ejecución")
+        resultados = ejecutar_en_paralelo(ejecutar_simulacion_segura, 10, procesos)
+    else:
+        # Ejecutar 10 veces para verificar consistencia
+        for i in range(1, 11):
+            resultado = ejecutar_simulacion_segura(i)
+            resultados.append(resultado)
+            
+            # Pausa entre ejecuciones
+            if i < 10:
+                print(f"\n{'*'*60}")
+                print(f"Preparando ejecución #{i+1}...")
+                print(f"{'*'*60}")
+                time.sleep(1)
+    tiempos = [resultado['tiempo'] for resultado in resultados]
     
     # Resumen final de todas las ejecuciones
     print(f"\n{'='*80}")
@@ -333,10 +828,21 @@ def main():
     print("   - Desventajas: Más complejo, overhead similar a mutex")
     print("   - Overhead estimado: Similar al mutex (~{:.3f}s)".format(tiempo_promedio * 1.1))
     
-    print("\n3. VARIABLES ATÓMICAS (ALTERNATIVA):")
-    print("   - Ventajas: Menor overhead, operaciones lock-free")
-    print("   - Desventajas: Limitado a operaciones simples")
-    print("   - Overhead estimado: Menor (~{:.3f}s)".format(tiempo_promedio * 0.7))
+    # Medición real con GestorInventarioAtomico (misma simulación, salida descartada)
+    tiempos_atomico = []
+    correctos_atomico = 0
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for i in range(1, 11):
+            resultado = ejecutar_simulacion_segura(i, GestorInventarioAtomico)
+            tiempos_atomico.append(resultado['tiempo'])
+            correctos_atomico += resultado['todos_correctos']
+    tiempo_promedio_atomico = sum(tiempos_atomico) / len(tiempos_atomico)
+    
+    print("\n3. VARIABLES ATÓMICAS (GestorInventarioAtomico):")
+    print("   - Ventajas: Ningún lock durante el procesamiento, contadores sin mutex global")
+    print("   - Desventajas: Reintentos (CAS loop) cuando hay escrituras concurrentes al mismo producto")
+    print(f"   - Overhead medido: {tiempo_promedio_atomico:.3f}s promedio en 10 ejecuciones "
+          f"({tiempo_promedio_atomico / tiempo_promedio:.2f}x el mutex), {correctos_atomico}/10 correctas")
     
     print(f"\n=== LÍNEAS DE CÓDIGO DONDE ESTÁ LA SECCIÓN CRÍTICA PROTEGIDA ===")
     print("FUNCIÓN vender() - VERSIÓN SEGURA:")
@@ -354,4 +860,6 @@ def main():
     print(f"\nTIMESTAMP FIN: {timestamp()}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--procesos', type=int, help="repartir las 10 ejecuciones en N procesos (sin pausas entre ejecuciones)")
+    main(parser.parse_args().procesos)
\ No newline at end of file
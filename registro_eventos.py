@@ -0,0 +1,128 @@
+import threading
+import time
+from array import array
+from datetime import datetime
+
+class BufferEventos:
+    """
+    Buffer circular preasignado de un solo thread: marcas de tiempo y códigos de evento
+    en arrays de enteros, argumentos en una lista de tamaño fijo. Al llenarse se
+    sobrescriben los eventos más antiguos.
+    """
+    __slots__ = ('thread_id', 'thread_name', 'tiempos', 'codigos', 'argumentos', 'capacidad', 'escritos', 'leidos')
+
+    def __init__(self, capacidad):
+        thread = threading.current_thread()
+        self.thread_id = thread.ident
+        self.thread_name = thread.name
+        self.tiempos = array('q', bytes(8 * capacidad))
+        self.codigos = array('l', bytes(array('l').itemsize * capacidad))
+        self.argumentos = [None] * capacidad
+        self.capacidad = capacidad
+        self.escritos = 0  # Solo lo modifica el thread dueño
+        self.leidos = 0    # Solo lo modifica quien vuelca (escritor o volcar())
+
+class RegistroEventos:
+    """
+    Registro de eventos de bajo costo para reemplazar print() dentro de secciones críticas
+
+    - registrar(formato, *args) guarda (monotonic_ns, código del formato, args) en el
+      buffer circular del thread actual: sin locks compartidos, sin timestamp() y sin
+      formatear texto
+    - El texto se arma recién en volcar() (o en el escritor en segundo plano), con el
+      mismo formato de línea que los prints: [thread] [timestamp] mensaje
+    - Cada formato distinto recibe un código entero la primera vez que se usa
+    - Si un buffer se llena antes de volcarse, los eventos más antiguos se pierden y se
+      cuentan en `perdidos`
+    """
+    def __init__(self, capacidad_por_thread=4096):
+        self.capacidad_por_thread = capacidad_por_thread
+        self.buffers = []
+        self.formatos = []
+        self.codigo_formato = {}
+        self.perdidos = 0
+        self.lock = threading.Lock()
+        self.lock_volcado = threading.Lock()  # Un solo volcado a la vez (escritor o volcar())
+        self.local = threading.local()
+        # Para convertir monotonic_ns en hora de pared al volcar
+        self.origen_ns = time.time_ns() - time.monotonic_ns()
+        self.detener_evento = threading.Event()
+        self.escritor = None
+
+    def _buffer_nuevo(self):
+        buffer = self.local.buffer = BufferEventos(self.capacidad_por_thread)
+        with self.lock:
+            self.buffers.append(buffer)
+        return buffer
+
+    def _codigo(self, formato):
+        codigo = self.codigo_formato.get(formato)
+        if codigo is None:
+            with self.lock:
+                codigo = self.codigo_formato.get(formato)
+                if codigo is None:
+                    codigo = self.codigo_formato[formato] = len(self.formatos)
+                    self.formatos.append(formato)
+        return codigo
+
+    def registrar(self, formato, *args):
+        """Guarda el evento; formato es un str.format() que se aplica a args al volcar"""
+        buffer = getattr(self.local, 'buffer', None) or self._buffer_nuevo()
+        posicion = buffer.escritos % buffer.capacidad
+        buffer.tiempos[posicion] = time.monotonic_ns()
+        buffer.codigos[posicion] = self._codigo(formato)
+        buffer.argumentos[posicion] = args
+        buffer.escritos += 1
+
+    def _drenar(self):
+        """Eventos pendientes de todos los buffers como tuplas (ns, thread_name, código, args), en orden de tiempo"""
+        eventos = []
+        with self.lock:
+            buffers = list(self.buffers)
+        with self.lock_volcado:
+            for buffer in buffers:
+                escritos = buffer.escritos
+                desde = max(buffer.leidos, escritos - buffer.capacidad)
+                self.perdidos += desde - buffer.leidos
+                pendientes = []
+                for i in range(desde, escritos):
+                    posicion = i % buffer.capacidad
+                    pendientes.append((buffer.tiempos[posicion], buffer.thread_name,
+                                       buffer.codigos[posicion], buffer.argumentos[posicion]))
+                # El dueño siguió escribiendo mientras se leía: descartar las posiciones que
+                # pudo pisar (incluida la que está escribiendo ahora)
+                pisados = min(buffer.escritos + 1 - buffer.capacidad, escritos) - desde
+                if pisados > 0:
+                    pendientes = pendientes[pisados:]
+                    self.perdidos += pisados
+                eventos.extend(pendientes)
+                buffer.leidos = escritos
+        eventos.sort(key=lambda evento: evento[0])
+        return eventos
+
+    def formatear(self, evento):
+        ns, thread_name, codigo, args = evento
+        instante = datetime.fromtimestamp((self.origen_ns + ns) / 1e9).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+        return f"[{thread_name}] [{instante}] {self.formatos[codigo].format(*args)}"
+
+    def volcar(self, archivo):
+        """Formatea y escribe en archivo todos los eventos pendientes; retorna cuántos escribió"""
+        eventos = self._drenar()
+        archivo.writelines(self.formatear(evento) + "\n" for evento in eventos)
+        return len(eventos)
+
+    def iniciar_escritor(self, archivo, intervalo=0.05):
+        """Thread en segundo plano que vuelca los eventos pendientes cada `intervalo` segundos"""
+        def escribir():
+            while not self.detener_evento.wait(intervalo):
+                self.volcar(archivo)
+            self.volcar(archivo)
+
+        self.escritor = threading.Thread(target=escribir, name="Escritor-Eventos", daemon=True)
+        self.escritor.start()
+
+    def detener_escritor(self):
+        """Detiene el escritor tras un último volcado"""
+        self.detener_evento.set()
+        if self.escritor is not None:
+            self.escritor.join()
@@ -0,0 +1,497 @@
+import asyncio
+import selectors
+import threading
+import functools
+import random
+import time
+from collections import Counter, deque
+
+import deadlock_con_problema
+import deadlock_solucion
+from deadlock_solucion import OPERACIONES
+from starvation_solucion import generar_secuencias
+from starvation_asyncio import simular as simular_prioridades
+from race_condition_con_problema import GestorInventario
+from race_condition_solucion import (GestorInventarioSeguro, GestorInventarioAtomico, WorkerThreadSeguro,
+                                     OPERACIONES_DOCUMENTO, MODOS_LECTURA)
+
+class DeadlockVirtual(RuntimeError):
+    """Nada puede avanzar: no hay eventos listos ni temporizadores pendientes"""
+    def __init__(self, tiempo, bloqueadas):
+        super().__init__(f"Deadlock en t={tiempo:.3f}s (virtual): {len(bloqueadas)} threads esperando para siempre")
+        self.tiempo = tiempo
+        self.bloqueadas = bloqueadas
+
+class HiloCancelado(BaseException):
+    """Se lanza en los hilos simulados que siguen esperando cuando termina ejecutar_virtual()"""
+
+class _SelectorVirtual(selectors.DefaultSelector):
+    """
+    Selector del BucleVirtual: en lugar de bloquear hasta el próximo temporizador
+    (asyncio.sleep o dormir()), adelanta el reloj virtual hasta él y retorna de inmediato
+    """
+    def __init__(self, bucle):
+        super().__init__()
+        self.bucle = bucle
+
+    def select(self, timeout=None):
+        eventos = super().select(0)
+        if eventos or timeout == 0:
+            return eventos
+        if timeout is None:
+            # Sin temporizadores ni eventos: todos esperan un lock, una Condition o una cola
+            bucle = self.bucle
+            bloqueadas = sorted([hilo.nombre for hilo in bucle.hilos if not hilo.terminado.done()] +
+                                [tarea.get_name() for tarea in asyncio.all_tasks(bucle)
+                                 if not tarea.done() and tarea is not bucle.principal])
+            raise DeadlockVirtual(bucle.reloj, bloqueadas)
+        self.bucle.reloj += timeout
+        return eventos
+
+def _senal():
+    """
+    Lock ya tomado usado como señal entre dos threads: release() avisa y acquire() espera
+    (más barato que un Semaphore; cada aviso se consume antes de que llegue el siguiente)
+    """
+    senal = threading.Lock()
+    senal.acquire()
+    return senal
+
+class _Trabajador(threading.Thread):
+    """Thread real reutilizable: ejecuta hilos simulados, uno tras otro (crear threads es lo más caro)"""
+    libres = []
+    lock_libres = threading.Lock()
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.trabajo = _senal()
+        self.hilo = None
+
+    @classmethod
+    def asignar(cls, hilo):
+        with cls.lock_libres:
+            trabajador = cls.libres.pop() if cls.libres else None
+        if trabajador is None:
+            trabajador = cls()
+            trabajador.start()
+        trabajador.name = hilo.nombre
+        trabajador.hilo = hilo
+        trabajador.trabajo.release()
+        return trabajador
+
+    def run(self):
+        while True:
+            self.trabajo.acquire()
+            hilo = self.hilo
+            try:
+                hilo.ejecutar()
+            finally:
+                self.hilo = None
+                with self.lock_libres:
+                    self.libres.append(self)
+                hilo.bucle._devuelto.release()
+
+class _HiloVirtual:
+    """Hilo simulado: corre en un thread real solo cuando el BucleVirtual le cede el turno"""
+    def __init__(self, bucle, funcion, args, nombre):
+        self.bucle = bucle
+        self.funcion = funcion
+        self.args = args
+        self.nombre = nombre
+        self.turno = _senal()
+        self.terminado = bucle.create_future()
+        self.entregado = False  # Lo usan LockVirtual y CondicionVirtual al reanudarlo
+        self.thread = _Trabajador.asignar(self)
+
+    def ejecutar(self):
+        self.turno.acquire()
+        try:
+            if self.bucle.cancelando:
+                raise HiloCancelado()
+            resultado = self.funcion(*self.args)
+        except HiloCancelado:
+            self.terminado.cancel()
+        except Exception as e:
+            self.terminado.set_exception(e)
+        else:
+            self.terminado.set_result(resultado)
+
+class BucleVirtual(asyncio.SelectorEventLoop):
+    """
+    Event loop de asyncio con reloj virtual para simulación de eventos discretos
+
+    - time() retorna el reloj virtual (empieza en 0)
+    - asyncio.sleep(t) no bloquea: cuando no queda nada listo para ejecutar, el
+      reloj salta al próximo temporizador, así que 10 s simulados cuestan lo que
+      cuesta ejecutar las corrutinas
+    - Código con threads sin modificar: iniciar_hilo() lo ejecuta en un thread real que
+      solo corre cuando el bucle le cede el turno (uno a la vez, hasta que vuelve a
+      esperar). dormir(), crear_lock() y crear_condicion() reemplazan a time.sleep,
+      threading.Lock y threading.Condition: en lugar de bloquear el thread, agendan su
+      continuación en el bucle, así que los hilos avanzan con el mismo reloj virtual
+    - Un solo hilo o corrutina corre a la vez y en el orden FIFO de asyncio: con la misma
+      semilla el resultado es siempre el mismo
+    - Si nada puede avanzar ni hay temporizadores, lanza DeadlockVirtual
+    """
+    def __init__(self):
+        self.reloj = 0.0
+        self.principal = None  # Tarea de ejecutar_virtual(), no cuenta como bloqueada
+        self.hilos = []
+        self.hilo_actual = None
+        self.cancelando = False
+        self._devuelto = _senal()  # El hilo en curso volvió a esperar o terminó
+        super().__init__(_SelectorVirtual(self))
+
+    def time(self):
+        return self.reloj
+
+    def iniciar_hilo(self, funcion, *args, nombre=None):
+        """Ejecuta funcion(*args) en un hilo simulado; retorna un Future con su resultado"""
+        hilo = _HiloVirtual(self, funcion, args, nombre or f"Hilo-{len(self.hilos) + 1}")
+        self.hilos.append(hilo)
+        self.call_soon(self._reanudar, hilo)
+        return hilo.terminado
+
+    def dormir(self, segundos):
+        """time.sleep() de los hilos simulados: el hilo sigue cuando el reloj llegue"""
+        hilo = self._hilo_en_curso()
+        self.call_later(segundos, self._reanudar, hilo)
+        self._ceder()
+
+    def crear_lock(self):
+        return LockVirtual(self)
+
+    def crear_condicion(self, lock=None):
+        return CondicionVirtual(self, lock)
+
+    def _reanudar(self, hilo):
+        """Callback del bucle: deja correr al hilo hasta que vuelva a esperar o termine"""
+        if self.cancelando:
+            return
+        self.hilo_actual = hilo
+        hilo.turno.release()
+        self._devuelto.acquire()
+        self.hilo_actual = None
+
+    def _ceder(self):
+        """Desde el hilo en curso: devuelve el turno al bucle y espera a que lo reanuden"""
+        if self.cancelando:
+            raise HiloCancelado()
+        hilo = self.hilo_actual
+        self._devuelto.release()
+        hilo.turno.acquire()
+        if self.cancelando:
+            raise HiloCancelado()
+
+    def _hilo_en_curso(self):
+        if self.cancelando:
+            raise HiloCancelado()
+        hilo = self.hilo_actual
+        if hilo is None or hilo.thread is not threading.current_thread():
+            raise RuntimeError("Solo los hilos de iniciar_hilo() pueden esperar en un BucleVirtual")
+        return hilo
+
+    def _cancelar_hilos(self):
+        """Termina los hilos que quedaron esperando (tras un DeadlockVirtual o un error)"""
+        self.cancelando = True
+        for hilo in self.hilos:
+            if not hilo.terminado.done():
+                hilo.turno.release()
+                self._devuelto.acquire()
+
+class LockVirtual:
+    """
+    threading.Lock de los hilos de un BucleVirtual: esperarlo cede el turno al bucle en
+    lugar de bloquear el thread. release() lo entrega al primero que espera (FIFO).
+    """
+    def __init__(self, bucle):
+        self.bucle = bucle
+        self.tomado = False
+        self.esperando = deque()
+
+    def acquire(self, blocking=True, timeout=-1):
+        if not self.tomado:
+            self.tomado = True
+            return True
+        if not blocking:
+            return False
+        hilo = self.bucle._hilo_en_curso()
+        hilo.entregado = False
+        temporizador = self.bucle.call_later(timeout, self._vencer, hilo) if timeout >= 0 else None
+        self.esperando.append(hilo)
+        self.bucle._ceder()
+        if temporizador is not None:
+            temporizador.cancel()
+        return hilo.entregado
+
+    def release(self):
+        if not self.tomado:
+            raise RuntimeError("release de un LockVirtual libre")
+        if self.esperando:
+            # Pasa directamente al siguiente: el lock sigue tomado
+            siguiente = self.esperando.popleft()
+            siguiente.entregado = True
+            self.bucle.call_soon(self.bucle._reanudar, siguiente)
+        else:
+            self.tomado = False
+
+    def _vencer(self, hilo):
+        if hilo in self.esperando:
+            self.esperando.remove(hilo)
+            self.bucle._reanudar(hilo)
+
+    def locked(self):
+        return self.tomado
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, *exc):
+        self.release()
+
+class CondicionVirtual:
+    """threading.Condition sobre un LockVirtual para los hilos de un BucleVirtual"""
+    def __init__(self, bucle, lock=None):
+        self.bucle = bucle
+        self.lock = lock if lock is not None else LockVirtual(bucle)
+        self.esperando = deque()
+
+    def acquire(self, *args):
+        return self.lock.acquire(*args)
+
+    def release(self):
+        self.lock.release()
+
+    def __enter__(self):
+        return self.lock.acquire()
+
+    def __exit__(self, *exc):
+        self.lock.release()
+
+    def wait(self, timeout=None):
+        hilo = self.bucle._hilo_en_curso()
+        hilo.entregado = False
+        temporizador = self.bucle.call_later(timeout, self._vencer, hilo) if timeout is not None else None
+        self.esperando.append(hilo)
+        self.lock.release()
+        try:
+            self.bucle._ceder()
+        finally:
+            if temporizador is not None:
+                temporizador.cancel()
+        self.lock.acquire()
+        return hilo.entregado
+
+    def wait_for(self, predicado, timeout=None):
+        fin = None if timeout is None else self.bucle.time() + timeout
+        resultado = predicado()
+        while not resultado:
+            if fin is not None:
+                restante = fin - self.bucle.time()
+                if restante <= 0:
+                    break
+                self.wait(restante)
+            else:
+                self.wait()
+            resultado = predicado()
+        return resultado
+
+    def notify(self, n=1):
+        for _ in range(min(n, len(self.esperando))):
+            hilo = self.esperando.popleft()
+            hilo.entregado = True
+            self.bucle.call_soon(self.bucle._reanudar, hilo)
+
+    def notify_all(self):
+        self.notify(len(self.esperando))
+
+    def _vencer(self, hilo):
+        if hilo in self.esperando:
+            self.esperando.remove(hilo)
+            self.bucle._reanudar(hilo)
+
+def ejecutar_virtual(corrutina):
+    """Ejecuta la corrutina en un BucleVirtual nuevo; retorna (resultado, segundos virtuales)"""
+    bucle = BucleVirtual()
+    try:
+        bucle.principal = bucle.create_task(corrutina)
+        resultado = bucle.run_until_complete(bucle.principal)
+        return resultado, bucle.reloj
+    finally:
+        # Tras un DeadlockVirtual quedan hilos y corrutinas esperando: se terminan antes de cerrar
+        bucle._cancelar_hilos()
+        pendientes = asyncio.all_tasks(bucle)
+        for tarea in pendientes:
+            tarea.cancel()
+        if pendientes:
+            bucle.run_until_complete(asyncio.gather(*pendientes, return_exceptions=True))
+        bucle.close()
+
+def _bucle_virtual():
+    bucle = asyncio.get_running_loop()
+    if not isinstance(bucle, BucleVirtual):
+        raise RuntimeError("Las simulaciones se ejecutan con ejecutar_virtual()")
+    return bucle
+
+# ---------------------------------------------------------------------------
+# Punto 2.1: transferencias bancarias
+# ---------------------------------------------------------------------------
+
+async def simular_transferencias(operaciones=OPERACIONES, ordenar_locks=True, tiempo_procesamiento=0.05,
+                                 pausa=0.02, retardo_maximo=0.0, semilla=None):
+    """
+    Un hilo simulado por lista de operaciones, como main() de deadlock_solucion.py, con
+    las mismas funciones de transferencia y cuentas con locks del BucleVirtual
+
+    - ordenar_locks=True: transferir_sin_deadlock() de deadlock_solucion.py
+    - ordenar_locks=False: transferir() de deadlock_con_problema.py (con
+      tiempo_procesamiento=0.1 y pausa=0.05 como allí); si se produce el deadlock,
+      ejecutar_virtual() lanza DeadlockVirtual con el instante y los threads bloqueados
+    - retardo_maximo: cada hilo arranca tras un retardo uniforme en [0, retardo_maximo]
+      tomado de la semilla, para explorar distintos intercalados
+    Retorna saldos, conservación del total, transferencias completadas y, con
+    ordenar_locks=True, exitosas y fallidas por saldo insuficiente.
+    """
+    bucle = _bucle_virtual()
+    rng = random.Random(semilla)
+    num_cuentas = 1 + max(max(origen, destino) for lista in operaciones for origen, destino, _ in lista)
+    if ordenar_locks:
+        cuentas = [deadlock_solucion.Cuenta(i, 1000*(i+1), bucle.crear_lock()) for i in range(num_cuentas)]
+        transferir = functools.partial(deadlock_solucion.transferir_sin_deadlock, tiempo_procesamiento=tiempo_procesamiento,
+                                       verbose=False, dormir=bucle.dormir)
+        contadores = {'completadas': 0, 'exitosas': 0, 'fallidas': 0}
+    else:
+        cuentas = [deadlock_con_problema.Cuenta(i, 1000*(i+1), bucle.crear_lock()) for i in range(num_cuentas)]
+        transferir = functools.partial(deadlock_con_problema.transferir, tiempo_procesamiento=tiempo_procesamiento,
+                                       verbose=False, dormir=bucle.dormir)
+        contadores = {'completadas': 0}
+    saldo_inicial = sum(cuenta.saldo for cuenta in cuentas)
+
+    def thread(transferencias, retardo):
+        bucle.dormir(retardo)
+        for origen, destino, monto in transferencias:
+            resultado = transferir(cuentas, origen, destino, monto)
+            contadores['completadas'] += 1
+            if resultado is not None:
+                contadores['exitosas' if resultado[0] else 'fallidas'] += 1
+            bucle.dormir(pausa)
+
+    await asyncio.gather(*(bucle.iniciar_hilo(thread, lista, rng.uniform(0, retardo_maximo), nombre=f"Thread-{i+1}")
+                           for i, lista in enumerate(operaciones)))
+    saldos = [cuenta.saldo for cuenta in cuentas]
+    return {'saldos': saldos, 'conservacion': sum(saldos) == saldo_inicial, **contadores}
+
+# ---------------------------------------------------------------------------
+# Punto 2.2: prioridades de tareas (motor de starvation_asyncio.py)
+# ---------------------------------------------------------------------------
+
+async def simular_starvation(semilla=None, num_consumidores=3, duracion=10, politica=None):
+    """Ventana de `duracion` segundos de main() de starvation_solucion.py, con monitoreo cada 2 s"""
+    secuencias = generar_secuencias(random.Random(semilla))
+    return await simular_prioridades(secuencias, num_consumidores=num_consumidores, politica=politica,
+                                     duracion=duracion, tiempos_monitoreo=range(2, int(duracion) + 1, 2))
+
+# ---------------------------------------------------------------------------
+# Punto 2.3: gestor de inventario
+# ---------------------------------------------------------------------------
+
+# 'con_race_condition' es GestorInventario de race_condition_con_problema.py
+VERSIONES_INVENTARIO = ('con_race_condition', *MODOS_LECTURA, 'atomico')
+
+def crear_gestor_virtual(version, bucle, num_productos=10, tiempo_procesamiento=0.001):
+    """Gestor de inventario de la versión indicada con el reloj y los locks del bucle"""
+    if version == 'con_race_condition':
+        return GestorInventario(num_productos, tiempo_procesamiento, verbose=False, dormir=bucle.dormir)
+    if version == 'atomico':
+        return GestorInventarioAtomico(num_productos, tiempo_procesamiento, verbose=False, dormir=bucle.dormir)
+    if version in MODOS_LECTURA:
+        return GestorInventarioSeguro(num_productos, tiempo_procesamiento=tiempo_procesamiento, verbose=False,
+                                      modo_lectura=version, dormir=bucle.dormir, reloj=bucle.time,
+                                      crear_lock=bucle.crear_lock, crear_condicion=bucle.crear_condicion)
+    raise ValueError(f"version debe ser una de {VERSIONES_INVENTARIO}")
+
+async def simular_inventario(operaciones_threads=OPERACIONES_DOCUMENTO, num_productos=10, version='mutex',
+                             tiempo_procesamiento=0.001, retardo_maximo=0.002, semilla=None):
+    """
+    Los WorkerThreadSeguro de race_condition_solucion.py, cada uno en un hilo simulado,
+    sobre el gestor de la versión indicada (ver VERSIONES_INVENTARIO). Cada hilo arranca
+    tras un retardo uniforme en [0, retardo_maximo] tomado de la semilla.
+    """
+    bucle = _bucle_virtual()
+    rng = random.Random(semilla)
+    inventario = crear_gestor_virtual(version, bucle, num_productos, tiempo_procesamiento)
+
+    def thread(worker, retardo):
+        bucle.dormir(retardo)
+        worker.run()
+
+    await asyncio.gather(*(bucle.iniciar_hilo(thread, WorkerThreadSeguro(i+1, inventario, lista, verbose=False),
+                                              rng.uniform(0, retardo_maximo), nombre=f"Thread-{i+1}")
+                           for i, lista in enumerate(operaciones_threads)))
+    return {'stocks': [inventario.obtener_stock(i) for i in range(num_productos)],
+            'completadas': inventario.operaciones_completadas, 'fallidas': inventario.operaciones_fallidas}
+
+REPETICIONES_INVENTARIO = 2000  # Por versión en main()
+
+def ejecutar_inventario_repetido(repeticiones, version='mutex', semilla_base=0, **kwargs):
+    """
+    Repite la simulación del documento con semillas semilla_base..semilla_base+repeticiones-1.
+    Retorna (ejecuciones correctas (P0=120 y P5=110), Counter de (P0, P5), segundos
+    virtuales sumando todas las ejecuciones).
+    """
+    correctas = 0
+    resultados = Counter()
+    tiempo_virtual = 0.0
+    for semilla in range(semilla_base, semilla_base + repeticiones):
+        resultado, tiempo = ejecutar_virtual(simular_inventario(version=version, semilla=semilla, **kwargs))
+        clave = (resultado['stocks'][0], resultado['stocks'][5])
+        resultados[clave] += 1
+        correctas += clave == (120, 110)
+        tiempo_virtual += tiempo
+    return correctas, resultados, tiempo_virtual
+
+def main():
+    print("=== SIMULACIÓN DE EVENTOS DISCRETOS CON RELOJ VIRTUAL ===")
+    print("Las pausas (asyncio.sleep y dormir()) adelantan un reloj virtual: el código de cada módulo, sin esperar en tiempo real")
+
+    print("\n=== PUNTO 2.1: TRANSFERENCIAS BANCARIAS ===")
+    print("| Versión                        | Resultado                              | Tiempo virtual (s) | Tiempo real (ms) |")
+    print("|--------------------------------|----------------------------------------|--------------------|------------------|")
+    inicio = time.perf_counter()
+    try:
+        ejecutar_virtual(simular_transferencias(ordenar_locks=False, tiempo_procesamiento=0.1, pausa=0.05))
+        resultado, tiempo_virtual = "Sin deadlock", float('nan')
+    except DeadlockVirtual as e:
+        resultado, tiempo_virtual = f"DEADLOCK: {len(e.bloqueadas)} threads bloqueados", e.tiempo
+    real = (time.perf_counter() - inicio) * 1000
+    print(f"| {'Con deadlock (sin orden)':30} | {resultado:38} | {tiempo_virtual:18.3f} | {real:16.2f} |")
+    inicio = time.perf_counter()
+    transferencias, tiempo_virtual = ejecutar_virtual(simular_transferencias())
+    real = (time.perf_counter() - inicio) * 1000
+    resultado = (f"{transferencias['exitosas']} exitosas, conservación "
+                 f"{'✅' if transferencias['conservacion'] else '❌'}")
+    print(f"| {'Sin deadlock (orden de locks)':30} | {resultado:38} | {tiempo_virtual:18.3f} | {real:16.2f} |")
+
+    print("\n=== PUNTO 2.2: PRIORIDADES DE TAREAS (VENTANA DE 10 s, SEMILLA 1) ===")
+    inicio = time.perf_counter()
+    stats, tiempo_virtual = ejecutar_virtual(simular_starvation(semilla=1))
+    real = (time.perf_counter() - inicio) * 1000
+    print("| Tiempo (seg) | Tareas A Procesadas | Tareas M Procesadas | Tareas B Procesadas | Tareas B en Espera |")
+    print("|--------------|--------------------|--------------------|--------------------|--------------------|")
+    for punto in stats['monitoreo']:
+        procesadas = punto['procesadas']
+        print(f"| {punto['tiempo']:12.0f} | {procesadas['A']:18} | {procesadas['M']:18} | {procesadas['B']:18} | {punto['cola']['B']:18} |")
+    print(f"{tiempo_virtual:.1f} s virtuales en {real:.2f} ms reales | promociones por aging: {stats['promociones_aging']}, "
+          f"procesamientos forzados de B: {stats['procesamientos_forzados']}")
+
+    print(f"\n=== PUNTO 2.3: INVENTARIO ({REPETICIONES_INVENTARIO} EJECUCIONES POR VERSIÓN) ===")
+    print("| Versión              | Correctas (P0=120, P5=110) | Resultados distintos | Tiempo virtual (s) | Tiempo real (s) |")
+    print("|----------------------|----------------------------|----------------------|--------------------|-----------------|")
+    for version in VERSIONES_INVENTARIO:
+        inicio = time.perf_counter()
+        correctas, resultados, tiempo_virtual = ejecutar_inventario_repetido(REPETICIONES_INVENTARIO, version=version)
+        real = time.perf_counter() - inicio
+        print(f"| {version:20} | {correctas:26} | {len(resultados):20} | {tiempo_virtual:18.1f} | {real:15.2f} |")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+import asyncio
+import random
+
+from starvation_solucion import Tarea, PoliticaAging, generar_secuencias, timestamp
+
+class ColaPlanificadaAsync(asyncio.Queue):
+    """
+    Cola con aging para asyncio: esperas con await en lugar de threading.Condition
+
+    asyncio.Queue ya implementa la capacidad y la espera de productores y consumidores
+    (futuros en el event loop, sin un thread por espera); esta subclase solo reemplaza
+    el almacenamiento por una PoliticaPlanificacion (por defecto PoliticaAging, las
+    reglas de ColaConAging). Todo corre en un único thread, así que no hay locks.
+    """
+    def __init__(self, politica=None, capacidad_maxima=20):
+        self.politica = politica or PoliticaAging()
+        super().__init__(maxsize=capacidad_maxima)
+
+    def _init(self, maxsize):
+        pass
+
+    def _put(self, tarea):
+        self.politica.encolar(tarea)
+
+    def _get(self):
+        return self.politica.siguiente()
+
+    # asyncio.Queue consulta self._queue directamente en qsize() y empty()
+    def qsize(self):
+        return self.politica.size()
+
+    def empty(self):
+        return self.politica.size() == 0
+
+    def size(self):
+        return self.politica.size()
+
+    def get_estado(self):
+        """Retorna el estado actual de las colas"""
+        estado = self.politica.get_estado()
+        estado['total'] = estado['A'] + estado['M'] + estado['B']
+        return estado
+
+def crear_stats():
+    """Mismo diccionario de estadísticas que main() (sin lock: un solo thread)"""
+    return {
+        'A_procesadas': 0,
+        'M_procesadas': 0,
+        'B_procesadas': 0,
+        'tiempo_espera_B': [],
+        'promociones_aging': 0,
+        'procesamientos_forzados': 0,
+        'espera_por_clase': {'A': [], 'M': [], 'B': []}  # Por clase original (incluye B promovidas)
+    }
+
+def ahora():
+    """Reloj del event loop: monotónico con asyncio normal, virtual con simulacion_virtual.BucleVirtual"""
+    return asyncio.get_running_loop().time()
+
+async def productor(cola, producer_id, secuencia_tareas, pausa=0.05):
+    for i, prioridad in enumerate(secuencia_tareas):
+        await cola.put(Tarea(f"{producer_id}-{i+1}", prioridad, ahora()))
+        if pausa:
+            await asyncio.sleep(pausa)
+
+async def consumidor(cola, stats, escala=1.0):
+    """Procesa tareas hasta ser cancelado; escala multiplica el tiempo de procesamiento"""
+    while True:
+        tarea = await cola.get()
+        try:
+            tiempo_espera = ahora() - tarea.tiempo_creacion
+            await asyncio.sleep(tarea.tiempo_procesamiento * escala)
+            stats[f"{tarea.prioridad}_procesadas"] += 1
+            if tarea.prioridad == 'B':
+                stats['tiempo_espera_B'].append(tiempo_espera)
+            stats['espera_por_clase'][tarea.prioridad_original].append(tiempo_espera)
+        finally:
+            cola.task_done()
+
+async def monitorear(cola, stats, tiempo_inicio, tiempos):
+    """Agrega a stats['monitoreo'] el estado de la cola y las tareas procesadas en cada tiempo"""
+    for tiempo_objetivo in tiempos:
+        await asyncio.sleep(max(0.0, tiempo_inicio + tiempo_objetivo - ahora()))
+        stats['monitoreo'].append({
+            'tiempo': round(ahora() - tiempo_inicio, 3),
+            'cola': cola.get_estado(),
+            'procesadas': {clase: stats[f"{clase}_procesadas"] for clase in ('A', 'M', 'B')}
+        })
+
+async def simular(secuencias, num_consumidores=3, capacidad_maxima=20, escala=1.0, pausa_produccion=0.05, politica=None,
+                  duracion=None, tiempos_monitoreo=()):
+    """
+    Ejecuta un productor por secuencia y num_consumidores consumidores hasta procesar
+    todas las tareas o, con duracion, solo durante esa ventana de segundos (como main()
+    de starvation_solucion.py; lo que quede en la cola cuenta como en espera).
+    tiempos_monitoreo: segundos desde el inicio en los que se agrega un punto a
+    stats['monitoreo']. Retorna el diccionario de estadísticas con 'tiempo' y 'estado_final'.
+    """
+    cola = ColaPlanificadaAsync(politica, capacidad_maxima)
+    stats = crear_stats()
+    stats['monitoreo'] = []
+    tiempo_inicio = ahora()
+    if duracion is not None:
+        tiempos_monitoreo = [t for t in tiempos_monitoreo if t <= duracion]
+
+    consumidores = [asyncio.create_task(consumidor(cola, stats, escala)) for _ in range(num_consumidores)]
+    monitor = asyncio.create_task(monitorear(cola, stats, tiempo_inicio, tiempos_monitoreo))
+
+    async def producir_y_vaciar():
+        await asyncio.gather(*(productor(cola, i+1, secuencia, pausa_produccion) for i, secuencia in enumerate(secuencias)))
+        await cola.join()
+
+    try:
+        await asyncio.wait_for(producir_y_vaciar(), duracion)
+    except asyncio.TimeoutError:
+        pass
+    for tarea in consumidores:
+        tarea.cancel()
+    await asyncio.gather(*consumidores, return_exceptions=True)
+    # Con ventana fija, el último punto de monitoreo (t == duracion) ve el estado al cerrarla
+    if duracion is None:
+        monitor.cancel()
+    await asyncio.gather(monitor, return_exceptions=True)
+
+    if isinstance(cola.politica, PoliticaAging):
+        stats['promociones_aging'] = cola.politica.promociones
+        stats['procesamientos_forzados'] = cola.politica.forzados
+    stats['tiempo'] = ahora() - tiempo_inicio
+    stats['estado_final'] = cola.get_estado()
+    return stats
+
+def main():
+    print("=== SIMULACION SIN STARVATION CON ASYNCIO - SISTEMA DE PRIORIDADES DE TAREAS ===")
+    print("Productores y consumidores como corrutinas en un único event loop")
+    print(f"TIMESTAMP INICIO: {timestamp()}")
+
+    stats = asyncio.run(simular(generar_secuencias(), num_consumidores=3))
+    estado_final = stats['estado_final']
+
+    print(f"\n=== RESULTADOS FINALES ===")
+    print(f"TIMESTAMP FIN: {timestamp()}")
+    print(f"Tiempo total de ejecución: {stats['tiempo']:.2f} segundos")
+    print("| Tiempo (seg) | Tareas A Procesadas | Tareas M Procesadas | Tareas B Procesadas | Tareas B en Espera |")
+    print("|--------------|--------------------|--------------------|--------------------|--------------------|")
+    print(f"| Final        | {stats['A_procesadas']:18} | {stats['M_procesadas']:18} | {stats['B_procesadas']:18} | {estado_final['B']:18} |")
+    print(f"Promociones por aging realizadas: {stats['promociones_aging']}")
+    print(f"Procesamientos forzados de B: {stats['procesamientos_forzados']}")
+    if stats['tiempo_espera_B']:
+        print(f"Tiempo de espera máximo para tareas B: {max(stats['tiempo_espera_B']):.3f} segundos")
+
+    # Miles de consumidores simulados en el mismo proceso
+    num_consumidores = 10000
+    rng = random.Random(7)
+    secuencias = [[rng.choice('AMBBB') for _ in range(200)] for _ in range(100)]
+    stats = asyncio.run(simular(secuencias, num_consumidores=num_consumidores, capacidad_maxima=num_consumidores,
+                                escala=0.1, pausa_produccion=0))
+    total = stats['A_procesadas'] + stats['M_procesadas'] + stats['B_procesadas']
+    print(f"\n=== {num_consumidores} CONSUMIDORES CONCURRENTES ===")
+    print(f"{total} tareas procesadas en {stats['tiempo']:.2f} s ({total/stats['tiempo']:.0f} tareas/seg), "
+          f"tareas B en espera al final: {stats['estado_final']['B']}")
+
+if __name__ == "__main__":
+    main()
@@ -170,6 +170,17 @@ class Consumer(threading.Thread):
         self.running = False
         print(f"[{self.name}] [{timestamp()}] Finalizado por timeout ({self.tiempo_limite}s)")
 
+# Secuencia específica de 30 tareas según el documento
+SECUENCIAS = [
+    ['B','B','M','B','B','B','A','M','B','B'],      # Tareas 1-10
+    ['M','B','B','B','A','B','M','B','B','B'],      # Tareas 11-20  
+    ['B','B','B','M','A','B','B','M','B','B']       # Tareas 21-30
+]
+
+# Productores de main(): 3 con la secuencia del documento y 2 adicionales que generan
+# más tareas A y M para aumentar starvation de B
+SECUENCIAS_PRODUCTORES = SECUENCIAS + [['A','M','A','M','B','A','M','B']] * 2
+
 def main():
     print("=== SIMULACION DE STARVATION - SISTEMA DE PRIORIDADES DE TAREAS ===")
     print("VERSIÓN CON STARVATION: Siempre se priorizan tareas A y M")
@@ -195,13 +206,6 @@ def main():
         "Sistema iniciado - 5 productores (~46 tareas) y 2 consumidores lentos - DISEÑADO PARA STARVATION"
     )
     
-    # Secuencia específica de 30 tareas según el documento
-    secuencias = [
-        ['B','B','M','B','B','B','A','M','B','B'],      # Tareas 1-10
-        ['M','B','B','B','A','B','M','B','B','B'],      # Tareas 11-20  
-        ['B','B','B','M','A','B','B','M','B','B']       # Tareas 21-30
-    ]
-    
     print(f"\n=== PREDICCION DE STARVATION ===")
     print("ESCENARIO CONFIGURADO PARA STARVATION:")
     print("- 5 productores generando ~46 tareas (incluye A, M y B)")
@@ -215,11 +219,7 @@ def main():
     # Crear y iniciar productores - 5 productores para generar tareas rápidamente
     producers = []
     for i in range(5):  # 5 productores: 3 con secuencia específica, 2 generan más tareas B/M
-        if i < 3:
-            secuencia = secuencias[i]
-        else:
-            # Productores adicionales generan más tareas A y M para aumentar starvation de B
-            secuencia = ['A','M','A','M','B','A','M','B']  # Más A y M para causar starvation
+        secuencia = SECUENCIAS_PRODUCTORES[i]
         producer = Producer(cola, i+1, secuencia)
         producers.append(producer)
         producer.start()
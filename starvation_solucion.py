@@ -1,24 +1,40 @@
 import threading
+import argparse
 import time
 import queue
 from datetime import datetime
 from collections import deque
+import heapq
+import itertools
 import random
+import json
+
+from metricas_cola import MetricasCola
+
+class TareaRechazada(Exception):
+    """La política de admisión no acepta la tarea porque no cumpliría su deadline"""
+    def __init__(self, tarea, fin_estimado):
+        super().__init__(f"Tarea {tarea.id} rechazada: fin estimado {fin_estimado - tarea.deadline:+.3f}s respecto a su deadline")
+        self.tarea = tarea
+        self.fin_estimado = fin_estimado
 
 class Tarea:
-    def __init__(self, id, prioridad, tiempo_creacion):
+    def __init__(self, id, prioridad, tiempo_creacion, deadline=None):
         self.id = id
         self.prioridad = prioridad  # 'A' (Alta), 'M' (Media), 'B' (Baja)
+        self.prioridad_original = prioridad  # No cambia al promover por aging
         self.tiempo_creacion = tiempo_creacion
         self.tiempo_procesamiento = {'A': 0.2, 'M': 0.25, 'B': 0.3}[prioridad]  # 200ms, 250ms, 300ms - Ajustado para ver progreso
         self.edad = 0  # Para el mecanismo de aging
+        self.deadline = deadline  # Instante límite (mismo reloj que tiempo_creacion), opcional
         
     def __str__(self):
         return f"Tarea[{self.id}]-{self.prioridad}(edad:{self.edad})"
 
 class ColaConAging:
-    def __init__(self, capacidad_maxima=20):
+    def __init__(self, capacidad_maxima=20, metricas=None):
         self.capacidad_maxima = capacidad_maxima
+        self.metricas = metricas  # MetricasCola opcional (metricas_cola.py)
         self.cola_alta = deque()      # Prioridad A
         self.cola_media = deque()     # Prioridad M  
         self.cola_baja = deque()      # Prioridad B
@@ -29,22 +45,41 @@ class ColaConAging:
         # Parámetros del aging
         self.aging_threshold = 3  # Después de 3 operaciones, aumentar prioridad
         self.operaciones_counter = 0
+        self.desencoladas = 0  # Total de tareas entregadas (tasa de drenado)
         
     def put(self, tarea):
         with self.lock:
             while self.size() >= self.capacidad_maxima:
                 self.not_full.wait()
-            
-            # Agregar según prioridad
-            if tarea.prioridad == 'A':
-                self.cola_alta.append(tarea)
-            elif tarea.prioridad == 'M':
-                self.cola_media.append(tarea)
-            else:
-                self.cola_baja.append(tarea)
-            
+            self._encolar(tarea)
             self.not_empty.notify()
     
+    def put_many(self, tareas, max_por_lock=64):
+        """Encola las tareas tomando el lock una vez por grupo de hasta max_por_lock (o el espacio libre)"""
+        i = 0
+        while i < len(tareas):
+            with self.lock:
+                while self.size() >= self.capacidad_maxima:
+                    self.not_full.wait()
+                libres = min(self.capacidad_maxima - self.size(), max_por_lock)
+                lote = tareas[i:i + libres]
+                for tarea in lote:
+                    self._encolar(tarea)
+                self.not_empty.notify(len(lote))
+            i += len(lote)
+    
+    def _encolar(self, tarea):
+        """Agrega la tarea según su prioridad (requiere el lock)"""
+        if tarea.prioridad == 'A':
+            self.cola_alta.append(tarea)
+        elif tarea.prioridad == 'M':
+            self.cola_media.append(tarea)
+        else:
+            self.cola_baja.append(tarea)
+        
+        if self.metricas is not None:
+            tarea.tiempo_encolado = time.perf_counter()
+    
     def aplicar_aging(self):
         """Mecanismo de aging: Promueve tareas B antiguas a prioridad M"""
         # Buscar tareas B con edad >= aging_threshold
@@ -76,42 +111,101 @@ class ColaConAging:
         
         return len(tareas_promovidas)
     
-    def get(self):
-        """VERSIÓN SIN STARVATION: Con mecanismo de aging"""
+    def get(self, timeout=None):
+        """VERSIÓN SIN STARVATION: Con mecanismo de aging (None si vence el timeout con la cola vacía)"""
         with self.lock:
-            while self.size() == 0:
-                self.not_empty.wait()
-            
-            # Cada cierto número de operaciones, aplicar aging
-            self.operaciones_counter += 1
-            if self.operaciones_counter % 2 == 0:  # Aging cada 2 operaciones
-                promovidas = self.aplicar_aging()
-                if promovidas > 0:
-                    print(f"[AGING] [{timestamp()}] {promovidas} tareas promovidas por aging")
-            
-            # POLÍTICA ANTI-STARVATION: 
-            # 1. Prioridad normal A > M > B
-            # 2. Pero con aging, las tareas B pueden ser promovidas a M
-            # 3. Además, cada 5 operaciones, forzar procesamiento de B si existe
-            
-            forzar_b = (self.operaciones_counter % 5 == 0) and len(self.cola_baja) > 0
-            
-            if forzar_b:
-                # Forzar procesamiento de tarea B para prevenir starvation
-                tarea = self.cola_baja.popleft()
-                print(f"[ANTI-STARVATION] [{timestamp()}] Forzando procesamiento de tarea B: {tarea.id}")
-            elif self.cola_alta:
-                tarea = self.cola_alta.popleft()
-            elif self.cola_media:
-                tarea = self.cola_media.popleft()
-            elif self.cola_baja:
-                tarea = self.cola_baja.popleft()
-            else:
+            if not self.not_empty.wait_for(lambda: self.size() > 0, timeout):
                 return None
-                
+            tarea = self._siguiente()
             self.not_full.notify()
             return tarea
     
+    def get_many(self, max_tareas, timeout=None):
+        """
+        Hasta max_tareas tareas con una sola adquisición del lock (lista vacía si vence el timeout).
+        Cada tarea se elige con la misma política que get(), en el mismo orden.
+        """
+        with self.lock:
+            if not self.not_empty.wait_for(lambda: self.size() > 0, timeout):
+                return []
+            tareas = []
+            while len(tareas) < max_tareas and self.size() > 0:
+                tareas.append(self._siguiente())
+            self.not_full.notify(len(tareas))
+            return tareas
+    
+    def get_de_clases(self, clases, timeout=None):
+        """
+        Como get(), pero solo entre las tareas de las clases que retorna clases() (se evalúa con
+        el lock tomado): la misma política, incluidos aging y procesamiento forzado de B,
+        restringida a esas colas. Pensado para un único consumidor que limita sus tareas en
+        vuelo por clase; cuando cambia el resultado de clases() debe llamar a notificar().
+        None si vence el timeout.
+        """
+        with self.lock:
+            while True:
+                if not self.not_empty.wait_for(lambda: self._hay_tareas_de(clases()), timeout):
+                    return None
+                # El aging puede promover la única tarea elegible a una clase que no lo es
+                tarea = self._siguiente(clases())
+                if tarea is not None:
+                    self.not_full.notify()
+                    return tarea
+    
+    def _hay_tareas_de(self, clases):
+        return (('A' in clases and self.cola_alta) or ('M' in clases and self.cola_media)
+                or ('B' in clases and self.cola_baja))
+    
+    def notificar(self):
+        """Despierta a quien espera en get_de_clases() para que reevalúe sus clases"""
+        with self.lock:
+            self.not_empty.notify_all()
+    
+    def ajustar_capacidad(self, capacidad):
+        """Cambia el límite de la cola; si crece, despierta a los productores bloqueados"""
+        with self.lock:
+            crecio = capacidad > self.capacidad_maxima
+            self.capacidad_maxima = capacidad
+            if crecio:
+                self.not_full.notify_all()
+    
+    def _siguiente(self, clases=('A', 'M', 'B')):
+        """
+        Extrae la próxima tarea según la política anti-starvation (requiere el lock y cola no vacía),
+        considerando solo las colas de `clases`; None si ninguna de ellas tiene tareas
+        """
+        # Cada cierto número de operaciones, aplicar aging
+        self.operaciones_counter += 1
+        if self.operaciones_counter % 2 == 0:  # Aging cada 2 operaciones
+            promovidas = self.aplicar_aging()
+            if promovidas > 0:
+                print(f"[AGING] [{timestamp()}] {promovidas} tareas promovidas por aging")
+        
+        # POLÍTICA ANTI-STARVATION: 
+        # 1. Prioridad normal A > M > B
+        # 2. Pero con aging, las tareas B pueden ser promovidas a M
+        # 3. Además, cada 5 operaciones, forzar procesamiento de B si existe
+        
+        forzar_b = (self.operaciones_counter % 5 == 0) and len(self.cola_baja) > 0 and 'B' in clases
+        
+        if forzar_b:
+            # Forzar procesamiento de tarea B para prevenir starvation
+            tarea = self.cola_baja.popleft()
+            print(f"[ANTI-STARVATION] [{timestamp()}] Forzando procesamiento de tarea B: {tarea.id}")
+        elif self.cola_alta and 'A' in clases:
+            tarea = self.cola_alta.popleft()
+        elif self.cola_media and 'M' in clases:
+            tarea = self.cola_media.popleft()
+        elif self.cola_baja and 'B' in clases:
+            tarea = self.cola_baja.popleft()
+        else:
+            return None
+        
+        self.desencoladas += 1
+        if self.metricas is not None:
+            self.metricas.registrar_espera(tarea.prioridad_original, time.perf_counter() - tarea.tiempo_encolado)
+        return tarea
+    
     def size(self):
         return len(self.cola_alta) + len(self.cola_media) + len(self.cola_baja)
     
@@ -124,6 +218,563 @@ class ColaConAging:
             'total': self.size()
         }
 
+class ControladorCapacidad(threading.Thread):
+    """
+    Backpressure adaptativo para ColaConAging (ley de Little: tareas en cola = tasa x espera)
+    
+    Cada `intervalo` segundos mide la tasa de drenado de los consumidores (tareas
+    desencoladas por segundo, suavizada con una media exponencial) y fija la capacidad
+    de la cola en tasa * latencia_objetivo, acotada a [capacidad_minima, capacidad_tope].
+    Una tarea que entra con la cola llena espera entonces cerca de latencia_objetivo:
+    si los consumidores se frenan la cola se achica y los productores se bloquean antes;
+    si aceleran, la cola crece y los productores dejan de bloquearse sin necesidad.
+    """
+    def __init__(self, cola, latencia_objetivo=0.5, capacidad_minima=4, capacidad_tope=1024,
+                 intervalo=0.05, suavizado=0.3):
+        super().__init__(name="Controlador-Capacidad", daemon=True)
+        self.cola = cola
+        self.latencia_objetivo = latencia_objetivo
+        self.capacidad_minima = capacidad_minima
+        self.capacidad_tope = capacidad_tope
+        self.intervalo = intervalo
+        self.suavizado = suavizado
+        self.tasa_drenado = None
+        self.ajustes = 0
+        self.detener_evento = threading.Event()
+    
+    def run(self):
+        ultimo_total = self.cola.desencoladas
+        ultimo_tiempo = time.perf_counter()
+        while not self.detener_evento.wait(self.intervalo):
+            total, ahora = self.cola.desencoladas, time.perf_counter()
+            tasa = (total - ultimo_total) / (ahora - ultimo_tiempo)
+            ultimo_total, ultimo_tiempo = total, ahora
+            if self.tasa_drenado is None:
+                self.tasa_drenado = tasa
+            else:
+                self.tasa_drenado += self.suavizado * (tasa - self.tasa_drenado)
+            
+            capacidad = int(self.tasa_drenado * self.latencia_objetivo)
+            capacidad = max(self.capacidad_minima, min(self.capacidad_tope, capacidad))
+            if capacidad != self.cola.capacidad_maxima:
+                self.cola.ajustar_capacidad(capacidad)
+                self.ajustes += 1
+    
+    def detener(self):
+        self.detener_evento.set()
+        self.join()
+
+class ColaAgingHeap:
+    """
+    Cola con aging implícito sobre un heap - put() y get() en O(log n)
+    
+    Prioridad efectiva de una tarea en el instante t:
+        base[prioridad] - tasa_aging * (t - t_encolado)
+    Como tasa_aging * t es igual para todas las tareas en un mismo instante, el orden
+    entre tareas solo depende de la clave fija base + tasa_aging * t_encolado. Esa clave
+    se calcula una vez al encolar, así que envejecer no requiere recorrer ni modificar
+    tareas (no hay aplicar_aging) y la prioridad original de la tarea no se sobrescribe.
+    
+    GARANTÍA ANTI-STARVATION: una tarea B solo puede ser adelantada por tareas A
+    encoladas menos de (base['B'] - base['A']) / tasa_aging segundos después de ella.
+    """
+    BASE = {'A': 0.0, 'M': 1.0, 'B': 2.0}
+    
+    def __init__(self, capacidad_maxima=20, tasa_aging=1.0, reloj=time.monotonic):
+        self.capacidad_maxima = capacidad_maxima
+        self.tasa_aging = tasa_aging  # Unidades de prioridad ganadas por segundo de espera
+        self.reloj = reloj
+        self.heap = []
+        self.secuencia = itertools.count()  # Desempate FIFO entre claves iguales
+        self.por_prioridad = {'A': 0, 'M': 0, 'B': 0}
+        self.lock = threading.Lock()
+        self.not_full = threading.Condition(self.lock)
+        self.not_empty = threading.Condition(self.lock)
+    
+    def espera_maxima_b(self):
+        """Máximo tiempo durante el cual tareas A más nuevas pueden adelantar a una B"""
+        return (self.BASE['B'] - self.BASE['A']) / self.tasa_aging
+    
+    def put(self, tarea):
+        with self.lock:
+            while len(self.heap) >= self.capacidad_maxima:
+                self.not_full.wait()
+            
+            clave = self.BASE[tarea.prioridad] + self.tasa_aging * self.reloj()
+            heapq.heappush(self.heap, (clave, next(self.secuencia), tarea))
+            self.por_prioridad[tarea.prioridad] += 1
+            
+            self.not_empty.notify()
+    
+    def get(self):
+        """VERSIÓN SIN STARVATION: menor prioridad efectiva primero (aging implícito)"""
+        with self.lock:
+            while not self.heap:
+                self.not_empty.wait()
+            
+            _, _, tarea = heapq.heappop(self.heap)
+            self.por_prioridad[tarea.prioridad] -= 1
+            
+            self.not_full.notify()
+            return tarea
+    
+    def size(self):
+        return len(self.heap)
+    
+    def get_estado(self):
+        """Retorna el estado actual de la cola (tareas por prioridad original)"""
+        return {
+            'A': self.por_prioridad['A'],
+            'M': self.por_prioridad['M'],
+            'B': self.por_prioridad['B'],
+            'total': self.size()
+        }
+
+class FragmentoCola:
+    """Fragmento de ColaFragmentada: colas A/M/B propias con su propio lock"""
+    def __init__(self, capacidad):
+        self.capacidad = capacidad
+        self.colas = {'A': deque(), 'M': deque(), 'B': deque()}
+        self.total = 0
+        self.lock = threading.Lock()
+        self.not_full = threading.Condition(self.lock)
+        self.not_empty = threading.Condition(self.lock)
+
+class ColaFragmentada:
+    """
+    Cola multi-consumidor fragmentada con robo de trabajo (work stealing)
+    
+    - Un fragmento por consumidor, cada uno con sus colas A/M/B y su propio lock,
+      en lugar de un único lock + dos Condition compartidos por todos
+    - put() reparte las tareas entre fragmentos por turno (round robin)
+    - get() atiende primero el fragmento propio y, si está vacío, roba de los demás
+    - Política anti-starvation global: antes de mirar el fragmento propio, get() compara
+      las cabezas de B (y luego de M) de todos los fragmentos y, si alguna lleva más de
+      espera_maxima[clase] segundos en cola, atiende la más antigua, esté en el fragmento
+      que esté; si no, prioridad normal A > M > B empezando por el fragmento propio. Como
+      las colas son FIFO, basta mirar la cabeza de cada una (sin recorrer ni modificar
+      tareas). La revisión cuesta O(fragmentos), así que se hace a lo sumo una vez cada
+      intervalo_revision segundos (por defecto un décimo de la menor espera_maxima),
+      salvo mientras siga encontrando tareas vencidas: una B o M de otro fragmento espera
+      como mucho espera_maxima + intervalo_revision.
+    """
+    def __init__(self, num_fragmentos=3, capacidad_maxima=20, espera_maxima=None, espera_robo=0.001,
+                 intervalo_revision=None):
+        self.num_fragmentos = num_fragmentos
+        capacidad = max(1, -(-capacidad_maxima // num_fragmentos))
+        self.fragmentos = [FragmentoCola(capacidad) for _ in range(num_fragmentos)]
+        self.espera_maxima = espera_maxima or {'B': 1.0, 'M': 2.0}
+        self.espera_robo = espera_robo  # Pausa máxima antes de volver a buscar tareas para robar
+        self.intervalo_revision = (intervalo_revision if intervalo_revision is not None
+                                   else min(self.espera_maxima.values()) / 10)
+        self._proxima_revision = 0.0
+        self._turno = itertools.count()
+        self._consumidor = threading.local()
+        self._ids_consumidor = itertools.count()
+        # Contadores informativos (sin lock, aproximados)
+        self.robos = 0
+        self.atenciones_por_antiguedad = 0
+    
+    def put(self, tarea):
+        fragmento = self.fragmentos[next(self._turno) % self.num_fragmentos]
+        with fragmento.lock:
+            while fragmento.total >= fragmento.capacidad:
+                fragmento.not_full.wait()
+            fragmento.colas[tarea.prioridad].append((time.monotonic(), tarea))
+            fragmento.total += 1
+            fragmento.not_empty.notify()
+    
+    def get(self, consumidor_id=None):
+        """VERSIÓN SIN STARVATION: fragmento propio, luego robo; aging por antigüedad de la cabeza"""
+        if consumidor_id is None:
+            consumidor_id = self._id_consumidor_actual()
+        propio = consumidor_id % self.num_fragmentos
+        fragmentos = self.fragmentos
+        
+        while True:
+            # Una B o M vencida en cualquier fragmento va antes que las A del fragmento propio
+            vencido = self._fragmento_vencido() if time.monotonic() >= self._proxima_revision else None
+            if vencido is not None:
+                with vencido.lock:
+                    tarea = self._tomar(vencido, solo_vencidas=True)
+                if tarea is not None:
+                    if vencido is not fragmentos[propio]:
+                        self.robos += 1
+                    return tarea
+            
+            for desplazamiento in range(self.num_fragmentos):
+                fragmento = fragmentos[(propio + desplazamiento) % self.num_fragmentos]
+                if not fragmento.total:  # Lectura sin lock para saltar fragmentos vacíos
+                    continue
+                with fragmento.lock:
+                    tarea = self._tomar(fragmento)
+                if tarea is not None:
+                    if desplazamiento:
+                        self.robos += 1
+                    return tarea
+            
+            # Nada que atender ni robar: esperar en el fragmento propio un intervalo corto
+            fragmento = fragmentos[propio]
+            with fragmento.lock:
+                if not fragmento.total:
+                    fragmento.not_empty.wait(self.espera_robo)
+    
+    def _fragmento_vencido(self):
+        """
+        Fragmento con la cabeza de B más antigua entre las que superan espera_maxima (o, si
+        ninguna B venció, la de M), o None. Lee sin locks: solo elige dónde buscar, y
+        _tomar() vuelve a comprobar la antigüedad con el lock del fragmento. Si no hay
+        ninguna vencida, pospone la próxima revisión intervalo_revision segundos.
+        """
+        ahora = time.monotonic()
+        for clase in ('B', 'M'):
+            elegido, mas_antigua = None, ahora - self.espera_maxima[clase]
+            for fragmento in self.fragmentos:
+                try:
+                    encolada = fragmento.colas[clase][0][0]
+                except IndexError:  # Vacía, o vaciada por otro consumidor
+                    continue
+                if encolada <= mas_antigua:
+                    elegido, mas_antigua = fragmento, encolada
+            if elegido is not None:
+                return elegido
+        self._proxima_revision = ahora + self.intervalo_revision
+        return None
+    
+    def _tomar(self, fragmento, solo_vencidas=False):
+        """
+        Extrae la siguiente tarea del fragmento según la política global (requiere su lock);
+        con solo_vencidas, únicamente una B o M que superó espera_maxima (o None)
+        """
+        if not fragmento.total:
+            return None
+        colas = fragmento.colas
+        ahora = time.monotonic()
+        
+        cola = None
+        for clase in ('B', 'M'):
+            if colas[clase] and ahora - colas[clase][0][0] >= self.espera_maxima[clase]:
+                cola = colas[clase]
+                self.atenciones_por_antiguedad += 1
+                break
+        if cola is None:
+            if solo_vencidas:
+                return None
+            cola = colas['A'] or colas['M'] or colas['B']
+        
+        _, tarea = cola.popleft()
+        fragmento.total -= 1
+        fragmento.not_full.notify()
+        return tarea
+    
+    def _id_consumidor_actual(self):
+        """Asigna un id estable a cada thread que llama a get() sin indicar consumidor"""
+        consumidor_id = getattr(self._consumidor, 'id', None)
+        if consumidor_id is None:
+            consumidor_id = self._consumidor.id = next(self._ids_consumidor)
+        return consumidor_id
+    
+    def size(self):
+        return sum(f.total for f in self.fragmentos)
+    
+    def get_estado(self):
+        """Retorna el estado actual de las colas (suma de todos los fragmentos)"""
+        estado = {'A': 0, 'M': 0, 'B': 0}
+        for fragmento in self.fragmentos:
+            with fragmento.lock:
+                for clase in estado:
+                    estado[clase] += len(fragmento.colas[clase])
+        estado['total'] = estado['A'] + estado['M'] + estado['B']
+        return estado
+
+class PoliticaPlanificacion:
+    """
+    Interfaz de las políticas de ColaPlanificada: deciden el orden de atención.
+    La cola se encarga del lock, la capacidad y las esperas; la política solo
+    guarda las tareas y elige la siguiente (siempre se llama con el lock tomado).
+    """
+    def encolar(self, tarea):
+        raise NotImplementedError
+    
+    def siguiente(self):
+        """Extrae la próxima tarea a atender (la cola garantiza que hay al menos una)"""
+        raise NotImplementedError
+    
+    def size(self):
+        raise NotImplementedError
+    
+    def get_estado(self):
+        raise NotImplementedError
+
+class PoliticaPrioridadEstricta(PoliticaPlanificacion):
+    """A > M > B sin ningún mecanismo anti-starvation (la política de starvation_con_problema.py)"""
+    def __init__(self):
+        self.colas = {'A': deque(), 'M': deque(), 'B': deque()}
+    
+    def encolar(self, tarea):
+        self.colas[tarea.prioridad].append(tarea)
+    
+    def siguiente(self):
+        return (self.colas['A'] or self.colas['M'] or self.colas['B']).popleft()
+    
+    def size(self):
+        return len(self.colas['A']) + len(self.colas['M']) + len(self.colas['B'])
+    
+    def get_estado(self):
+        return {clase: len(cola) for clase, cola in self.colas.items()}
+
+class PoliticaAging(PoliticaPlanificacion):
+    """
+    Las reglas de ColaConAging como política intercambiable:
+    aging cada 2 get() (B con edad >= 3 pasa a M), B forzada cada 5 get(), si no A > M > B.
+    Cuenta promociones y procesamientos forzados; verbose imprime los mismos mensajes.
+    """
+    def __init__(self, aging_threshold=3, verbose=False):
+        self.colas = {'A': deque(), 'M': deque(), 'B': deque()}
+        self.aging_threshold = aging_threshold
+        self.verbose = verbose
+        self.operaciones_counter = 0
+        self.promociones = 0
+        self.forzados = 0
+    
+    def encolar(self, tarea):
+        self.colas[tarea.prioridad].append(tarea)
+    
+    def aplicar_aging(self):
+        """Promueve a M las tareas B con edad >= aging_threshold y envejece las demás"""
+        cola_media = self.colas['M']
+        nuevas_tareas_b = deque()
+        promovidas = 0
+        for tarea in self.colas['B']:
+            if tarea.edad >= self.aging_threshold:
+                tarea.prioridad = 'M'  # Promoción temporal
+                cola_media.append(tarea)
+                promovidas += 1
+                if self.verbose:
+                    print(f"[AGING] [{timestamp()}] Promovida {tarea.id} de B a M por aging")
+            else:
+                tarea.edad += 1
+                nuevas_tareas_b.append(tarea)
+        self.colas['B'] = nuevas_tareas_b
+        for tarea in cola_media:
+            if tarea.prioridad == 'M':
+                tarea.edad += 0.5
+        self.promociones += promovidas
+        return promovidas
+    
+    def siguiente(self):
+        self.operaciones_counter += 1
+        if self.operaciones_counter % 2 == 0:
+            self.aplicar_aging()
+        
+        cola_baja = self.colas['B']
+        if self.operaciones_counter % 5 == 0 and cola_baja:
+            self.forzados += 1
+            tarea = cola_baja.popleft()
+            if self.verbose:
+                print(f"[ANTI-STARVATION] [{timestamp()}] Forzando procesamiento de tarea B: {tarea.id}")
+            return tarea
+        return (self.colas['A'] or self.colas['M'] or cola_baja).popleft()
+    
+    def size(self):
+        return len(self.colas['A']) + len(self.colas['M']) + len(self.colas['B'])
+    
+    def get_estado(self):
+        return {clase: len(cola) for clase, cola in self.colas.items()}
+
+class PoliticaDRR(PoliticaPlanificacion):
+    """
+    Deficit Round Robin: reparto ponderado del tiempo de procesamiento entre clases
+    
+    - Las clases con tareas forman una ronda; al llegar su turno, la clase suma
+      quantum * pesos[clase] a su déficit y atiende tareas mientras el costo de la
+      cabeza (por defecto tarea.tiempo_procesamiento) no supere el déficit
+    - Cada clase con tareas pendientes recibe la fracción pesos[clase] / suma(pesos)
+      del tiempo de procesamiento, sin promociones ni modificar tarea.prioridad
+    - Espera acotada: la cabeza de una clase espera a lo sumo una ronda, es decir
+      cota_ronda(clase) unidades de costo atendidas de las otras clases
+    - O(1) por get(): con quantum >= costo máximo cada turno atiende al menos una
+      tarea, así que siguiente() avanza como mucho una vez por clase
+    """
+    def __init__(self, pesos=None, quantum=0.3, costo=None):
+        self.pesos = pesos or {'A': 4, 'M': 2, 'B': 1}
+        if any(peso <= 0 for peso in self.pesos.values()):
+            raise ValueError("Los pesos de PoliticaDRR deben ser positivos")
+        self.quantum = quantum  # Costo máximo de una tarea (300 ms de una tarea B)
+        self.costo = costo or (lambda tarea: tarea.tiempo_procesamiento)
+        self.colas = {clase: deque() for clase in self.pesos}
+        self.deficit = {clase: 0.0 for clase in self.pesos}
+        self.activas = deque()  # Ronda de clases con tareas; la primera tiene el turno
+        self.total = 0
+    
+    def cota_ronda(self, clase):
+        """Costo máximo atendido de otras clases antes de que la cabeza de clase sea atendida"""
+        return sum(self.quantum * peso + self.quantum for otra, peso in self.pesos.items() if otra != clase)
+    
+    def encolar(self, tarea):
+        clase = tarea.prioridad
+        if not self.colas[clase]:
+            self.activas.append(clase)
+            if len(self.activas) == 1:
+                self.deficit[clase] += self.quantum * self.pesos[clase]
+        self.colas[clase].append(tarea)
+        self.total += 1
+    
+    def siguiente(self):
+        while True:
+            clase = self.activas[0]
+            cola = self.colas[clase]
+            costo = self.costo(cola[0])
+            if costo <= self.deficit[clase]:
+                self.deficit[clase] -= costo
+                tarea = cola.popleft()
+                self.total -= 1
+                if not cola:
+                    # Una clase que se vacía no acumula déficit para después
+                    self.deficit[clase] = 0.0
+                    self.activas.popleft()
+                    self._iniciar_turno()
+                return tarea
+            # Déficit agotado: el turno pasa a la siguiente clase de la ronda
+            self.activas.rotate(-1)
+            self._iniciar_turno()
+    
+    def _iniciar_turno(self):
+        if self.activas:
+            clase = self.activas[0]
+            self.deficit[clase] += self.quantum * self.pesos[clase]
+    
+    def size(self):
+        return self.total
+    
+    def get_estado(self):
+        return {clase: len(cola) for clase, cola in self.colas.items()}
+
+class PoliticaEDF(PoliticaPlanificacion):
+    """
+    Earliest Deadline First con control de admisión opcional
+    
+    - Se atiende primero la tarea con deadline más cercano (heap, O(log n));
+      las tareas sin deadline van después, en orden de llegada
+    - Admisión: al encolar una tarea con deadline se simula el orden EDF de la cola
+      con la tarea incluida; cada tarea termina en ahora + (trabajo restante de las
+      tareas en servicio + trabajo con deadline <= el suyo) / num_consumidores. Si la nueva tarea o alguna ya admitida con deadline
+      posterior dejaría de cumplirlo, admision='rechazar' lanza TareaRechazada y
+      admision='degradar' la acepta sin deadline (tarea.degradada = True).
+      La simulación ordena la cola: O(n log n) por put() con admisión.
+    """
+    SIN_DEADLINE = float('inf')
+    
+    def __init__(self, num_consumidores=3, admision=None, costo=None, reloj=time.time):
+        if admision not in (None, 'rechazar', 'degradar'):
+            raise ValueError(f"Admisión desconocida: {admision}")
+        self.num_consumidores = num_consumidores
+        self.admision = admision
+        self.costo = costo or (lambda tarea: tarea.tiempo_procesamiento)
+        self.reloj = reloj
+        self.heap = []
+        self.secuencia = itertools.count()
+        self.por_prioridad = {'A': 0, 'M': 0, 'B': 0}
+        # (inicio, costo) de las últimas entregas: aproximan las tareas en servicio
+        self.en_servicio = deque(maxlen=num_consumidores)
+        self.rechazadas = 0
+        self.degradadas = 0
+    
+    def fin_estimado(self, deadline, costo):
+        """
+        Fin estimado de una tarea nueva (deadline, costo) y el mayor retraso que causaría,
+        incluida ella misma, entre las tareas con deadline de la cola (<= 0: todas cumplen)
+        """
+        ahora = self.reloj()
+        trabajo = sum(max(0.0, inicio + c - ahora) for inicio, c in self.en_servicio)
+        fin_nueva = None
+        retraso_maximo = float('-inf')
+        pendientes = sorted((d, self.costo(t)) for d, _, t in self.heap if d != self.SIN_DEADLINE)
+        for d, c in pendientes:
+            if fin_nueva is None and deadline < d:
+                trabajo += costo
+                fin_nueva = ahora + trabajo / self.num_consumidores
+                retraso_maximo = max(retraso_maximo, fin_nueva - deadline)
+            trabajo += c
+            if fin_nueva is not None:
+                retraso_maximo = max(retraso_maximo, ahora + trabajo / self.num_consumidores - d)
+        if fin_nueva is None:
+            fin_nueva = ahora + (trabajo + costo) / self.num_consumidores
+            retraso_maximo = max(retraso_maximo, fin_nueva - deadline)
+        return fin_nueva, retraso_maximo
+    
+    def encolar(self, tarea):
+        deadline = self.SIN_DEADLINE if tarea.deadline is None else tarea.deadline
+        if self.admision and deadline != self.SIN_DEADLINE:
+            fin, retraso = self.fin_estimado(deadline, self.costo(tarea))
+            if retraso > 0:
+                if self.admision == 'rechazar':
+                    self.rechazadas += 1
+                    raise TareaRechazada(tarea, fin)
+                tarea.degradada = True
+                self.degradadas += 1
+                deadline = self.SIN_DEADLINE
+        heapq.heappush(self.heap, (deadline, next(self.secuencia), tarea))
+        self.por_prioridad[tarea.prioridad] += 1
+    
+    def siguiente(self):
+        _, _, tarea = heapq.heappop(self.heap)
+        self.por_prioridad[tarea.prioridad] -= 1
+        self.en_servicio.append((self.reloj(), self.costo(tarea)))
+        return tarea
+    
+    def size(self):
+        return len(self.heap)
+    
+    def get_estado(self):
+        return dict(self.por_prioridad)
+
+class ColaPlanificada:
+    """
+    Cola acotada con política de planificación intercambiable
+    
+    Misma interfaz que ColaConAging (put, get, size, get_estado); el orden de
+    atención lo decide la política recibida (PoliticaDRR, PoliticaAging, PoliticaEDF,
+    PoliticaPrioridadEstricta o cualquier subclase de PoliticaPlanificacion).
+    put() propaga TareaRechazada si la política no admite la tarea.
+    """
+    def __init__(self, politica=None, capacidad_maxima=20):
+        self.politica = politica or PoliticaDRR()
+        self.capacidad_maxima = capacidad_maxima
+        self.lock = threading.Lock()
+        self.not_full = threading.Condition(self.lock)
+        self.not_empty = threading.Condition(self.lock)
+    
+    def put(self, tarea):
+        with self.lock:
+            while self.politica.size() >= self.capacidad_maxima:
+                self.not_full.wait()
+            try:
+                self.politica.encolar(tarea)
+            except TareaRechazada:
+                # El lugar libre sigue disponible para otro productor en espera
+                self.not_full.notify()
+                raise
+            self.not_empty.notify()
+    
+    def get(self):
+        with self.lock:
+            while self.politica.size() == 0:
+                self.not_empty.wait()
+            tarea = self.politica.siguiente()
+            self.not_full.notify()
+            return tarea
+    
+    def size(self):
+        return self.politica.size()
+    
+    def get_estado(self):
+        """Retorna el estado actual de las colas"""
+        with self.lock:
+            estado = self.politica.get_estado()
+        estado['total'] = estado['A'] + estado['M'] + estado['B']
+        return estado
+
 def timestamp():
     """Genera timestamp formateado"""
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
@@ -186,12 +837,13 @@ class Producer(threading.Thread):
         print(f"[{self.name}] [{timestamp()}] Finalizado - {len(self.secuencia_tareas)} tareas producidas")
 
 class Consumer(threading.Thread):
-    def __init__(self, cola, consumer_id, stats, tiempo_limite=10):
+    def __init__(self, cola, consumer_id, stats, tiempo_limite=10, metricas=None):
         super().__init__(name=f"Consumer-{consumer_id}")
         self.cola = cola
         self.consumer_id = consumer_id
         self.stats = stats
         self.tiempo_limite = tiempo_limite
+        self.metricas = metricas
         self.running = True
         
     def run(self):
@@ -200,9 +852,11 @@ class Consumer(threading.Thread):
         
         while self.running and (time.time() - tiempo_inicio) < self.tiempo_limite:
             try:
-                tarea = self.cola.get()
+                # Timeout corto para revisar running y el tiempo límite con la cola vacía
+                tarea = self.cola.get(timeout=0.5)
                 if tarea is None:
                     continue
+                inicio_servicio = time.perf_counter()
                     
                 tiempo_espera = time.time() - tarea.tiempo_creacion
                 print(f"[{self.name}] [{timestamp()}] Procesando {tarea} (espera: {tiempo_espera:.3f}s)")
@@ -214,6 +868,8 @@ class Consumer(threading.Thread):
                 
                 # Simular procesamiento
                 time.sleep(tarea.tiempo_procesamiento)
+                if self.metricas is not None:
+                    self.metricas.registrar_servicio(tarea.prioridad_original, time.perf_counter() - inicio_servicio)
                 
                 # Actualizar estadísticas
                 with self.stats['lock']:
@@ -231,12 +887,37 @@ class Consumer(threading.Thread):
         self.running = False
         print(f"[{self.name}] [{timestamp()}] Finalizado por timeout ({self.tiempo_limite}s)")
 
-def main():
+# Secuencia específica de 30 tareas según el documento
+SECUENCIAS = [
+    ['B','B','M','B','B','B','A','M','B','B'],      # Tareas 1-10
+    ['M','B','B','B','A','B','M','B','B','B'],      # Tareas 11-20  
+    ['B','B','B','M','A','B','B','M','B','B']       # Tareas 21-30
+]
+
+def generar_secuencias(rng=random):
+    """Secuencias de los 5 productores de main(): las 3 del documento y 2 aleatorias"""
+    secuencias = [list(secuencia) for secuencia in SECUENCIAS]
+    # Los últimos 2 generan pocas tareas adicionales para ver progreso completo
+    for _ in range(2):
+        secuencia = []
+        for _ in range(3):  # Solo 3 tareas por productor adicional (total ~36 tareas)
+            rand = rng.random()
+            if rand < 0.6:
+                secuencia.append('B')
+            elif rand < 0.9:  
+                secuencia.append('M')
+            else:
+                secuencia.append('A')
+        secuencias.append(secuencia)
+    return secuencias
+
+def main(ruta_metricas=None, ruta_profundidad=None):
     print("=== SIMULACION SIN STARVATION - SISTEMA DE PRIORIDADES DE TAREAS ===")
     print("VERSIÓN SIN STARVATION: Con mecanismo de aging y procesamiento forzado")
     
-    # Crear cola con mecanismo anti-starvation
-    cola = ColaConAging(capacidad_maxima=20)
+    # Crear cola con mecanismo anti-starvation, instrumentada con histogramas por clase
+    metricas = MetricasCola(intervalo_muestreo=0.1)
+    cola = ColaConAging(capacidad_maxima=20, metricas=metricas)
     
     # Estadísticas compartidas
     stats = {
@@ -258,13 +939,6 @@ def main():
         "Sistema iniciado con mecanismo anti-starvation (aging + procesamiento forzado)"
     )
     
-    # Secuencia específica de 30 tareas según el documento
-    secuencias = [
-        ['B','B','M','B','B','B','A','M','B','B'],      # Tareas 1-10
-        ['M','B','B','B','A','B','M','B','B','B'],      # Tareas 11-20  
-        ['B','B','B','M','A','B','B','M','B','B']       # Tareas 21-30
-    ]
-    
     print(f"\n=== MECANISMO ANTI-STARVATION ===")
     print("ESTRATEGIAS IMPLEMENTADAS:")
     print("1. AGING: Tareas B se promueven a M después de 3 ciclos sin procesamiento")
@@ -272,23 +946,11 @@ def main():
     print("3. MONITOREO: Se rastrea el tiempo de espera para garantizar progreso")
     
     tiempo_inicio = time.time()
+    metricas.iniciar_muestreo(cola)
     
     # Crear y iniciar productores
     producers = []
-    for i in range(5):
-        if i < 3:  # Los primeros 3 productores usan las secuencias específicas
-            secuencia = secuencias[i]
-        else:  # Los últimos 2 generan pocas tareas adicionales para ver progreso completo
-            secuencia = []
-            for _ in range(3):  # Solo 3 tareas por productor adicional (total ~36 tareas)
-                rand = random.random()
-                if rand < 0.6:
-                    secuencia.append('B')
-                elif rand < 0.9:  
-                    secuencia.append('M')
-                else:
-                    secuencia.append('A')
-        
+    for i, secuencia in enumerate(generar_secuencias()):
         producer = Producer(cola, i+1, secuencia)
         producers.append(producer)
         producer.start()
@@ -296,31 +958,30 @@ def main():
     # Crear y iniciar consumidores
     consumers = []
     for i in range(3):
-        consumer = Consumer(cola, i+1, stats, tiempo_limite=10)
+        consumer = Consumer(cola, i+1, stats, tiempo_limite=10, metricas=metricas)
         consumers.append(consumer)
         consumer.start()
     
-    # Monitoreo temporal cada 2 segundos hasta 10 segundos
+    # Monitoreo temporal cada 2 segundos hasta 10 segundos: una línea JSON por punto
+    # (estado de la cola, tareas procesadas y percentiles de espera por clase)
     tiempos_monitoreo = [2, 4, 6, 8, 10]
+    monitoreo = []
     
     for tiempo_objetivo in tiempos_monitoreo:
         # Esperar hasta el tiempo objetivo
         while (time.time() - tiempo_inicio) < tiempo_objetivo:
             time.sleep(0.1)
         
-        tiempo_actual = int(time.time() - tiempo_inicio)
-        extra_info = f"Monitoreo con anti-starvation activo - Progreso gradual"
-        
-        if tiempo_objetivo == 10:
-            extra_info += " - *** VERIFICACIÓN FINAL: MÁXIMO PROGRESO EN 10s ***"
-        
-        mostrar_estado_screenshot(
-            f"MONITOREO A LOS {tiempo_objetivo} SEGUNDOS",
-            cola,
-            stats,
-            tiempo_actual,
-            extra_info
-        )
+        with stats['lock']:
+            procesadas = {clase: stats[f"{clase}_procesadas"] for clase in ('A', 'M', 'B')}
+        punto = {
+            'tiempo': round(time.time() - tiempo_inicio, 3),
+            'cola': cola.get_estado(),
+            'procesadas': procesadas,
+            'espera_p99_ms': {clase: r.get('p99_ms') for clase, r in metricas.percentiles()['espera'].items()}
+        }
+        monitoreo.append(punto)
+        print(f"[MONITOREO] [{timestamp()}] {json.dumps(punto)}")
     
     # Finalizar productores
     for producer in producers:
@@ -337,6 +998,13 @@ def main():
         consumer.running = False
         consumer.join()
     
+    metricas.detener_muestreo()
+    # Los archivos solo se escriben si se pidieron (--metricas / --profundidad)
+    if ruta_metricas:
+        metricas.guardar_json(ruta_metricas, {'monitoreo': monitoreo})
+    if ruta_profundidad:
+        metricas.guardar_csv_profundidad(ruta_profundidad)
+    
     # Resultados finales
     tiempo_total = time.time() - tiempo_inicio
     estado_final = cola.get_estado()
@@ -364,6 +1032,17 @@ def main():
     else:
         print("Tiempo de espera máximo para tareas B: No aplicable (ninguna procesada)")
     
+    print(f"\n=== LATENCIAS POR CLASE ORIGINAL (HISTOGRAMAS) ===")
+    print("| Clase | Medida   | Tareas | p50 (ms) | p90 (ms) | p99 (ms) | p999 (ms) | Máx (ms) |")
+    print("|-------|----------|--------|----------|----------|----------|-----------|----------|")
+    for medida, por_clase in metricas.percentiles().items():
+        for clase, r in por_clase.items():
+            if r['cantidad']:
+                print(f"| {clase:5} | {medida:8} | {r['cantidad']:6} | {r['p50_ms']:8.1f} | {r['p90_ms']:8.1f} | "
+                      f"{r['p99_ms']:8.1f} | {r['p999_ms']:9.1f} | {r['max_ms']:8.1f} |")
+    if ruta_metricas or ruta_profundidad:
+        print(f"Métricas completas: {ruta_metricas or '-'} | Profundidad de la cola: {ruta_profundidad or '-'}")
+    
     print(f"\n=== ANÁLISIS DEL MECANISMO ANTI-STARVATION ===")
     print("PSEUDOCÓDIGO DEL ALGORITMO:")
     print("```")
@@ -403,4 +1082,8 @@ def main():
         print("Nota: Puede requerir más tiempo para completar todas las tareas")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--metricas', help="archivo JSON donde guardar las métricas completas (ej. metricas_starvation.json)")
+    parser.add_argument('--profundidad', help="archivo CSV donde guardar la profundidad de la cola (ej. profundidad_cola_starvation.csv)")
+    opciones = parser.parse_args()
+    main(opciones.metricas, opciones.profundidad)
\ No newline at end of file